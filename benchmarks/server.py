@@ -0,0 +1,58 @@
+from collections.abc import Iterator
+
+from tactill.query import Document
+from tactill.testing import FakeTactillServer, build_document
+
+NOW = "2026-01-01T00:00:00.000Z"
+
+
+def build_articles(count: int) -> Iterator[Document]:
+    for index in range(count):
+        yield build_document(
+            index,
+            NOW,
+            category_id=f"{index % 30:024x}",
+            taxes=[f"{index % 4:024x}"],
+            name=f"ARTICLE {index}",
+            icon_text="ART",
+            color="#57DB47",
+            barcode=f"{index:013d}",
+            in_stock=True,
+            reference=f"REF-{index}",
+            full_price=9.9,
+            stock_quantity=index % 50,
+        )
+
+
+def build_movements(count: int, articles: int, lines: int = 5) -> Iterator[Document]:
+    for index in range(count):
+        yield build_document(
+            index,
+            NOW,
+            number=index,
+            type="in" if index % 3 else "out",
+            state="done",
+            motive="",
+            movements=[
+                {
+                    "article_id": f"{(index * lines + line) % articles:024x}",
+                    "article_name": f"ARTICLE {(index * lines + line) % articles}",
+                    "category_name": f"CATEGORY {line}",
+                    "state": "done",
+                    "units": line + 1,
+                    "done_on": NOW,
+                }
+                for line in range(lines)
+            ],
+        )
+
+
+def build_server(articles: int, movements: int) -> FakeTactillServer:
+    return FakeTactillServer(
+        {
+            "articles": list(build_articles(articles)),
+            "categories": [],
+            "taxes": [],
+            "movements": list(build_movements(movements, articles)),
+        }
+    )
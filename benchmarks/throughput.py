@@ -0,0 +1,243 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from functools import partial
+
+from benchmarks.server import build_server
+from tactill import (
+    ArticleCreate,
+    AsyncTactillClient,
+    Keyset,
+    TactillClient,
+    TactillColor,
+)
+from tactill.testing import FakeTactillServer
+
+type Call = Callable[[], int]
+type AsyncCall = Callable[[], Awaitable[int]]
+
+PAGE_SIZE = 1000
+GET_COUNT = 1000
+CREATE_COUNT = 200
+ARTICLE_CREATE = ArticleCreate(
+    category_id=f"{0:024x}",
+    taxes=[f"{0:024x}"],
+    name="BENCHMARK",
+    icon_text="BEN",
+    color=TactillColor.GREEN,
+    full_price=9.9,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    scenario: str
+    client: str
+    calls: int
+    requests: int
+    entities: int
+    elapsed: float
+    requests_per_second: float
+    entities_per_second: float
+    p50: float
+    p99: float
+    peak_memory: int
+
+
+def build_result(
+    scenario: str,
+    client: str,
+    durations: list[float],
+    requests: int,
+    entities: int,
+    elapsed: float,
+    peak_memory: int,
+) -> Result:
+    quantiles = statistics.quantiles(durations, n=100) if len(durations) > 1 else []
+    return Result(
+        scenario=scenario,
+        client=client,
+        calls=len(durations),
+        requests=requests,
+        entities=entities,
+        elapsed=elapsed,
+        requests_per_second=requests / elapsed,
+        entities_per_second=entities / elapsed,
+        p50=quantiles[49] if quantiles else durations[0],
+        p99=quantiles[98] if quantiles else durations[0],
+        peak_memory=peak_memory,
+    )
+
+
+def run_sync(
+    scenario: str,
+    server: FakeTactillServer,
+    build_calls: Callable[[TactillClient], Sequence[Call]],
+) -> Result:
+    # a first run for the timings, a second one for the memory
+    client = TactillClient(api_key="key", http_client=server.build_client())
+    client.account  # noqa: B018 (resolved before measuring)
+    calls = build_calls(client)
+    requests = len(server.requests)
+    durations: list[float] = []
+    entities = 0
+    start = time.perf_counter()
+    for call in calls:
+        call_start = time.perf_counter()
+        entities += call()
+        durations.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    requests = len(server.requests) - requests
+
+    tracemalloc.start()
+    for call in build_calls(client):
+        call()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return build_result(
+        scenario, "sync", durations, requests, entities, elapsed, peak_memory
+    )
+
+
+async def run_async(
+    scenario: str,
+    server: FakeTactillServer,
+    build_calls: Callable[[AsyncTactillClient], Sequence[AsyncCall]],
+) -> Result:
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=server.build_async_client(),
+    )
+    durations: list[float] = []
+
+    async def timed(call: AsyncCall) -> int:
+        call_start = time.perf_counter()
+        count = await call()
+        durations.append(time.perf_counter() - call_start)
+        return count
+
+    calls = build_calls(client)
+    requests = len(server.requests)
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(timed(call) for call in calls))
+    elapsed = time.perf_counter() - start
+    requests = len(server.requests) - requests
+
+    tracemalloc.start()
+    await asyncio.gather(*(call() for call in build_calls(client)))
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return build_result(
+        scenario, "async", durations, requests, sum(counts), elapsed, peak_memory
+    )
+
+
+def sync_scenarios(
+    articles: int,
+) -> dict[str, Callable[[TactillClient], Sequence[Call]]]:
+    pages = range(0, articles, PAGE_SIZE)
+    ids = [f"{index * articles // GET_COUNT:024x}" for index in range(GET_COUNT)]
+
+    def get_all(client: TactillClient, skip: int) -> int:
+        return len(client.articles.get_all(limit=PAGE_SIZE, skip=skip))
+
+    def get_records(client: TactillClient, skip: int) -> int:
+        return len(client.articles.get_records(limit=PAGE_SIZE, skip=skip))
+
+    def get(client: TactillClient, article_id: str) -> int:
+        return bool(client.articles.get(article_id))
+
+    def create(client: TactillClient) -> int:
+        return bool(client.articles.create(ARTICLE_CREATE))
+
+    def iter_all(client: TactillClient, keyset: Keyset | None) -> int:
+        iterator = client.articles.iter_all(page_size=PAGE_SIZE, keyset=keyset)
+        return sum(1 for _ in iterator)
+
+    def iter_movements(client: TactillClient) -> int:
+        iterator = client.movements.iter_records(page_size=PAGE_SIZE, keyset=Keyset.ID)
+        return sum(1 for _ in iterator)
+
+    return {
+        "get_all": lambda client: [partial(get_all, client, skip) for skip in pages],
+        "get_records": lambda client: [
+            partial(get_records, client, skip) for skip in pages
+        ],
+        "get": lambda client: [partial(get, client, id_) for id_ in ids],
+        "create": lambda client: [partial(create, client)] * CREATE_COUNT,
+        "iter_all_offset": lambda client: [partial(iter_all, client, None)],
+        "iter_all_keyset": lambda client: [partial(iter_all, client, Keyset.ID)],
+        "movements_iter_records": lambda client: [partial(iter_movements, client)],
+    }
+
+
+def async_scenarios(
+    articles: int,
+) -> dict[str, Callable[[AsyncTactillClient], Sequence[AsyncCall]]]:
+    pages = range(0, articles, PAGE_SIZE)
+    ids = [f"{index * articles // GET_COUNT:024x}" for index in range(GET_COUNT)]
+
+    async def get_all(client: AsyncTactillClient, skip: int) -> int:
+        return len(await client.articles.get_all(limit=PAGE_SIZE, skip=skip))
+
+    async def get(client: AsyncTactillClient, article_id: str) -> int:
+        return bool(await client.articles.get(article_id))
+
+    async def create(client: AsyncTactillClient) -> int:
+        return bool(await client.articles.create(ARTICLE_CREATE))
+
+    async def fetch_all(client: AsyncTactillClient) -> int:
+        return len(await client.articles.fetch_all(page_size=PAGE_SIZE))
+
+    async def iter_movements(client: AsyncTactillClient) -> int:
+        iterator = client.movements.aiter_records(page_size=PAGE_SIZE, keyset=Keyset.ID)
+        return sum([1 async for _ in iterator])
+
+    return {
+        "get_all": lambda client: [partial(get_all, client, skip) for skip in pages],
+        "get": lambda client: [partial(get, client, id_) for id_ in ids],
+        "create": lambda client: [partial(create, client)] * CREATE_COUNT,
+        "fetch_all": lambda client: [partial(fetch_all, client)],
+        "movements_aiter_records": lambda client: [partial(iter_movements, client)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Client throughput benchmarks")
+    parser.add_argument("--articles", type=int, default=10_000)
+    parser.add_argument("--movements", type=int, default=10_000)
+    parser.add_argument("--output", help="JSON file, printed when omitted")
+    args = parser.parse_args()
+
+    results: list[Result] = []
+    for scenario, build_calls in sync_scenarios(args.articles).items():
+        server = build_server(args.articles, args.movements)
+        results.append(run_sync(scenario, server, build_calls))
+    for scenario, build_async_calls in async_scenarios(args.articles).items():
+        server = build_server(args.articles, args.movements)
+        results.append(asyncio.run(run_async(scenario, server, build_async_calls)))
+
+    output = json.dumps(
+        {
+            "articles": args.articles,
+            "movements": args.movements,
+            "results": [asdict(result) for result in results],
+        },
+        indent=2,
+    )
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import json
+import timeit
+
+from pydantic import TypeAdapter
+
+from tactill import Article, ArticleRecord
+from tactill.mixin import ClientMixin
+
+PAGE_SIZE = 1000
+NUMBER = 20
+
+
+def build_page(size: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "_id": f"{index:024x}",
+                "deprecated": False,
+                "created_at": "2026-01-01T00:00:00.000Z",
+                "updated_at": "2026-01-01T00:00:00.000Z",
+                "category_id": f"{index % 30:024x}",
+                "taxes": [f"{index % 4:024x}"],
+                "name": f"Article {index}",
+                "icon_text": "ART",
+                "color": "#57DB47",
+                "barcode": f"{index:013d}",
+                "in_stock": True,
+                "reference": f"REF-{index}",
+                "full_price": 9.9,
+                "stock_quantity": index % 50,
+            }
+            for index in range(size)
+        ]
+    ).encode()
+
+
+def decode_then_validate(content: bytes) -> list[Article]:
+    return TypeAdapter(list[Article]).validate_python(json.loads(content))
+
+
+def validate_json(content: bytes) -> list[Article]:
+    return ClientMixin._handle_validation(content, response_model=list[Article])
+
+
+def records(content: bytes) -> list[ArticleRecord]:
+    return ClientMixin._handle_records(content, record_type=ArticleRecord)
+
+
+def main() -> None:
+    content = build_page(PAGE_SIZE)
+    for function in (decode_then_validate, validate_json, records):
+        elapsed = timeit.timeit(lambda f=function: f(content), number=NUMBER)
+        print(f"{function.__name__:>22}: {elapsed / NUMBER * 1000:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
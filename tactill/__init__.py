@@ -1,6 +1,14 @@
 from .asynchronous.base import AsyncTactillClient as AsyncTactillClient
+from .asynchronous.feed import AsyncMovementFeed as AsyncMovementFeed
+from .asynchronous.limiter import AdaptiveLimiter as AdaptiveLimiter
+from .asynchronous.limiter import Priority as Priority
+from .asynchronous.limiter import request_priority as request_priority
+from .asynchronous.mirror import AsyncCatalogMirror as AsyncCatalogMirror
+from .bulk import BulkResult as BulkResult
+from .cache import ResponseCache as ResponseCache
 from .entities.article import Article as Article
 from .entities.article import ArticleCreate as ArticleCreate
+from .entities.article import ArticleRecord as ArticleRecord
 from .entities.article import ArticleUpdate as ArticleUpdate
 from .entities.base import IconText as IconText
 from .entities.base import TactillColor as TactillColor
@@ -8,8 +16,28 @@ from .entities.base import TactillName as TactillName
 from .entities.base import TactillUUID as TactillUUID
 from .entities.category import Category as Category
 from .entities.category import CategoryCreate as CategoryCreate
+from .entities.category import CategoryRecord as CategoryRecord
 from .entities.category import CategoryUpdate as CategoryUpdate
+from .entities.movement import MovementRecord as MovementRecord
 from .entities.tax import Tax as Tax
+from .entities.tax import TaxRecord as TaxRecord
 from .filters import FilterEntity as FilterEntity
 from .filters import FilterOperator as FilterOperator
+from .index import CatalogIndex as CatalogIndex
+from .instrumentation import DecodeEvent as DecodeEvent
+from .instrumentation import Observer as Observer
+from .instrumentation import RequestEvent as RequestEvent
+from .instrumentation import SlowCallLogger as SlowCallLogger
+from .ledger import StockLedger as StockLedger
+from .lookup import LookupResult as LookupResult
+from .metrics import MetricsRegistry as MetricsRegistry
+from .pagination import Keyset as Keyset
+from .ratelimit import RateLimits as RateLimits
+from .retry import RetryPolicy as RetryPolicy
+from .rollup import Granularity as Granularity
+from .rollup import MovementRollups as MovementRollups
+from .rollup import RollupKey as RollupKey
+from .store import CatalogStore as CatalogStore
 from .synchronous.base import TactillClient as TactillClient
+from .synchronous.feed import MovementFeed as MovementFeed
+from .synchronous.mirror import CatalogMirror as CatalogMirror
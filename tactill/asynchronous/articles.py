@@ -1,10 +1,22 @@
+import asyncio
+import itertools
 import typing
+from collections.abc import AsyncIterator, Sequence
 
-from tactill.entities.article import Article, ArticleCreate, ArticleUpdate
+from tactill.asynchronous.loader import BatchLoader
+from tactill.bulk import BulkResult, arun_bulk
+from tactill.entities.article import (
+    Article,
+    ArticleCreate,
+    ArticleRecord,
+    ArticleUpdate,
+)
 from tactill.entities.base import TactillUUID
 from tactill.entities.response import TactillResponse
 from tactill.filters import FilterEntity, FilterOperator
+from tactill.lookup import LookupResult, build_id_filters, chunk_ids, collect
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, afetch_all, apaginate
 
 if typing.TYPE_CHECKING:
     from tactill.asynchronous.base import AsyncTactillClient
@@ -14,6 +26,11 @@ class AsyncArticlesResource(ClientMixin):
     def __init__(self, client: AsyncTactillClient) -> None:
         self.client = client
         self.base_url = f"{self.BASE_URL}/catalog/articles"
+        self.loader = (
+            BatchLoader(self.get_many, self._get, window=client.batch_window)
+            if client.batch_window is not None
+            else None
+        )
 
     async def get_all(
         self,
@@ -23,16 +40,100 @@ class AsyncArticlesResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Article]:
-        params = self._build_params(
+        response = await self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"node_id": self.client.account.node_id},
         )
-        response = await self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Article])
+        return self.client.validate(response, response_model=list[Article])
+
+    async def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[ArticleRecord]:
+        response = await self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate_records(response, record_type=ArticleRecord)
+
+    def aiter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[Article]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def aiter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[ArticleRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    async def fetch_all(
+        self,
+        concurrency: int = 10,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[Article]:
+        return await afetch_all(
+            lambda skip: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            concurrency=concurrency,
+            filters=filters,
+        )
 
     async def get_by_category(
         self,
@@ -60,14 +161,33 @@ class AsyncArticlesResource(ClientMixin):
         return articles
 
     async def get(self, article_id: TactillUUID) -> Article:
-        response = await self.client.request("GET", f"{self.base_url}/{article_id}")
-        return self._handle_validation(response, response_model=Article)
+        if self.loader is not None:
+            return await self.loader.load(article_id)
+        return await self._get(article_id)
+
+    async def get_many(
+        self,
+        ids: Sequence[TactillUUID],
+        deprecated: bool = False,
+    ) -> LookupResult[Article]:
+        pages = await asyncio.gather(
+            *(
+                self.get_all(
+                    limit=len(chunk),
+                    filters=build_id_filters(chunk),
+                    deprecated=deprecated,
+                )
+                for chunk in chunk_ids(ids)
+            )
+        )
+        return collect(ids, itertools.chain.from_iterable(pages))
 
     async def create(self, data: ArticleCreate) -> Article:
+        account = await self.client.get_account()
         json = data.model_dump(exclude_none=True)
-        json["node_id"] = self.client.account.node_id
+        json["node_id"] = account.node_id
         response = await self.client.request("POST", self.base_url, json=json)
-        return self._handle_validation(response, response_model=Article)
+        return self.client.validate(response, response_model=Article)
 
     async def update(
         self,
@@ -80,4 +200,36 @@ class AsyncArticlesResource(ClientMixin):
             f"{self.base_url}/{article_id}",
             json=json,
         )
-        return self._handle_validation(response, response_model=TactillResponse)
+        return self.client.validate(response, response_model=TactillResponse)
+
+    async def bulk_create(self, data: Sequence[ArticleCreate]) -> BulkResult[Article]:
+        return await arun_bulk(self.create, data)
+
+    async def bulk_update(
+        self,
+        data: Sequence[tuple[TactillUUID, ArticleUpdate]],
+    ) -> BulkResult[TactillResponse]:
+        return await arun_bulk(lambda item: self.update(*item), data)
+
+    async def _get(self, article_id: str) -> Article:
+        response = await self.client.request("GET", f"{self.base_url}/{article_id}")
+        return self.client.validate(response, response_model=Article)
+
+    async def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        account = await self.client.get_account()
+        return await self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"node_id": account.node_id},
+        )
@@ -1,13 +1,31 @@
 import asyncio
-from typing import cast
+import time
+from collections.abc import MutableMapping, Sequence
+from typing import Self
 
 import httpx
 
 from tactill.asynchronous.articles import AsyncArticlesResource
 from tactill.asynchronous.categories import AsyncCategoriesResource
+from tactill.asynchronous.limiter import AdaptiveLimiter
 from tactill.asynchronous.movements import AsyncMovementsResource
 from tactill.asynchronous.taxes import AsyncTaxesResource
+from tactill.cache import ResponseCache
+from tactill.entities.account import Account
+from tactill.exceptions import TactillError
+from tactill.filters import FilterEntity
+from tactill.instrumentation import Observer, RequestTimings
 from tactill.mixin import ClientMixin
+from tactill.query import (
+    MAX_PAGE_SIZE,
+    SPLIT_QUERY_SKIP,
+    Document,
+    SplitQuery,
+    merge_pages,
+    split_query,
+)
+from tactill.ratelimit import RateLimits
+from tactill.retry import NO_RETRY, RETRY_STATUS_CODES, RetryPolicy
 from tactill.types import JsonValue, QueryParams
 
 
@@ -17,17 +35,102 @@ class AsyncTactillClient(ClientMixin):
         api_key: str,
         http_client: httpx.AsyncClient,
         max_concurrency: int = 100,
+        limiter: AdaptiveLimiter | None = None,
+        max_write_concurrency: int = 10,
+        write_limiter: AdaptiveLimiter | None = None,
+        account_cache: MutableMapping[str, Account] | None = None,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limits: RateLimits | None = None,
+        observers: Sequence[Observer] = (),
+        batch_window: float | None = None,
     ) -> None:
         self._http_client = http_client
-        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.cache = cache
+        self.retry = retry or NO_RETRY
+        self.observers = list(observers)
+        # the number of requests in flight adapts to the API latency and errors,
+        # writes have their own pool so that they never starve the reads
+        self.limiter = limiter or AdaptiveLimiter(max_limit=max_concurrency)
+        self.write_limiter = write_limiter or AdaptiveLimiter(
+            max_limit=max_write_concurrency
+        )
+        self._account_cache = account_cache
+        self._account_key = self._get_account_key(api_key)
+        self._account: Account | None = None
+        self._account_lock = asyncio.Lock()
         self.headers = {"x-api-key": api_key}
-        self.account = self._get_account(headers=self.headers)
+        self.rate_limiter = (
+            rate_limits.get(self._account_key) if rate_limits is not None else None
+        )
+        # when set, concurrent 'get' calls are batched into 'get_many' calls
+        self.batch_window = batch_window
 
         self.articles = AsyncArticlesResource(self)
         self.categories = AsyncCategoriesResource(self)
         self.taxes = AsyncTaxesResource(self)
         self.movements = AsyncMovementsResource(self)
 
+    @classmethod
+    async def create(
+        cls,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        max_concurrency: int = 100,
+        limiter: AdaptiveLimiter | None = None,
+        max_write_concurrency: int = 10,
+        write_limiter: AdaptiveLimiter | None = None,
+        account_cache: MutableMapping[str, Account] | None = None,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limits: RateLimits | None = None,
+        observers: Sequence[Observer] = (),
+        batch_window: float | None = None,
+    ) -> Self:
+        client = cls(
+            api_key=api_key,
+            http_client=http_client,
+            max_concurrency=max_concurrency,
+            limiter=limiter,
+            max_write_concurrency=max_write_concurrency,
+            write_limiter=write_limiter,
+            account_cache=account_cache,
+            cache=cache,
+            retry=retry,
+            rate_limits=rate_limits,
+            observers=observers,
+            batch_window=batch_window,
+        )
+        await client.get_account()
+        return client
+
+    @property
+    def account(self) -> Account:
+        if self._account is None:
+            raise TactillError(
+                "Account is not resolved, use 'await client.get_account()'"
+            )
+        return self._account
+
+    async def get_account(self) -> Account:
+        if self._account is None:
+            async with self._account_lock:
+                if self._account is None:
+                    self._account = await self._resolve_account()
+        return self._account
+
+    async def _resolve_account(self) -> Account:
+        if self._account_cache is not None:
+            account = self._account_cache.get(self._account_key)
+            if account is not None:
+                return account
+
+        response = await self.request("GET", f"{self.BASE_URL}/account/account")
+        account = self.validate(response, response_model=Account)
+        if self._account_cache is not None:
+            self._account_cache[self._account_key] = account
+        return account
+
     async def request(
         self,
         method: str,
@@ -35,15 +138,179 @@ class AsyncTactillClient(ClientMixin):
         *,
         params: QueryParams | None = None,
         json: JsonValue | None = None,
-    ) -> JsonValue:
-        async with self._semaphore:
+    ) -> bytes:
+        timings = RequestTimings()
+        # the keys are only built when there is a cache to look them up in
+        resource = cache_key = ""
+        if self.cache is not None:
+            resource = self._get_resource_name(url)
+            if method == "GET":
+                cache_key = self._get_cache_key(url, params)
+                cached_response = self.cache.get(resource, cache_key)
+                if cached_response is not None:
+                    self._notify_request(
+                        method,
+                        url,
+                        RequestTimings(
+                            status_code=cached_response.status_code,
+                            size=len(cached_response.content),
+                        ),
+                        cached=True,
+                    )
+                    return self._handle_cached_response(cached_response)
+                timings.cache_miss = self.cache.is_cacheable(resource)
+
+        self._notify_request_start(method, url)
+        try:
             with self._handle_response():
-                response = await self._http_client.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json,
-                    headers=self.headers,
+                response = await self._send(
+                    method, url, params=params, json=json, timings=timings
                 )
+                timings.status_code = response.status_code
+                timings.size = len(response.content)
+                if self.cache is not None:
+                    self.cache.update(method, resource, cache_key, response)
                 response.raise_for_status()
-                return cast(JsonValue, response.json())
+                return response.content
+        finally:
+            self._notify_request(method, url, timings)
+
+    async def get_page(
+        self,
+        url: str,
+        *,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+        extra_params: QueryParams,
+    ) -> bytes:
+        split = split_query(filters)
+        if split is None:
+            params = self._build_params(
+                limit=limit,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+                extra_params=extra_params,
+            )
+            return await self.request("GET", url, params=params)
+
+        if skip:
+            raise TactillError(SPLIT_QUERY_SKIP)
+        pages = await asyncio.gather(
+            *(
+                self._get_documents(
+                    url,
+                    split=split,
+                    filters=query_filters,
+                    size=limit,
+                    order=order,
+                    deprecated=deprecated,
+                    extra_params=extra_params,
+                )
+                for query_filters in split.filters
+            )
+        )
+        return merge_pages(list(pages), limit=limit, skip=0, order=order)
+
+    async def _get_documents(
+        self,
+        url: str,
+        *,
+        split: SplitQuery,
+        filters: list[FilterEntity],
+        size: int,
+        order: str | None,
+        deprecated: bool,
+        extra_params: QueryParams,
+    ) -> list[Document]:
+        page_size = min(size, MAX_PAGE_SIZE)
+        documents: list[Document] = []
+        skip = 0
+        while True:
+            params = self._build_params(
+                limit=page_size,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+                extra_params=extra_params,
+            )
+            page = self._handle_documents(await self.request("GET", url, params=params))
+            documents.extend(split.keep(page))
+            if len(page) < page_size or len(documents) >= size:
+                return documents
+            skip += page_size
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: QueryParams | None,
+        json: JsonValue | None,
+        timings: RequestTimings,
+    ) -> httpx.Response:
+        attempt = 0
+        waited = 0.0
+        while True:
+            if self.rate_limiter is not None:
+                queued_at = time.perf_counter()
+                await self.rate_limiter.aacquire()
+                timings.queue_time += time.perf_counter() - queued_at
+            try:
+                response = await self._send_once(
+                    method, url, params=params, json=json, timings=timings
+                )
+            except httpx.TransportError:
+                delay = self.retry.get_delay(method, attempt, waited)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry.get_delay(method, attempt, waited, response)
+                if delay is None:
+                    return response
+
+            await asyncio.sleep(delay)
+            attempt += 1
+            timings.retries = attempt
+            waited += delay
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: QueryParams | None,
+        json: JsonValue | None,
+        timings: RequestTimings,
+    ) -> httpx.Response:
+        limiter = self.limiter if method == "GET" else self.write_limiter
+        queued_at = time.perf_counter()
+        started_at = await limiter.acquire()
+        sent_at = time.perf_counter()
+        timings.queue_time += sent_at - queued_at
+        dropped: bool | None = None
+        try:
+            response = await self._http_client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=self.headers,
+            )
+            dropped = response.status_code in RETRY_STATUS_CODES
+        except httpx.TransportError:
+            dropped = True
+            raise
+        finally:
+            timings.network_time += time.perf_counter() - sent_at
+            limiter.release(
+                started_at,
+                dropped=dropped,
+                endpoint=self._get_endpoint(url),
+            )
+        return response
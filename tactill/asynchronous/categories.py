@@ -1,10 +1,22 @@
+import asyncio
+import itertools
 import typing
+from collections.abc import AsyncIterator, Sequence
 
+from tactill.asynchronous.loader import BatchLoader
+from tactill.bulk import BulkResult, arun_bulk
 from tactill.entities.base import TactillUUID
-from tactill.entities.category import Category, CategoryCreate, CategoryUpdate
+from tactill.entities.category import (
+    Category,
+    CategoryCreate,
+    CategoryRecord,
+    CategoryUpdate,
+)
 from tactill.entities.response import TactillResponse
 from tactill.filters import FilterEntity
+from tactill.lookup import LookupResult, build_id_filters, chunk_ids, collect
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, afetch_all, apaginate
 
 if typing.TYPE_CHECKING:
     from tactill.asynchronous.base import AsyncTactillClient
@@ -14,6 +26,11 @@ class AsyncCategoriesResource(ClientMixin):
     def __init__(self, client: AsyncTactillClient) -> None:
         self.client = client
         self.base_url = f"{self.BASE_URL}/catalog/categories"
+        self.loader = (
+            BatchLoader(self.get_many, self._get, window=client.batch_window)
+            if client.batch_window is not None
+            else None
+        )
 
     async def get_all(
         self,
@@ -23,26 +40,129 @@ class AsyncCategoriesResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Category]:
-        params = self._build_params(
+        response = await self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate(response, response_model=list[Category])
+
+    async def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[CategoryRecord]:
+        response = await self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"company_id": self.client.account.company_id},
         )
-        response = await self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Category])
+        return self.client.validate_records(response, record_type=CategoryRecord)
+
+    def aiter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[Category]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def aiter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[CategoryRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    async def fetch_all(
+        self,
+        concurrency: int = 10,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[Category]:
+        return await afetch_all(
+            lambda skip: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            concurrency=concurrency,
+            filters=filters,
+        )
 
     async def get(self, category_id: TactillUUID) -> Category:
-        response = await self.client.request("GET", f"{self.base_url}/{category_id}")
-        return self._handle_validation(response, response_model=Category)
+        if self.loader is not None:
+            return await self.loader.load(category_id)
+        return await self._get(category_id)
+
+    async def get_many(
+        self,
+        ids: Sequence[TactillUUID],
+        deprecated: bool = False,
+    ) -> LookupResult[Category]:
+        pages = await asyncio.gather(
+            *(
+                self.get_all(
+                    limit=len(chunk),
+                    filters=build_id_filters(chunk),
+                    deprecated=deprecated,
+                )
+                for chunk in chunk_ids(ids)
+            )
+        )
+        return collect(ids, itertools.chain.from_iterable(pages))
 
     async def create(self, data: CategoryCreate) -> Category:
+        account = await self.client.get_account()
         json = data.model_dump(exclude_none=True)
-        json["company_id"] = self.client.account.company_id
+        json["company_id"] = account.company_id
         response = await self.client.request("POST", self.base_url, json=json)
-        return self._handle_validation(response, response_model=Category)
+        return self.client.validate(response, response_model=Category)
 
     async def update(
         self,
@@ -55,4 +175,36 @@ class AsyncCategoriesResource(ClientMixin):
             f"{self.base_url}/{category_id}",
             json=json,
         )
-        return self._handle_validation(response, response_model=TactillResponse)
+        return self.client.validate(response, response_model=TactillResponse)
+
+    async def bulk_create(self, data: Sequence[CategoryCreate]) -> BulkResult[Category]:
+        return await arun_bulk(self.create, data)
+
+    async def bulk_update(
+        self,
+        data: Sequence[tuple[TactillUUID, CategoryUpdate]],
+    ) -> BulkResult[TactillResponse]:
+        return await arun_bulk(lambda item: self.update(*item), data)
+
+    async def _get(self, category_id: str) -> Category:
+        response = await self.client.request("GET", f"{self.base_url}/{category_id}")
+        return self.client.validate(response, response_model=Category)
+
+    async def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        account = await self.client.get_account()
+        return await self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"company_id": account.company_id},
+        )
@@ -0,0 +1,133 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+
+_priority: ContextVar[Priority] = ContextVar("priority", default=Priority.DEFAULT)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    # applies to the requests of the current task and of the tasks it creates
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.9,
+        tolerance: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.clock = clock
+        self.in_flight = 0
+        # the lowest latency of each endpoint, their response times differ
+        self.baselines: dict[str, float] = {}
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._decreased_at = float("-inf")
+        # waiting callers by priority, then in arrival order
+        self._waiters: list[tuple[Priority, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> float:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return self.clock()
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (_priority.get(), next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # the slot was granted to a caller that is gone
+                self.in_flight -= 1
+                self._wake()
+            else:
+                self._waiters = [
+                    waiter for waiter in self._waiters if waiter[2] is not future
+                ]
+                heapq.heapify(self._waiters)
+            raise
+        return self.clock()
+
+    def release(
+        self,
+        started_at: float,
+        dropped: bool | None,
+        endpoint: str = "",
+    ) -> None:
+        # 'dropped' is None when the request did not complete, e.g. cancelled
+        self.in_flight -= 1
+        if dropped is not None:
+            self._update(
+                started_at,
+                self.clock() - started_at,
+                dropped=dropped,
+                endpoint=endpoint,
+            )
+        self._wake()
+
+    def _update(
+        self,
+        started_at: float,
+        latency: float,
+        dropped: bool,
+        endpoint: str,
+    ) -> None:
+        baseline = self.baselines.get(endpoint)
+        if not dropped:
+            # the baseline follows the lowest latency and drifts up slowly
+            baseline = self.baselines[endpoint] = (
+                latency
+                if baseline is None
+                else min(latency, baseline * 0.99 + latency * 0.01)
+            )
+
+        overloaded = dropped or (
+            baseline is not None and latency > baseline * self.tolerance
+        )
+        if overloaded:
+            # one multiplicative decrease for the requests in flight at that time
+            if started_at > self._decreased_at:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._decreased_at = self.clock()
+        elif (self.in_flight + 1) * 2 >= self._limit:
+            # additive increase, about one per round trip when the limit is used
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
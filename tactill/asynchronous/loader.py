@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from tactill.entities.base import BaseEntity
+from tactill.exceptions import TactillError
+from tactill.lookup import MAX_CHUNK_SIZE, LookupResult
+
+
+class BatchLoader[T: BaseEntity]:
+    def __init__(
+        self,
+        get_many: Callable[[list[str]], Awaitable[LookupResult[T]]],
+        get_one: Callable[[str], Awaitable[T]],
+        window: float,
+        max_batch_size: int = MAX_CHUNK_SIZE,
+    ) -> None:
+        self.get_many = get_many
+        self.get_one = get_one
+        self.window = window
+        self.max_batch_size = max_batch_size
+        # futures of the queued and in-flight ids, shared by identical calls
+        self._futures: dict[str, asyncio.Future[T]] = {}
+        self._batch: list[str] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, entity_id: str) -> T:
+        future = self._futures.get(entity_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[entity_id] = loop.create_future()
+            self._batch.append(entity_id)
+            if len(self._batch) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+
+        # a cancelled caller must not cancel the other callers of the same id
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch = self._batch, []
+        task = asyncio.create_task(self._fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: list[str]) -> None:
+        try:
+            result = await self.get_many(batch)
+            for entity in result.found:
+                self._resolve(entity.id, entity)
+            # deprecated or unknown ids, resolved (or rejected) one by one
+            await asyncio.gather(*(self._fetch_one(key) for key in result.missing))
+        except Exception as error:
+            for entity_id in batch:
+                self._reject(entity_id, error)
+        except BaseException:
+            # e.g. cancelled, the callers of the batch must not wait forever
+            for entity_id in batch:
+                self._cancel(entity_id)
+            raise
+
+    async def _fetch_one(self, entity_id: str) -> None:
+        try:
+            self._resolve(entity_id, await self.get_one(entity_id))
+        except TactillError as error:
+            self._reject(entity_id, error)
+
+    def _resolve(self, entity_id: str, entity: T) -> None:
+        future = self._futures.pop(entity_id, None)
+        if future is not None and not future.done():
+            future.set_result(entity)
+
+    def _reject(self, entity_id: str, error: Exception) -> None:
+        future = self._futures.pop(entity_id, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _cancel(self, entity_id: str) -> None:
+        future = self._futures.pop(entity_id, None)
+        if future is not None:
+            future.cancel()
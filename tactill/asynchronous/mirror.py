@@ -0,0 +1,83 @@
+import asyncio
+import typing
+from collections.abc import AsyncIterator, Callable, MutableMapping
+
+from tactill.entities.article import Article
+from tactill.entities.base import BaseEntity
+from tactill.entities.category import Category
+from tactill.entities.tax import Tax
+from tactill.mirror import MirrorMixin
+from tactill.pagination import Keyset, get_scan_watermark
+from tactill.store import CatalogStore
+
+if typing.TYPE_CHECKING:
+    from tactill.asynchronous.base import AsyncTactillClient
+
+
+class AsyncCatalogMirror(MirrorMixin):
+    def __init__(
+        self,
+        client: AsyncTactillClient,
+        page_size: int = 100,
+        store: CatalogStore | None = None,
+    ) -> None:
+        super().__init__(page_size=page_size, store=store)
+        self.client = client
+
+    async def refresh(self) -> int:
+        counts = await asyncio.gather(
+            self._refresh(
+                "articles", Article, self.articles, self.client.articles.aiter_all
+            ),
+            self._refresh(
+                "categories",
+                Category,
+                self.categories,
+                self.client.categories.aiter_all,
+            ),
+            self._refresh("taxes", Tax, self.taxes, self.client.taxes.aiter_all),
+        )
+        return sum(counts)
+
+    async def _refresh[T: BaseEntity](
+        self,
+        resource: str,
+        model: type[T],
+        entities: MutableMapping[str, T],
+        aiter_all: Callable[..., AsyncIterator[T]],
+    ) -> int:
+        filters = self._get_filters(resource)
+        if filters is None:
+            # the updates made during the full load are fetched again next time
+            latest = await anext(aiter_all(page_size=1, order="-updated_at"), None)
+            changes = [
+                entity
+                async for entity in aiter_all(
+                    page_size=self.page_size,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            ]
+            watermark = latest.updated_at if latest is not None else None
+        else:
+            changes = [
+                entity
+                async for entity in aiter_all(
+                    page_size=self.page_size,
+                    filters=filters,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            ]
+            deprecated = [
+                entity
+                async for entity in aiter_all(
+                    page_size=self.page_size,
+                    filters=filters,
+                    deprecated=True,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            ]
+            watermark = get_scan_watermark(
+                self.watermarks.get(resource), changes, deprecated
+            )
+            changes.extend(deprecated)
+        return self._apply(resource, model, entities, changes, watermark)
@@ -1,8 +1,13 @@
+import datetime
 import typing
+from collections.abc import AsyncIterator, Coroutine
+from typing import Any
 
-from tactill.entities.movement import Movement, MovementCreate
-from tactill.filters import FilterEntity
+from tactill.entities.movement import Movement, MovementCreate, MovementRecord
+from tactill.filters import FilterEntity, FilterOperator, as_utc, format_datetime
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, afetch_all, apaginate, ascan_windows
+from tactill.query import MAX_PAGE_SIZE
 
 if typing.TYPE_CHECKING:
     from tactill.asynchronous.base import AsyncTactillClient
@@ -21,19 +26,169 @@ class AsyncMovementsResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Movement]:
-        params = self._build_params(
+        response = await self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"shop_id": self.client.account.shop_id},
         )
-        response = await self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Movement])
+        return self.client.validate(response, response_model=list[Movement])
+
+    async def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[MovementRecord]:
+        response = await self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate_records(response, record_type=MovementRecord)
+
+    def aiter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[Movement]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def aiter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[MovementRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    async def fetch_all(
+        self,
+        concurrency: int = 10,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[Movement]:
+        return await afetch_all(
+            lambda skip: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            concurrency=concurrency,
+            filters=filters,
+        )
+
+    def scan_range(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        window: datetime.timedelta = datetime.timedelta(days=1),
+        concurrency: int = 10,
+        page_size: int = MAX_PAGE_SIZE,
+        filters: list[FilterEntity] | None = None,
+        deprecated: bool = False,
+    ) -> AsyncIterator[Movement]:
+        # the movements created in [start, end), in chronological order
+        def fetch_page(
+            window_start: datetime.datetime,
+            window_end: datetime.datetime,
+            skip: int,
+        ) -> Coroutine[Any, Any, list[Movement]]:
+            return self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[
+                    *(filters or []),
+                    FilterEntity(
+                        field="created_at",
+                        value=format_datetime(window_start),
+                        operator=FilterOperator.GTE,
+                    ),
+                    FilterEntity(
+                        field="created_at",
+                        value=format_datetime(window_end),
+                        operator=FilterOperator.LT,
+                    ),
+                ],
+                order="created_at",
+                deprecated=deprecated,
+            )
+
+        return ascan_windows(
+            fetch_page,
+            start=as_utc(start),
+            end=as_utc(end),
+            window=window,
+            page_size=page_size,
+            concurrency=concurrency,
+            key=lambda movement: movement.created_at,
+        )
 
     async def create(self, data: MovementCreate) -> Movement:
+        account = await self.client.get_account()
         json = data.model_dump(mode="json", exclude_none=True)
-        json["shop_id"] = self.client.account.shop_id
+        json["shop_id"] = account.shop_id
         response = await self.client.request("POST", self.base_url, json=json)
-        return self._handle_validation(response, response_model=Movement)
+        return self.client.validate(response, response_model=Movement)
+
+    async def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        account = await self.client.get_account()
+        return await self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"shop_id": account.shop_id},
+        )
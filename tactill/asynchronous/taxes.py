@@ -1,9 +1,15 @@
+import asyncio
+import itertools
 import typing
+from collections.abc import AsyncIterator, Sequence
 
+from tactill.asynchronous.loader import BatchLoader
 from tactill.entities.base import TactillUUID
-from tactill.entities.tax import Tax
+from tactill.entities.tax import Tax, TaxRecord
 from tactill.filters import FilterEntity
+from tactill.lookup import LookupResult, build_id_filters, chunk_ids, collect
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, afetch_all, apaginate
 
 if typing.TYPE_CHECKING:
     from tactill.asynchronous.base import AsyncTactillClient
@@ -13,6 +19,11 @@ class AsyncTaxesResource(ClientMixin):
     def __init__(self, client: AsyncTactillClient) -> None:
         self.client = client
         self.base_url = f"{self.BASE_URL}/catalog/taxes"
+        self.loader = (
+            BatchLoader(self.get_many, self._get, window=client.batch_window)
+            if client.batch_window is not None
+            else None
+        )
 
     async def get_all(
         self,
@@ -22,17 +33,142 @@ class AsyncTaxesResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Tax]:
-        params = self._build_params(
+        response = await self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate(response, response_model=list[Tax])
+
+    async def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[TaxRecord]:
+        response = await self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"company_id": self.client.account.company_id},
         )
-        response = await self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Tax])
+        return self.client.validate_records(response, record_type=TaxRecord)
+
+    def aiter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[Tax]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def aiter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> AsyncIterator[TaxRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return apaginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    async def fetch_all(
+        self,
+        concurrency: int = 10,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[Tax]:
+        return await afetch_all(
+            lambda skip: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            concurrency=concurrency,
+            filters=filters,
+        )
 
     async def get(self, tax_id: TactillUUID) -> Tax:
+        if self.loader is not None:
+            return await self.loader.load(tax_id)
+        return await self._get(tax_id)
+
+    async def get_many(
+        self,
+        ids: Sequence[TactillUUID],
+        deprecated: bool = False,
+    ) -> LookupResult[Tax]:
+        pages = await asyncio.gather(
+            *(
+                self.get_all(
+                    limit=len(chunk),
+                    filters=build_id_filters(chunk),
+                    deprecated=deprecated,
+                )
+                for chunk in chunk_ids(ids)
+            )
+        )
+        return collect(ids, itertools.chain.from_iterable(pages))
+
+    async def _get(self, tax_id: str) -> Tax:
         response = await self.client.request("GET", f"{self.base_url}/{tax_id}")
-        return self._handle_validation(response, response_model=Tax)
+        return self.client.validate(response, response_model=Tax)
+
+    async def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        account = await self.client.get_account()
+        return await self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"company_id": account.company_id},
+        )
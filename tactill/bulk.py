@@ -0,0 +1,83 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from tactill.exceptions import TactillError
+
+
+@dataclass(frozen=True, slots=True)
+class BulkSuccess[T]:
+    index: int
+    value: T
+    elapsed: float
+
+
+@dataclass(frozen=True, slots=True)
+class BulkFailure:
+    index: int
+    error: TactillError
+    elapsed: float
+
+
+@dataclass(slots=True)
+class BulkResult[T]:
+    successes: list[BulkSuccess[T]] = field(default_factory=list)
+    failures: list[BulkFailure] = field(default_factory=list)
+    elapsed: float = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def add(self, item: BulkSuccess[T] | BulkFailure) -> None:
+        if isinstance(item, BulkSuccess):
+            self.successes.append(item)
+        else:
+            self.failures.append(item)
+
+
+def run_bulk[I, T](
+    function: Callable[[I], T],
+    items: Sequence[I],
+    /,
+    max_workers: int,
+) -> BulkResult[T]:
+    def run(index: int, item: I) -> BulkSuccess[T] | BulkFailure:
+        start = time.perf_counter()
+        try:
+            value = function(item)
+        except TactillError as error:
+            return BulkFailure(index, error, time.perf_counter() - start)
+        return BulkSuccess(index, value, time.perf_counter() - start)
+
+    result = BulkResult[T]()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in executor.map(run, range(len(items)), items):
+            result.add(item)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def arun_bulk[I, T](
+    function: Callable[[I], Awaitable[T]],
+    items: Sequence[I],
+    /,
+) -> BulkResult[T]:
+    async def run(index: int, item: I) -> BulkSuccess[T] | BulkFailure:
+        start = time.perf_counter()
+        try:
+            value = await function(item)
+        except TactillError as error:
+            return BulkFailure(index, error, time.perf_counter() - start)
+        return BulkSuccess(index, value, time.perf_counter() - start)
+
+    # concurrency is bounded by the client limiter
+    result = BulkResult[T]()
+    start = time.perf_counter()
+    for item in await asyncio.gather(*(run(*pair) for pair in enumerate(items))):
+        result.add(item)
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import NamedTuple
+
+import httpx
+
+# creating a movement changes the stock quantity of its articles
+RELATED_RESOURCES = {"movements": {"articles"}}
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    content: bytes
+
+
+class CacheEntry(NamedTuple):
+    resource: str
+    expires_at: float
+    response: CachedResponse
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        ttl: Mapping[str, float] | None = None,
+        default_ttl: float = 0,
+        maxsize: int = 1024,
+        negative_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, resource: str, status_code: int) -> float:
+        ttl = self.ttl.get(resource, self.default_ttl)
+        if status_code == httpx.codes.NOT_FOUND and self.negative_ttl is not None:
+            return min(ttl, self.negative_ttl)
+        return ttl
+
+    def is_cacheable(self, resource: str) -> bool:
+        return self.get_ttl(resource, httpx.codes.OK) > 0
+
+    def get(self, resource: str, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                if self.is_cacheable(resource):
+                    self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response
+
+    def set(self, resource: str, key: str, response: CachedResponse) -> None:
+        ttl = self.get_ttl(resource, response.status_code)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = CacheEntry(
+                resource=resource,
+                expires_at=self.clock() + ttl,
+                response=response,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def update(
+        self,
+        method: str,
+        resource: str,
+        key: str,
+        response: httpx.Response,
+    ) -> None:
+        if method == "GET":
+            if response.status_code in {httpx.codes.OK, httpx.codes.NOT_FOUND}:
+                self.set(
+                    resource,
+                    key,
+                    CachedResponse(response.status_code, response.content),
+                )
+        elif response.is_success:
+            self.invalidate(resource, *RELATED_RESOURCES.get(resource, ()))
+
+    def invalidate(self, *resources: str) -> None:
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.resource in resources:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -2,11 +2,13 @@ from pydantic import BaseModel
 
 from tactill.entities.base import (
     BaseEntity,
+    BaseRecord,
     IconText,
     TactillColor,
     TactillName,
     TactillUUID,
 )
+from tactill.entities.record import RecordField
 
 
 class ArticleCreate(BaseModel):
@@ -42,3 +44,18 @@ class Article(BaseEntity):
     reference: str | None = None
     full_price: float | None = None
     stock_quantity: int | None = None
+
+
+class ArticleRecord(BaseRecord):
+    __slots__ = ()
+
+    category_id = RecordField[str]()
+    taxes = RecordField[list[str]]()
+    name = RecordField[str]()
+    icon_text = RecordField[str]()
+    color = RecordField(converter=TactillColor)
+    barcode = RecordField[str | None]()
+    in_stock = RecordField[bool]()
+    reference = RecordField[str | None]()
+    full_price = RecordField[float | None]()
+    stock_quantity = RecordField[int | None]()
@@ -4,6 +4,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, Field
 
+from tactill.entities.record import Record, RecordField
+
 TactillUUID = Annotated[str, Field(pattern=r"^[0-9A-Fa-f]{24}$")]
 TactillName = Annotated[str, Field(min_length=1)]
 IconText = Annotated[str, Field(min_length=1, max_length=4)]
@@ -27,3 +29,12 @@ class BaseEntity(BaseModel):
     deprecated: bool = False
     created_at: datetime.datetime
     updated_at: datetime.datetime
+
+
+class BaseRecord(Record):
+    __slots__ = ()
+
+    id = RecordField[str]("_id")
+    deprecated = RecordField[bool](default=False)
+    created_at = RecordField(converter=datetime.datetime.fromisoformat)
+    updated_at = RecordField(converter=datetime.datetime.fromisoformat)
@@ -1,6 +1,13 @@
 from pydantic import BaseModel
 
-from tactill.entities.base import BaseEntity, IconText, TactillColor, TactillName
+from tactill.entities.base import (
+    BaseEntity,
+    BaseRecord,
+    IconText,
+    TactillColor,
+    TactillName,
+)
+from tactill.entities.record import RecordField
 
 
 class CategoryCreate(BaseModel):
@@ -19,3 +26,11 @@ class Category(BaseEntity):
     name: TactillName
     icon_text: IconText
     color: TactillColor
+
+
+class CategoryRecord(BaseRecord):
+    __slots__ = ()
+
+    name = RecordField[str]()
+    icon_text = RecordField[str]()
+    color = RecordField(converter=TactillColor)
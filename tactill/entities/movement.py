@@ -3,7 +3,8 @@ from enum import StrEnum
 
 from pydantic import BaseModel
 
-from tactill.entities.base import BaseEntity, TactillName, TactillUUID
+from tactill.entities.base import BaseEntity, BaseRecord, TactillName, TactillUUID
+from tactill.entities.record import Record, RecordData, RecordField
 
 
 class MovementType(StrEnum):
@@ -44,3 +45,28 @@ class Movement(BaseEntity):
     state: MovementState
     motive: MovementMotive | None = None
     movements: list[ArticleMovement]
+
+
+class ArticleMovementRecord(Record):
+    __slots__ = ()
+
+    article_id = RecordField[str]()
+    article_name = RecordField[str]()
+    category_name = RecordField[str]()
+    state = RecordField(converter=MovementState)
+    units = RecordField[int]()
+    done_on = RecordField(converter=datetime.datetime.fromisoformat)
+
+
+def _build_article_movements(items: list[RecordData]) -> list[ArticleMovementRecord]:
+    return [ArticleMovementRecord(item) for item in items]
+
+
+class MovementRecord(BaseRecord):
+    __slots__ = ()
+
+    number = RecordField[int]()
+    type = RecordField(converter=MovementType)
+    state = RecordField(converter=MovementState)
+    motive = RecordField(converter=MovementMotive)
+    movements = RecordField(converter=_build_article_movements)
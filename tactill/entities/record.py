@@ -0,0 +1,45 @@
+from collections.abc import Callable
+from typing import Any, Self, cast, overload
+
+type RecordData = dict[str, Any]
+
+
+class Record:
+    __slots__ = ("_data",)
+
+    def __init__(self, data: RecordData) -> None:
+        self._data = data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class RecordField[T]:
+    def __init__(
+        self,
+        key: str | None = None,
+        converter: Callable[[Any], T] | None = None,
+        default: T | None = None,
+    ) -> None:
+        self.key = key or ""
+        self.converter = converter
+        self.default = default
+
+    def __set_name__(self, owner: type[Record], name: str) -> None:
+        if not self.key:
+            self.key = name
+
+    @overload
+    def __get__(self, instance: None, owner: type[Record]) -> Self: ...
+
+    @overload
+    def __get__(self, instance: Record, owner: type[Record]) -> T: ...
+
+    def __get__(self, instance: Record | None, owner: type[Record]) -> Self | T:
+        if instance is None:
+            return self
+
+        value = instance._data.get(self.key, self.default)
+        if self.converter is None or value is None:
+            return cast(T, value)
+        return self.converter(value)
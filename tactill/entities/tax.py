@@ -1,6 +1,14 @@
-from tactill.entities.base import BaseEntity, TactillName
+from tactill.entities.base import BaseEntity, BaseRecord, TactillName
+from tactill.entities.record import RecordField
 
 
 class Tax(BaseEntity):
     name: TactillName
     rate: float
+
+
+class TaxRecord(BaseRecord):
+    __slots__ = ()
+
+    name = RecordField[str]()
+    rate = RecordField[float]()
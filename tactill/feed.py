@@ -0,0 +1,37 @@
+import datetime
+from collections.abc import Sequence
+from typing import Protocol
+
+from tactill.entities.movement import Movement, MovementRecord
+from tactill.filters import FilterEntity, FilterOperator, format_datetime
+
+
+class MovementConsumer(Protocol):
+    # the movements updated since the watermark are the next ones ingested, the
+    # movements at the watermark are ingested again and must be a no-op
+    watermark: datetime.datetime | None
+
+    def ingest(
+        self,
+        movements: Sequence[Movement | MovementRecord],
+        watermark: datetime.datetime | None = None,
+    ) -> int: ...
+
+
+class MovementFeedMixin:
+    # a full load first, then the movements updated since the watermark
+    def __init__(self, consumer: MovementConsumer, page_size: int = 100) -> None:
+        self.consumer = consumer
+        self.page_size = page_size
+
+    def _get_filters(self) -> list[FilterEntity] | None:
+        if self.consumer.watermark is None:
+            return None
+
+        return [
+            FilterEntity(
+                field="updated_at",
+                value=format_datetime(self.consumer.watermark),
+                operator=FilterOperator.GTE,
+            )
+        ]
@@ -1,3 +1,4 @@
+import datetime
 from enum import StrEnum
 from typing import Any, Self
 
@@ -55,3 +56,17 @@ class FilterEntity(BaseModel):
 
 def build_filters(filters: list[FilterEntity]) -> str:
     return "&".join(filter_.param for filter_ in filters)
+
+
+def format_datetime(value: datetime.datetime) -> str:
+    # API timestamps format, e.g. '2026-01-01T00:00:00.000Z'
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.UTC).replace(tzinfo=None)
+    return f"{value.isoformat(timespec='milliseconds')}Z"
+
+
+def as_utc(value: datetime.datetime) -> datetime.datetime:
+    # naive datetimes are in UTC, like the API timestamps
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.UTC)
+    return value
@@ -0,0 +1,99 @@
+from collections.abc import Iterable, Iterator, MutableMapping
+
+from tactill.entities.article import Article
+
+
+class CatalogIndex(MutableMapping[str, Article]):
+    def __init__(self, articles: Iterable[Article] = ()) -> None:
+        self._articles: dict[str, Article] = {}
+        self._by_barcode: dict[str, Article] = {}
+        self._by_reference: dict[str, Article] = {}
+        self._by_name: dict[str, dict[str, Article]] = {}
+        self._by_category: dict[str, dict[str, Article]] = {}
+        self._by_tax: dict[str, dict[str, Article]] = {}
+        for article in articles:
+            self.upsert(article)
+
+    def __getitem__(self, article_id: str) -> Article:
+        return self._articles[article_id]
+
+    def __setitem__(self, article_id: str, article: Article) -> None:
+        if article_id != article.id:
+            raise KeyError(article_id)
+        self.upsert(article)
+
+    def __delitem__(self, article_id: str) -> None:
+        if self.remove(article_id) is None:
+            raise KeyError(article_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._articles)
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def get_by_barcode(self, barcode: str) -> Article | None:
+        return self._by_barcode.get(barcode)
+
+    def get_by_reference(self, reference: str) -> Article | None:
+        return self._by_reference.get(reference)
+
+    def get_by_name(self, name: str) -> list[Article]:
+        return list(self._by_name.get(name.casefold(), {}).values())
+
+    def get_by_category(
+        self,
+        category_id: str,
+        *,
+        in_stock: bool = False,
+    ) -> list[Article]:
+        articles = self._by_category.get(category_id, {}).values()
+        if in_stock:
+            return [
+                article
+                for article in articles
+                if article.stock_quantity and article.stock_quantity > 0
+            ]
+        return list(articles)
+
+    def get_by_tax(self, tax_id: str) -> list[Article]:
+        return list(self._by_tax.get(tax_id, {}).values())
+
+    def upsert(self, article: Article) -> None:
+        self.remove(article.id)
+        self._articles[article.id] = article
+        if article.barcode:
+            self._by_barcode[article.barcode] = article
+        if article.reference:
+            self._by_reference[article.reference] = article
+        self._by_name.setdefault(article.name.casefold(), {})[article.id] = article
+        self._by_category.setdefault(article.category_id, {})[article.id] = article
+        for tax_id in article.taxes:
+            self._by_tax.setdefault(tax_id, {})[article.id] = article
+
+    def remove(self, article_id: str) -> Article | None:
+        article = self._articles.pop(article_id, None)
+        if article is None:
+            return None
+
+        if article.barcode and self._by_barcode.get(article.barcode) is article:
+            del self._by_barcode[article.barcode]
+        if article.reference and self._by_reference.get(article.reference) is article:
+            del self._by_reference[article.reference]
+        self._discard(self._by_name, article.name.casefold(), article_id)
+        self._discard(self._by_category, article.category_id, article_id)
+        for tax_id in article.taxes:
+            self._discard(self._by_tax, tax_id, article_id)
+        return article
+
+    @staticmethod
+    def _discard(
+        groups: dict[str, dict[str, Article]],
+        key: str,
+        article_id: str,
+    ) -> None:
+        group = groups.get(key)
+        if group is not None:
+            group.pop(article_id, None)
+            if not group:
+                del groups[key]
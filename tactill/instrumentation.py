@@ -0,0 +1,116 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import get_args, get_origin
+
+logger = logging.getLogger(__name__)
+
+ID_PATTERN = re.compile(r"/[0-9a-f]{24}(?=/|$)")
+
+
+@dataclass(frozen=True, slots=True)
+class RequestEvent:
+    method: str
+    # the path without the ids, e.g. 'catalog/articles/{id}'
+    endpoint: str
+    status_code: int | None
+    size: int
+    retries: int = 0
+    cached: bool = False
+    # a GET of a cacheable resource that the cache could not serve
+    cache_miss: bool = False
+    # waiting for the rate limiter and the concurrency limiter
+    queue_time: float = 0
+    network_time: float = 0
+
+    @property
+    def duration(self) -> float:
+        return self.queue_time + self.network_time
+
+
+@dataclass(frozen=True, slots=True)
+class DecodeEvent:
+    model: str
+    size: int
+    duration: float
+    # validate_json parses and validates in a single pass, records are only parsed
+    validated: bool
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    status_code: int | None = None
+    size: int = 0
+    retries: int = 0
+    cache_miss: bool = False
+    queue_time: float = 0
+    network_time: float = 0
+
+    def build_event(self, method: str, endpoint: str, cached: bool) -> RequestEvent:
+        return RequestEvent(
+            method=method,
+            endpoint=endpoint,
+            status_code=self.status_code,
+            size=self.size,
+            retries=self.retries,
+            cached=cached,
+            cache_miss=self.cache_miss,
+            queue_time=self.queue_time,
+            network_time=self.network_time,
+        )
+
+
+class Observer:
+    def on_request_start(self, method: str, endpoint: str) -> None:
+        pass
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        pass
+
+
+class SlowCallLogger(Observer):
+    def __init__(self, threshold: float = 1.0, level: int = logging.WARNING) -> None:
+        self.threshold = threshold
+        self.level = level
+
+    def on_request(self, event: RequestEvent) -> None:
+        if event.duration >= self.threshold:
+            logger.log(
+                self.level,
+                "Slow request %s %s: %.3fs (queue %.3fs, network %.3fs, "
+                "%d retries, status %s, %d bytes)",
+                event.method,
+                event.endpoint,
+                event.duration,
+                event.queue_time,
+                event.network_time,
+                event.retries,
+                event.status_code,
+                event.size,
+            )
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        if event.duration >= self.threshold:
+            logger.log(
+                self.level,
+                "Slow decoding of %s: %.3fs (%d bytes)",
+                event.model,
+                event.duration,
+                event.size,
+            )
+
+
+def get_endpoint(path: str) -> str:
+    return ID_PATTERN.sub("/{id}", path)
+
+
+def get_model_name(model: object) -> str:
+    # e.g. 'list[Article]'
+    origin = get_origin(model)
+    if origin is not None:
+        args = ", ".join(get_model_name(arg) for arg in get_args(model))
+        return f"{get_model_name(origin)}[{args}]"
+    return str(getattr(model, "__name__", model))
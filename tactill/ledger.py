@@ -0,0 +1,182 @@
+import bisect
+import datetime
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from tactill.entities.movement import (
+    Movement,
+    MovementRecord,
+    MovementState,
+    MovementType,
+)
+from tactill.filters import as_utc
+
+# (article, day, units) applied by a movement, the article as a ledger index
+type Delta = tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class ArticleLedger:
+    # sorted day ordinals, with the units moved that day and the stock at its end
+    days: array[int] = field(default_factory=lambda: array("l"))
+    deltas: array[int] = field(default_factory=lambda: array("q"))
+    totals: array[int] = field(default_factory=lambda: array("q"))
+
+    @property
+    def quantity(self) -> int:
+        return self.totals[-1] if self.totals else 0
+
+    def add(self, day: int, units: int) -> None:
+        index = bisect.bisect_left(self.days, day)
+        if index == len(self.days) or self.days[index] != day:
+            self.days.insert(index, day)
+            self.deltas.insert(index, 0)
+            self.totals.insert(index, self.totals[index - 1] if index else 0)
+        self.deltas[index] += units
+        # the movements mostly arrive in order, so few totals follow the day
+        for later in range(index, len(self.totals)):
+            self.totals[later] += units
+
+    def get_quantity(self, day: int) -> int:
+        index = bisect.bisect_right(self.days, day)
+        return self.totals[index - 1] if index else 0
+
+
+@dataclass(slots=True)
+class DeltaLog:
+    # the deltas of each movement, reverted when the movement changes, in flat
+    # arrays: those of a movement are contiguous, from its start
+    articles: array[int] = field(default_factory=lambda: array("l"))
+    days: array[int] = field(default_factory=lambda: array("l"))
+    units: array[int] = field(default_factory=lambda: array("q"))
+    starts: array[int] = field(default_factory=lambda: array("q"))
+    counts: array[int] = field(default_factory=lambda: array("l"))
+    # the index of each movement in 'starts' and 'counts'
+    slots: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def get(self, movement_id: str) -> list[Delta] | None:
+        slot = self.slots.get(movement_id)
+        if slot is None:
+            return None
+        start = self.starts[slot]
+        end = start + self.counts[slot]
+        return list(
+            zip(
+                self.articles[start:end],
+                self.days[start:end],
+                self.units[start:end],
+                strict=True,
+            )
+        )
+
+    def set(self, movement_id: str, deltas: list[Delta]) -> None:
+        slot = self.slots.get(movement_id)
+        if slot is None:
+            slot = self.slots[movement_id] = len(self.starts)
+            self.starts.append(len(self.articles))
+            self.counts.append(0)
+
+        if len(deltas) > self.counts[slot]:
+            # the previous deltas are left unused, movements rarely grow
+            self.starts[slot] = len(self.articles)
+            for article, day, units in deltas:
+                self.articles.append(article)
+                self.days.append(day)
+                self.units.append(units)
+        else:
+            for index, (article, day, units) in enumerate(deltas, self.starts[slot]):
+                self.articles[index] = article
+                self.days[index] = day
+                self.units[index] = units
+        self.counts[slot] = len(deltas)
+
+    def remove(self, movement_id: str) -> None:
+        slot = self.slots.pop(movement_id)
+        self.counts[slot] = 0
+
+
+class StockLedger:
+    # stock levels from the movements, with a day resolution
+    def __init__(self) -> None:
+        self.articles: dict[str, ArticleLedger] = {}
+        self.deltas = DeltaLog()
+        self.watermark: datetime.datetime | None = None
+        # the article ledgers by index, as referenced by the deltas
+        self._ledgers: list[ArticleLedger] = []
+        self._indexes: dict[str, int] = {}
+
+    def ingest(
+        self,
+        movements: Sequence[Movement | MovementRecord],
+        watermark: datetime.datetime | None = None,
+    ) -> int:
+        # returns the number of movements that changed the stock
+        changed = 0
+        for movement in movements:
+            previous = self.deltas.get(movement.id)
+            deltas = (
+                None
+                if movement.deprecated
+                else [
+                    (self._get_index(article_id), day, units)
+                    for article_id, day, units in get_deltas(movement)
+                ]
+            )
+            if deltas == previous:
+                continue
+
+            for index, day, units in previous or []:
+                self._ledgers[index].add(day, -units)
+            if deltas is None:
+                self.deltas.remove(movement.id)
+            else:
+                self.deltas.set(movement.id, deltas)
+                for index, day, units in deltas:
+                    self._ledgers[index].add(day, units)
+            changed += 1
+
+        if watermark is not None:
+            self.watermark = watermark
+        return changed
+
+    def get_stock(self, article_id: str, day: datetime.date | None = None) -> int:
+        # at the end of 'day', in UTC
+        if isinstance(day, datetime.datetime):
+            raise TypeError("The stock is known by day, use a 'datetime.date'")
+
+        ledger = self.articles.get(article_id)
+        if ledger is None:
+            return 0
+        if day is None:
+            return ledger.quantity
+        return ledger.get_quantity(day.toordinal())
+
+    def get_below(self, threshold: int) -> dict[str, int]:
+        return {
+            article_id: ledger.quantity
+            for article_id, ledger in self.articles.items()
+            if ledger.quantity < threshold
+        }
+
+    def _get_index(self, article_id: str) -> int:
+        index = self._indexes.get(article_id)
+        if index is None:
+            index = self._indexes[article_id] = len(self._ledgers)
+            self._ledgers.append(self.articles.setdefault(article_id, ArticleLedger()))
+        return index
+
+
+def get_deltas(movement: Movement | MovementRecord) -> Iterator[tuple[str, int, int]]:
+    # only the done lines move the stock, on the day they were done
+    sign = 1 if movement.type == MovementType.IN else -1
+    for line in movement.movements:
+        if line.state == MovementState.DONE:
+            yield line.article_id, get_day(line.done_on), sign * line.units
+
+
+def get_day(value: datetime.datetime) -> int:
+    return as_utc(value).astimezone(datetime.UTC).date().toordinal()
@@ -0,0 +1,37 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from tactill.entities.base import BaseEntity
+from tactill.filters import FilterEntity, FilterOperator
+from tactill.query import chunk_values
+
+# one page per chunk
+MAX_CHUNK_SIZE = 100
+
+
+@dataclass(slots=True)
+class LookupResult[T: BaseEntity]:
+    found: list[T] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+
+def chunk_ids(ids: Iterable[str]) -> list[list[str]]:
+    return chunk_values(ids, max_size=MAX_CHUNK_SIZE)
+
+
+def build_id_filters(chunk: list[str]) -> list[FilterEntity]:
+    return [FilterEntity(field="_id", value=chunk, operator=FilterOperator.IN)]
+
+
+def collect[T: BaseEntity](
+    ids: Sequence[str], entities: Iterable[T]
+) -> LookupResult[T]:
+    entities_by_id = {entity.id: entity for entity in entities}
+    result = LookupResult[T]()
+    for entity_id in ids:
+        entity = entities_by_id.get(entity_id)
+        if entity is None:
+            result.missing.append(entity_id)
+        else:
+            result.found.append(entity)
+    return result
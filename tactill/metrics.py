@@ -0,0 +1,210 @@
+import bisect
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from tactill.instrumentation import Observer, RequestEvent
+
+# the Prometheus client default buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+OPERATIONS = {
+    ("GET", False): "get_all",
+    ("GET", True): "get",
+    ("POST", False): "create",
+    ("PUT", True): "update",
+}
+
+type Labels = tuple[str, ...]
+
+
+@dataclass(slots=True)
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+def get_operation(method: str, endpoint: str) -> tuple[str, str]:
+    # e.g. ('articles', 'get') for 'GET catalog/articles/{id}'
+    parts = endpoint.split("/")
+    resource = parts[1] if len(parts) > 1 else parts[0]
+    operation = OPERATIONS.get((method, parts[-1] == "{id}"), method.lower())
+    return resource, operation
+
+
+class MetricsRegistry(Observer):
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        prefix: str = "tactill",
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.requests: Counter[Labels] = Counter()
+        self.errors: Counter[Labels] = Counter()
+        self.retries: Counter[Labels] = Counter()
+        self.in_flight: Counter[Labels] = Counter()
+        self.durations: dict[Labels, Histogram] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0
+
+    def on_request_start(self, method: str, endpoint: str) -> None:
+        with self._lock:
+            self.in_flight[get_operation(method, endpoint)] += 1
+
+    def on_request(self, event: RequestEvent) -> None:
+        labels = get_operation(event.method, event.endpoint)
+        status = str(event.status_code) if event.status_code is not None else "error"
+        with self._lock:
+            self.requests[(*labels, status)] += 1
+            if event.cached:
+                self.cache_hits += 1
+                return
+
+            if event.cache_miss:
+                self.cache_misses += 1
+            self.in_flight[labels] -= 1
+            self.retries[labels] += event.retries
+            if event.status_code is None or event.status_code >= 400:  # noqa: PLR2004
+                self.errors[labels] += 1
+            histogram = self.durations.get(labels)
+            if histogram is None:
+                histogram = self.durations[labels] = Histogram(self.buckets)
+            histogram.observe(event.duration)
+
+    def render(self) -> str:
+        # Prometheus text exposition format
+        name = self.prefix
+        operation_labels = ("resource", "operation")
+        with self._lock:
+            lines = [
+                *self._render_samples(
+                    f"{name}_requests_total",
+                    "counter",
+                    "API requests, cache hits included.",
+                    (*operation_labels, "status"),
+                    self.requests.items(),
+                ),
+                *self._render_samples(
+                    f"{name}_errors_total",
+                    "counter",
+                    "API requests failed with an error status or a transport error.",
+                    operation_labels,
+                    self.errors.items(),
+                ),
+                *self._render_samples(
+                    f"{name}_retries_total",
+                    "counter",
+                    "Retried API requests.",
+                    operation_labels,
+                    self.retries.items(),
+                ),
+                *self._render_samples(
+                    f"{name}_in_flight_requests",
+                    "gauge",
+                    "API requests in flight.",
+                    operation_labels,
+                    self.in_flight.items(),
+                ),
+                *self._render_histograms(
+                    f"{name}_request_duration_seconds",
+                    "API request duration, queue time included.",
+                    operation_labels,
+                ),
+                *self._render_samples(
+                    f"{name}_cache_hits_total",
+                    "counter",
+                    "GET requests served by the response cache.",
+                    (),
+                    [((), self.cache_hits)],
+                ),
+                *self._render_samples(
+                    f"{name}_cache_misses_total",
+                    "counter",
+                    "GET requests sent to the API.",
+                    (),
+                    [((), self.cache_misses)],
+                ),
+                *self._render_samples(
+                    f"{name}_cache_hit_ratio",
+                    "gauge",
+                    "Ratio of GET requests served by the response cache.",
+                    (),
+                    [((), self.cache_hit_ratio)],
+                ),
+            ]
+        return "\n".join(lines) + "\n"
+
+    def _render_histograms(
+        self,
+        name: str,
+        description: str,
+        label_names: Labels,
+    ) -> list[str]:
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+        for labels, histogram in sorted(self.durations.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                cumulative += count
+                bucket_labels = format_labels(
+                    (*label_names, "le"), (*labels, format_value(bound))
+                )
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            bucket_labels = format_labels((*label_names, "le"), (*labels, "+Inf"))
+            lines.append(f"{name}_bucket{bucket_labels} {histogram.count}")
+            sample_labels = format_labels(label_names, labels)
+            lines.append(f"{name}_sum{sample_labels} {format_value(histogram.total)}")
+            lines.append(f"{name}_count{sample_labels} {histogram.count}")
+        return lines
+
+    @staticmethod
+    def _render_samples(
+        name: str,
+        metric_type: str,
+        description: str,
+        label_names: Labels,
+        samples: Iterable[tuple[Labels, float]],
+    ) -> list[str]:
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+        for labels, value in sorted(samples):
+            lines.append(
+                f"{name}{format_labels(label_names, labels)} {format_value(value)}"
+            )
+        return lines
+
+
+def format_labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    labels = ",".join(
+        f'{name}="{escape_label(value)}"'
+        for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{labels}}}"
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,70 @@
+import datetime
+from collections.abc import Iterable, MutableMapping
+
+from tactill.entities.article import Article
+from tactill.entities.base import BaseEntity
+from tactill.entities.category import Category
+from tactill.entities.tax import Tax
+from tactill.filters import FilterEntity, FilterOperator, format_datetime
+from tactill.index import CatalogIndex
+from tactill.store import CatalogStore
+
+
+class MirrorMixin:
+    def __init__(self, page_size: int = 100, store: CatalogStore | None = None) -> None:
+        self.page_size = page_size
+        self.store = store
+        self.articles = CatalogIndex()
+        self.categories: dict[str, Category] = {}
+        self.taxes: dict[str, Tax] = {}
+        self.watermarks: dict[str, datetime.datetime] = {}
+
+    def load(self) -> int:
+        if self.store is None:
+            return 0
+
+        self.articles = CatalogIndex(self.store.load(Article))
+        self.categories = {entity.id: entity for entity in self.store.load(Category)}
+        self.taxes = {entity.id: entity for entity in self.store.load(Tax)}
+        self.watermarks = self.store.get_watermarks()
+        return len(self.articles) + len(self.categories) + len(self.taxes)
+
+    def _get_filters(self, resource: str) -> list[FilterEntity] | None:
+        watermark = self.watermarks.get(resource)
+        if watermark is None:
+            return None
+
+        # the entities at the watermark are fetched again, applying them is a no-op
+        return [
+            FilterEntity(
+                field="updated_at",
+                value=format_datetime(watermark),
+                operator=FilterOperator.GTE,
+            )
+        ]
+
+    def _apply[T: BaseEntity](
+        self,
+        resource: str,
+        model: type[T],
+        entities: MutableMapping[str, T],
+        changes: Iterable[T],
+        watermark: datetime.datetime | None,
+    ) -> int:
+        saved: list[T] = []
+        deleted: list[str] = []
+        for entity in changes:
+            if entity.deprecated:
+                if entities.pop(entity.id, None) is not None:
+                    deleted.append(entity.id)
+            elif entities.get(entity.id) != entity:
+                entities[entity.id] = entity
+                saved.append(entity)
+
+        if watermark is not None:
+            self.watermarks[resource] = watermark
+            if self.store is not None:
+                self.store.save(model, saved)
+                self.store.delete(model, deleted)
+                self.store.set_watermark(resource, watermark)
+        return len(saved) + len(deleted)
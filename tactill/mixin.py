@@ -1,27 +1,62 @@
-from collections.abc import Iterator
+import hashlib
+import time
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
+from typing import Any
 
 import httpx
 from httpx import HTTPStatusError
 from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
 
-from tactill.entities.account import Account
+from tactill.cache import CachedResponse
+from tactill.entities.record import Record
 from tactill.exceptions import TactillAPIError, TactillError
 from tactill.filters import FilterEntity, build_filters
-from tactill.types import JsonValue, QueryParams
+from tactill.instrumentation import (
+    DecodeEvent,
+    Observer,
+    RequestTimings,
+    get_endpoint,
+    get_model_name,
+)
+from tactill.query import Document
+from tactill.types import QueryParams
+
+_type_adapters: dict[Any, TypeAdapter[Any]] = {}
+
+
+def get_type_adapter[T](response_model: type[T]) -> TypeAdapter[T]:
+    adapter = _type_adapters.get(response_model)
+    if adapter is None:
+        adapter = _type_adapters[response_model] = TypeAdapter(response_model)
+    return adapter
 
 
 class ClientMixin:
     BASE_URL = "https://api4.tactill.com/v1"
+    observers: Sequence[Observer] = ()
+    _account_key: str
+
+    @staticmethod
+    def _get_account_key(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
 
-    def _get_account(self, headers: dict[str, str]) -> Account:
-        with httpx.Client(headers=headers, timeout=3) as client:
-            with self._handle_response():
-                response = client.get(f"{self.BASE_URL}/account/account")
-                response.raise_for_status()
-                result = response.json()
+    @classmethod
+    def _get_resource_name(cls, url: str) -> str:
+        # e.g. 'catalog/articles/{id}' or 'stock/movements'
+        parts = url.removeprefix(cls.BASE_URL).strip("/").split("/")
+        return parts[1] if len(parts) > 1 else parts[0]
 
-        return self._handle_validation(result, response_model=Account)
+    def _get_cache_key(self, url: str, params: QueryParams | None) -> str:
+        # a cache shared by several clients must not serve one account to another
+        return f"{self._account_key}:{httpx.URL(url, params=params)}"
+
+    @staticmethod
+    def _handle_cached_response(response: CachedResponse) -> bytes:
+        if response.status_code != httpx.codes.OK:
+            raise TactillAPIError(response.content.decode())
+        return response.content
 
     @contextmanager
     def _handle_response(self) -> Iterator[None]:
@@ -33,13 +68,95 @@ class ClientMixin:
             raise TactillError(str(error)) from error
 
     @staticmethod
-    def _handle_validation[T](value: JsonValue, /, response_model: type[T]) -> T:
+    def _handle_validation[T](value: bytes, /, response_model: type[T]) -> T:
         try:
-            adapter = TypeAdapter(response_model)
-            return adapter.validate_python(value)
+            return get_type_adapter(response_model).validate_json(value)
         except ValidationError as error:
             raise TactillAPIError(str(error)) from error
 
+    @staticmethod
+    def _handle_documents(value: bytes, /) -> list[Document]:
+        try:
+            documents: list[Document] = from_json(value)
+        except ValueError as error:
+            raise TactillAPIError(str(error)) from error
+        return documents
+
+    @classmethod
+    def _handle_records[R: Record](
+        cls, value: bytes, /, record_type: type[R]
+    ) -> list[R]:
+        return [record_type(item) for item in cls._handle_documents(value)]
+
+    def validate[T](self, value: bytes, /, response_model: type[T]) -> T:
+        if not self.observers:
+            return self._handle_validation(value, response_model=response_model)
+
+        start = time.perf_counter()
+        result = self._handle_validation(value, response_model=response_model)
+        self._notify_decode(
+            get_model_name(response_model),
+            size=len(value),
+            duration=time.perf_counter() - start,
+            validated=True,
+        )
+        return result
+
+    def validate_records[R: Record](
+        self, value: bytes, /, record_type: type[R]
+    ) -> list[R]:
+        if not self.observers:
+            return self._handle_records(value, record_type=record_type)
+
+        start = time.perf_counter()
+        result = self._handle_records(value, record_type=record_type)
+        self._notify_decode(
+            f"list[{record_type.__name__}]",
+            size=len(value),
+            duration=time.perf_counter() - start,
+            validated=False,
+        )
+        return result
+
+    def _get_endpoint(self, url: str) -> str:
+        return get_endpoint(url.removeprefix(self.BASE_URL).strip("/"))
+
+    def _notify_request_start(self, method: str, url: str) -> None:
+        if self.observers:
+            endpoint = self._get_endpoint(url)
+            for observer in self.observers:
+                observer.on_request_start(method, endpoint)
+
+    def _notify_request(
+        self,
+        method: str,
+        url: str,
+        timings: RequestTimings,
+        cached: bool = False,
+    ) -> None:
+        if self.observers:
+            endpoint = self._get_endpoint(url)
+            event = timings.build_event(method, endpoint=endpoint, cached=cached)
+            for observer in self.observers:
+                observer.on_request(event)
+
+    def _notify_decode(
+        self,
+        model: str,
+        *,
+        size: int,
+        duration: float,
+        validated: bool,
+    ) -> None:
+        event = DecodeEvent(
+            model=model,
+            size=size,
+            duration=duration,
+            validated=validated,
+        )
+        for observer in self.observers:
+            observer.on_decode(event)
+
     @staticmethod
     def _build_params(
         limit: int = 100,
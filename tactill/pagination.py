@@ -0,0 +1,338 @@
+import asyncio
+import datetime
+import itertools
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Sequence,
+)
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Protocol
+
+from tactill.exceptions import TactillError
+from tactill.filters import FilterEntity, FilterOperator, format_datetime
+from tactill.query import (
+    MAX_FILTER_LENGTH,
+    check_offset_pagination,
+    get_filters_length,
+)
+
+# the precision of the API timestamps
+MIN_WINDOW = datetime.timedelta(milliseconds=1)
+
+# e.g. 'fetch_page(start, end, skip)' for the items of [start, end)
+type FetchWindow[T] = Callable[
+    [datetime.datetime, datetime.datetime, int], Coroutine[Any, Any, list[T]]
+]
+
+
+class Keyset(StrEnum):
+    ID = "_id"
+    UPDATED_AT = "updated_at"
+
+    @property
+    def attribute(self) -> str:
+        return "id" if self is Keyset.ID else self.value
+
+    def order(self, order: str | None) -> str:
+        if order is not None and order != self.value:
+            raise TactillError(f"Keyset pagination is ordered by '{self.value}'")
+        return self.value
+
+
+@dataclass(slots=True)
+class KeysetCursor:
+    keyset: Keyset
+    value: object = None
+    # the 'updated_at' values are not unique: the entities at the boundary are
+    # fetched again by 'gte', so they are excluded by id
+    seen: list[str] = field(default_factory=list)
+
+    @property
+    def filters(self) -> list[FilterEntity]:
+        if self.value is None:
+            return []
+        if self.keyset is Keyset.ID:
+            return [
+                FilterEntity(field="_id", value=self.value, operator=FilterOperator.GT)
+            ]
+
+        value = self.value
+        if isinstance(value, datetime.datetime):
+            value = format_datetime(value)
+        filters = [
+            FilterEntity(
+                field=self.keyset.value, value=value, operator=FilterOperator.GTE
+            )
+        ]
+        if self.seen:
+            filters.append(
+                FilterEntity(field="_id", value=self.seen, operator=FilterOperator.NIN)
+            )
+        return filters
+
+    def advance(self, page: list[Any]) -> None:
+        value = getattr(page[-1], self.keyset.attribute)
+        ids = [
+            entity.id
+            for entity in page
+            if getattr(entity, self.keyset.attribute) == value
+        ]
+        if value == self.value:
+            self.seen.extend(ids)
+        else:
+            self.value = value
+            self.seen = ids
+
+        # a split 'nin' would be applied locally and shorten the pages
+        if get_filters_length(self.filters) > MAX_FILTER_LENGTH // 2:
+            raise TactillError(
+                f"Too many entities share the same '{self.keyset.value}', "
+                "use the '_id' keyset"
+            )
+
+
+class Versioned(Protocol):
+    @property
+    def updated_at(self) -> datetime.datetime: ...
+
+
+def get_scan_watermark(
+    watermark: datetime.datetime | None,
+    changes: Sequence[Versioned],
+    deprecated: Sequence[Versioned],
+) -> datetime.datetime | None:
+    # each scan, ordered by 'updated_at', covered the updates up to its last
+    # item; the deprecated scan runs last, so when empty it covered at least as
+    # much as the first one
+    if not changes:
+        # how far the first scan went is unknown
+        return watermark
+
+    covered = max(item.updated_at for item in changes)
+    if deprecated:
+        covered = min(covered, max(item.updated_at for item in deprecated))
+    return covered if watermark is None else max(covered, watermark)
+
+
+def paginate[T](
+    fetch_page: Callable[[int, list[FilterEntity]], list[T]],
+    /,
+    page_size: int,
+    keyset: Keyset | None = None,
+    filters: list[FilterEntity] | None = None,
+) -> Iterator[T]:
+    if keyset is None:
+        check_offset_pagination(filters)
+    skip = 0
+    cursor = KeysetCursor(keyset) if keyset is not None else None
+    while True:
+        page = fetch_page(skip, cursor.filters if cursor is not None else [])
+        yield from page
+        if len(page) < page_size:
+            return
+        if cursor is None:
+            skip += page_size
+        else:
+            cursor.advance(page)
+
+
+async def apaginate[T](
+    fetch_page: Callable[[int, list[FilterEntity]], Awaitable[list[T]]],
+    /,
+    page_size: int,
+    keyset: Keyset | None = None,
+    filters: list[FilterEntity] | None = None,
+) -> AsyncIterator[T]:
+    if keyset is None:
+        check_offset_pagination(filters)
+    skip = 0
+    cursor = KeysetCursor(keyset) if keyset is not None else None
+    while True:
+        page = await fetch_page(skip, cursor.filters if cursor is not None else [])
+        for item in page:
+            yield item
+        if len(page) < page_size:
+            return
+        if cursor is None:
+            skip += page_size
+        else:
+            cursor.advance(page)
+
+
+async def afetch_all[T](
+    fetch_page: Callable[[int], Coroutine[Any, Any, list[T]]],
+    /,
+    page_size: int,
+    concurrency: int,
+    filters: list[FilterEntity] | None = None,
+) -> list[T]:
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    check_offset_pagination(filters)
+
+    pages: dict[int, list[T]] = {}
+    pending: dict[asyncio.Task[list[T]], int] = {}
+    # index of the first short page, no page is launched past it
+    last_index: int | None = None
+    next_index = 0
+
+    try:
+        while True:
+            while last_index is None and len(pending) < concurrency:
+                task = asyncio.create_task(fetch_page(next_index * page_size))
+                pending[task] = next_index
+                next_index += 1
+
+            if last_index is not None:
+                for task, index in list(pending.items()):
+                    if index > last_index:
+                        task.cancel()
+                        del pending[task]
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                page = pages[index] = task.result()
+                if len(page) < page_size and (last_index is None or index < last_index):
+                    last_index = index
+    finally:
+        for task in pending:
+            task.cancel()
+
+    assert last_index is not None
+    return [item for index in range(last_index + 1) for item in pages[index]]
+
+
+@dataclass(slots=True)
+class ScanWindow[T]:
+    start: datetime.datetime
+    end: datetime.datetime
+    task: asyncio.Task[list[T]] | None = None
+    items: list[T] | None = None
+    # paginated with 'skip', when the window is too dense to be split
+    exhaustive: bool = False
+
+
+def split_range(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    window: datetime.timedelta,
+) -> Iterator[tuple[datetime.datetime, datetime.datetime]]:
+    while start < end:
+        yield start, min(start + window, end)
+        start += window
+
+
+async def ascan_windows[T](
+    fetch_page: FetchWindow[T],
+    /,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    window: datetime.timedelta,
+    page_size: int,
+    concurrency: int,
+    key: Callable[[T], datetime.datetime],
+) -> AsyncIterator[T]:
+    # the items of each window are ordered by 'key'
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    if window <= datetime.timedelta(0):
+        raise ValueError("Window must be positive")
+
+    windows = split_range(start, end, window)
+    # the windows in chronological order, a bounded number of them is buffered
+    slots: list[ScanWindow[T]] = []
+    try:
+        while True:
+            slots.extend(
+                ScanWindow(*bounds)
+                for bounds in itertools.islice(
+                    windows, max(2 * concurrency - len(slots), 0)
+                )
+            )
+
+            running = start_windows(slots, concurrency, fetch_page)
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for index, slot in reversed(list(enumerate(slots))):
+                if slot.task in done:
+                    slots[index : index + 1] = process_window(
+                        slot, slot.task.result(), page_size, key, fetch_page
+                    )
+
+            while slots and slots[0].items is not None:
+                for item in slots.pop(0).items or []:
+                    yield item
+    finally:
+        for slot in slots:
+            if slot.task is not None:
+                slot.task.cancel()
+
+
+async def afetch_window[T](
+    fetch_page: FetchWindow[T],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    page_size: int,
+) -> list[T]:
+    items: list[T] = []
+    while True:
+        page = await fetch_page(start, end, len(items))
+        items.extend(page)
+        if len(page) < page_size:
+            return items
+
+
+def start_windows[T](
+    slots: list[ScanWindow[T]],
+    concurrency: int,
+    fetch_page: FetchWindow[T],
+) -> list[asyncio.Task[list[T]]]:
+    running = [slot.task for slot in slots if slot.task is not None]
+    for slot in slots:
+        if len(running) >= concurrency:
+            break
+        if slot.task is None and slot.items is None:
+            slot.task = asyncio.create_task(fetch_page(slot.start, slot.end, 0))
+            running.append(slot.task)
+    return running
+
+
+def process_window[T](
+    slot: ScanWindow[T],
+    page: list[T],
+    page_size: int,
+    key: Callable[[T], datetime.datetime],
+    fetch_page: FetchWindow[T],
+) -> list[ScanWindow[T]]:
+    slot.task = None
+    if slot.exhaustive or len(page) < page_size:
+        slot.items = page
+        return [slot]
+
+    # a full page: its items before the last timestamp are complete,
+    # the rest of the window is split in two
+    boundary = key(page[-1])
+    if boundary <= slot.start:
+        slot.exhaustive = True
+        slot.task = asyncio.create_task(
+            afetch_window(fetch_page, slot.start, slot.end, page_size)
+        )
+        return [slot]
+
+    slot.items = [item for item in page if key(item) < boundary]
+    remainder = slot.end - boundary
+    if remainder < 2 * MIN_WINDOW:
+        return [slot, ScanWindow(boundary, slot.end)]
+    middle = boundary + remainder / 2
+    return [slot, ScanWindow(boundary, middle), ScanWindow(middle, slot.end)]
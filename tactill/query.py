@@ -0,0 +1,165 @@
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any
+from urllib.parse import quote
+
+from pydantic_core import to_json
+
+from tactill.exceptions import TactillError
+from tactill.filters import FilterEntity, FilterOperator, build_filters
+
+type Document = dict[str, Any]
+
+# a conservative length for the encoded 'filter' param and the largest page
+MAX_FILTER_LENGTH = 6144
+MAX_PAGE_SIZE = 1000
+
+LIST_OPERATORS = {FilterOperator.IN, FilterOperator.NIN}
+# each page of a split query would fetch 'skip + limit' documents per sub-query
+SPLIT_QUERY_SKIP = (
+    "Filters split into sub-queries cannot be paginated with 'skip', use a keyset"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SplitQuery:
+    # the results of the sub-queries are merged, then 'excluded' is applied locally
+    filters: list[list[FilterEntity]]
+    excluded: dict[str, frozenset[Any]]
+
+    def keep(self, documents: list[Document]) -> list[Document]:
+        return [
+            document
+            for document in documents
+            if not any(
+                values.intersection(get_values(document, field))
+                for field, values in self.excluded.items()
+            )
+        ]
+
+
+def get_filters_length(filters: list[FilterEntity]) -> int:
+    return len(quote(build_filters(filters), safe=""))
+
+
+def chunk_values[V](
+    values: Iterable[V],
+    /,
+    max_size: int,
+    field: str = "_id",
+    operator: FilterOperator = FilterOperator.IN,
+    max_length: int = MAX_FILTER_LENGTH,
+) -> list[list[V]]:
+    chunks: list[list[V]] = []
+    chunk: list[V] = []
+    length = 0
+    for value in dict.fromkeys(values):
+        value_length = len(quote(f"&{field}{operator}={value}", safe=""))
+        if chunk and (len(chunk) >= max_size or length + value_length > max_length):
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+        chunk.append(value)
+        length += value_length
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def split_query(
+    filters: list[FilterEntity] | None,
+    max_length: int = MAX_FILTER_LENGTH,
+) -> SplitQuery | None:
+    if not filters or get_filters_length(filters) <= max_length:
+        return None
+
+    scalar_filters = [flt for flt in filters if flt.operator not in LIST_OPERATORS]
+    list_filters = [flt for flt in filters if flt.operator in LIST_OPERATORS]
+    budget = max_length - get_filters_length(scalar_filters)
+    if not list_filters or budget <= 0:
+        raise TactillError("Filters exceed the maximum query length")
+
+    chunked_filters: list[list[FilterEntity]] = []
+    excluded: dict[str, set[Any]] = {}
+    for flt in list_filters:
+        chunks = chunk_values(
+            flt.value,
+            max_size=len(flt.value),
+            field=flt.field,
+            operator=flt.operator,
+            max_length=budget // len(list_filters),
+        )
+        if flt.operator == FilterOperator.IN:
+            # a union of the sub-queries
+            chunked_filters.append(
+                [flt.model_copy(update={"value": chunk}) for chunk in chunks]
+            )
+        else:
+            # the first values are excluded server-side, the others locally
+            chunked_filters.append([flt.model_copy(update={"value": chunks[0]})])
+            excluded.setdefault(flt.field, set()).update(
+                itertools.chain.from_iterable(chunks[1:])
+            )
+
+    return SplitQuery(
+        filters=[
+            [*scalar_filters, *combination]
+            for combination in itertools.product(*chunked_filters)
+        ],
+        excluded={field: frozenset(values) for field, values in excluded.items()},
+    )
+
+
+def get_values(document: Document, field: str) -> list[Any]:
+    # dotted fields go through nested documents and lists, e.g. 'movements.article_id'
+    values: list[Any] = [document]
+    for key in field.split("."):
+        values = [
+            item[key]
+            for value in values
+            for item in (value if isinstance(value, list) else [value])
+            if isinstance(item, dict) and key in item
+        ]
+    return [
+        item
+        for value in values
+        for item in (value if isinstance(value, list) else [value])
+    ]
+
+
+def get_sort_value(document: Document, field: str) -> Any:  # noqa: ANN401
+    # the first value, null and missing values sort alike
+    values = get_values(document, field)
+    return values[0] if values else None
+
+
+def merge_pages(
+    pages: list[list[Document]],
+    limit: int,
+    skip: int,
+    order: str | None,
+) -> bytes:
+    # e.g. 'name' or '-updated_at', missing values come last in both directions
+    documents = {document["_id"]: document for page in pages for document in page}
+    field = (order or "_id").removeprefix("-")
+    keyed = [
+        (get_sort_value(document, field), document) for document in documents.values()
+    ]
+    merged = [
+        document
+        for _, document in sorted(
+            ((value, document) for value, document in keyed if value is not None),
+            key=itemgetter(0),
+            reverse=bool(order and order.startswith("-")),
+        )
+    ]
+    merged.extend(document for value, document in keyed if value is None)
+    return to_json(merged[skip : skip + limit])
+
+
+def check_offset_pagination(filters: list[FilterEntity] | None) -> None:
+    if split_query(filters) is not None:
+        raise TactillError(SPLIT_QUERY_SKIP)
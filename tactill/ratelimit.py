@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def reserve(self) -> float:
+        # takes a token, possibly in advance, and returns the time to wait for it
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(-self._tokens / self.rate, 0)
+
+    def try_acquire(self) -> float:
+        # takes a token if one is available, otherwise returns the time until it is
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class RateLimits:
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(self, account_key: str) -> TokenBucket:
+        # one bucket per API key, shared by every client using it
+        with self._lock:
+            bucket = self._buckets.get(account_key)
+            if bucket is None:
+                bucket = self._buckets[account_key] = TokenBucket(
+                    rate=self.rate,
+                    burst=self.burst,
+                )
+            return bucket
@@ -0,0 +1,62 @@
+import datetime
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    max_retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30
+    # total time a single call may spend waiting between its attempts
+    budget: float = 60
+    # POST and PUT are not idempotent, they must be added explicitly
+    methods: frozenset[str] = frozenset({"GET"})
+    status_codes: frozenset[int] = RETRY_STATUS_CODES
+    jitter: Callable[[], float] = field(default=random.random, repr=False)
+
+    def get_delay(
+        self,
+        method: str,
+        attempt: int,
+        waited: float,
+        response: httpx.Response | None = None,
+    ) -> float | None:
+        # 'response' is None when the request failed at the transport level
+        if method not in self.methods or attempt >= self.max_retries:
+            return None
+        if response is not None and response.status_code not in self.status_codes:
+            return None
+
+        delay = self.get_retry_after(response)
+        if delay is None:
+            # exponential backoff with full jitter
+            delay = self.jitter() * min(self.max_backoff, self.backoff * 2**attempt)
+        if waited + delay > self.budget:
+            return None
+        return delay
+
+    @staticmethod
+    def get_retry_after(response: httpx.Response | None) -> float | None:
+        value = response.headers.get("retry-after") if response is not None else None
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except TypeError, ValueError:
+            return None
+        return max((date - datetime.datetime.now(datetime.UTC)).total_seconds(), 0)
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
@@ -0,0 +1,235 @@
+import datetime
+import itertools
+import json
+import sqlite3
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from enum import StrEnum
+from pathlib import Path
+from typing import Self
+
+from tactill.entities.movement import (
+    Movement,
+    MovementRecord,
+    MovementState,
+    MovementType,
+)
+from tactill.filters import as_utc
+
+# the SQLite limit on the number of variables of a statement is 999 on old versions
+MAX_VARIABLES = 500
+WATERMARK_RESOURCE = "rollups"
+
+# (article_id, category_name, day ordinal, type, units) of a done line
+type Line = tuple[str, str, int, str, int]
+# (key type, key, granularity, bucket, type)
+type BucketKey = tuple[str, str, str, str, str]
+
+
+class RollupKey(StrEnum):
+    ARTICLE = "article_id"
+    CATEGORY = "category_name"
+
+
+class Granularity(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+
+    def get_bucket(self, day: datetime.date) -> datetime.date:
+        # weeks start on Monday
+        if self is Granularity.WEEK:
+            return day - datetime.timedelta(days=day.weekday())
+        return day
+
+
+class MovementRollups:
+    # units moved per article and category, by day and week, stored in SQLite
+    def __init__(self, path: str | Path) -> None:
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS rollups ("
+                "key_type TEXT NOT NULL, key TEXT NOT NULL, "
+                "granularity TEXT NOT NULL, bucket TEXT NOT NULL, "
+                "type TEXT NOT NULL, units INTEGER NOT NULL, "
+                "PRIMARY KEY (key_type, granularity, type, key, bucket)"
+                ") WITHOUT ROWID"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS rollups_bucket "
+                "ON rollups (key_type, granularity, type, bucket)"
+            )
+            # the lines of each movement, reverted when the movement changes
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS rollup_movements "
+                "(id TEXT PRIMARY KEY, lines TEXT NOT NULL)"
+            )
+            # shared with the catalog store, when both use the same database
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks "
+                "(resource TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+        row = self.connection.execute(
+            "SELECT value FROM watermarks WHERE resource = ?",
+            (WATERMARK_RESOURCE,),
+        ).fetchone()
+        self.watermark = datetime.datetime.fromisoformat(row[0]) if row else None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def ingest(
+        self,
+        movements: Sequence[Movement | MovementRecord],
+        watermark: datetime.datetime | None = None,
+    ) -> int:
+        # only the buckets touched by the changed movements are written
+        lines: dict[str, list[Line] | None] = dict(
+            self._load_lines([movement.id for movement in movements])
+        )
+        changed: set[str] = set()
+        changes: Counter[BucketKey] = Counter()
+        for movement in movements:
+            previous = lines.get(movement.id)
+            current = None if movement.deprecated else list(get_lines(movement))
+            if current == previous:
+                continue
+
+            for line in previous or []:
+                add_line(changes, line, sign=-1)
+            for line in current or []:
+                add_line(changes, line, sign=1)
+            lines[movement.id] = current
+            changed.add(movement.id)
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key_type, granularity, type, key, bucket) "
+                "DO UPDATE SET units = units + excluded.units",
+                [(*key, units) for key, units in changes.items() if units],
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO rollup_movements VALUES (?, ?)",
+                [
+                    (movement_id, json.dumps(lines[movement_id]))
+                    for movement_id in changed
+                    if lines[movement_id] is not None
+                ],
+            )
+            self.connection.executemany(
+                "DELETE FROM rollup_movements WHERE id = ?",
+                [
+                    (movement_id,)
+                    for movement_id in changed
+                    if lines[movement_id] is None
+                ],
+            )
+            if watermark is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO watermarks VALUES (?, ?)",
+                    (WATERMARK_RESOURCE, watermark.isoformat()),
+                )
+        if watermark is not None:
+            self.watermark = watermark
+        return len(changed)
+
+    def get_series(
+        self,
+        key_type: RollupKey,
+        key: str,
+        granularity: Granularity,
+        start: datetime.date,
+        end: datetime.date,
+        movement_type: MovementType = MovementType.OUT,
+    ) -> dict[datetime.date, int]:
+        # the buckets overlapping [start, end), empty ones are omitted
+        cursor = self.connection.execute(
+            "SELECT bucket, units FROM rollups WHERE key_type = ? AND "
+            "granularity = ? AND type = ? AND key = ? AND bucket >= ? AND bucket < ? "
+            "ORDER BY bucket",
+            (
+                key_type,
+                granularity,
+                movement_type,
+                key,
+                granularity.get_bucket(start).isoformat(),
+                end.isoformat(),
+            ),
+        )
+        return {
+            datetime.date.fromisoformat(bucket): units
+            for bucket, units in cursor
+            if units
+        }
+
+    def get_bucket(
+        self,
+        key_type: RollupKey,
+        granularity: Granularity,
+        day: datetime.date,
+        movement_type: MovementType = MovementType.OUT,
+    ) -> dict[str, int]:
+        # the units of every key in the bucket of 'day', the largest first
+        cursor = self.connection.execute(
+            "SELECT key, units FROM rollups WHERE key_type = ? AND "
+            "granularity = ? AND type = ? AND bucket = ? AND units != 0 "
+            "ORDER BY units DESC, key",
+            (
+                key_type,
+                granularity,
+                movement_type,
+                granularity.get_bucket(day).isoformat(),
+            ),
+        )
+        return dict(cursor.fetchall())
+
+    def _load_lines(self, ids: list[str]) -> dict[str, list[Line]]:
+        lines: dict[str, list[Line]] = {}
+        for chunk in itertools.batched(dict.fromkeys(ids), MAX_VARIABLES, strict=False):
+            cursor = self.connection.execute(
+                "SELECT id, lines FROM rollup_movements "
+                f"WHERE id IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+            for movement_id, value in cursor:
+                lines[movement_id] = [
+                    (article_id, category_name, ordinal, movement_type, units)
+                    for article_id, category_name, ordinal, movement_type, units in (
+                        json.loads(value)
+                    )
+                ]
+        return lines
+
+
+def get_lines(movement: Movement | MovementRecord) -> Iterator[Line]:
+    # only the done lines are counted, on the day they were done
+    for line in movement.movements:
+        if line.state == MovementState.DONE:
+            day = as_utc(line.done_on).astimezone(datetime.UTC).date()
+            yield (
+                line.article_id,
+                line.category_name,
+                day.toordinal(),
+                movement.type,
+                line.units,
+            )
+
+
+def add_line(changes: Counter[BucketKey], line: Line, sign: int) -> None:
+    article_id, category_name, ordinal, movement_type, units = line
+    day = datetime.date.fromordinal(ordinal)
+    for granularity in Granularity:
+        bucket = granularity.get_bucket(day).isoformat()
+        changes[RollupKey.ARTICLE, article_id, granularity, bucket, movement_type] += (
+            sign * units
+        )
+        changes[
+            RollupKey.CATEGORY, category_name, granularity, bucket, movement_type
+        ] += sign * units
@@ -0,0 +1,131 @@
+import datetime
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from types import GenericAlias
+from typing import Any, Self, cast
+
+from tactill.entities.article import Article
+from tactill.entities.base import BaseEntity
+from tactill.entities.category import Category
+from tactill.entities.movement import Movement
+from tactill.entities.tax import Tax
+from tactill.exceptions import TactillError
+from tactill.mixin import get_type_adapter
+
+# queryable columns of each table, the full entity is stored as JSON in 'data'
+TABLES: dict[type[BaseEntity], tuple[str, tuple[str, ...]]] = {
+    Article: ("articles", ("category_id", "barcode", "reference", "name")),
+    Category: ("categories", ("name",)),
+    Tax: ("taxes", ("name",)),
+    Movement: ("movements", ("created_at", "number", "type", "state")),
+}
+
+
+class CatalogStore:
+    def __init__(self, path: str | Path) -> None:
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            for table, columns in TABLES.values():
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "id TEXT PRIMARY KEY, updated_at TEXT NOT NULL, "
+                    f"{''.join(f'{column}, ' for column in columns)}data TEXT NOT NULL)"
+                )
+                for column in columns:
+                    self.connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{column} "
+                        f"ON {table} ({column})"
+                    )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks "
+                "(resource TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def load[T: BaseEntity](self, model: type[T]) -> list[T]:
+        table, _ = self._get_table(model)
+        cursor = self.connection.execute(f"SELECT data FROM {table} ORDER BY id")
+        return self._validate(model, cursor)
+
+    def find[T: BaseEntity](self, model: type[T], **filters: Any) -> list[T]:  # noqa: ANN401 (column values)
+        table, columns = self._get_table(model)
+        for column in filters:
+            if column not in {"id", "updated_at", *columns}:
+                raise TactillError(f"Column '{column}' is not queryable on '{table}'")
+
+        where = " AND ".join(f"{column} = ?" for column in filters) or "1"
+        cursor = self.connection.execute(
+            f"SELECT data FROM {table} WHERE {where} ORDER BY id",
+            tuple(self._to_column(value) for value in filters.values()),
+        )
+        return self._validate(model, cursor)
+
+    def save[T: BaseEntity](self, model: type[T], entities: Iterable[T]) -> None:
+        table, columns = self._get_table(model)
+        placeholders = ", ".join("?" for _ in range(len(columns) + 3))
+        rows = [
+            (
+                entity.id,
+                self._to_column(entity.updated_at),
+                *(self._to_column(getattr(entity, column)) for column in columns),
+                entity.model_dump_json(by_alias=True),
+            )
+            for entity in entities
+        ]
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+                rows,
+            )
+
+    def delete[T: BaseEntity](self, model: type[T], ids: Iterable[str]) -> None:
+        table, _ = self._get_table(model)
+        with self.connection:
+            self.connection.executemany(
+                f"DELETE FROM {table} WHERE id = ?",
+                [(entity_id,) for entity_id in ids],
+            )
+
+    def get_watermarks(self) -> dict[str, datetime.datetime]:
+        cursor = self.connection.execute("SELECT resource, value FROM watermarks")
+        return {
+            resource: datetime.datetime.fromisoformat(value)
+            for resource, value in cursor
+        }
+
+    def set_watermark(self, resource: str, value: datetime.datetime) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?)",
+                (resource, value.isoformat()),
+            )
+
+    @staticmethod
+    def _get_table(model: type[BaseEntity]) -> tuple[str, tuple[str, ...]]:
+        try:
+            return TABLES[model]
+        except KeyError:
+            raise TactillError(f"'{model.__name__}' cannot be stored") from None
+
+    @staticmethod
+    def _to_column(value: Any) -> Any:  # noqa: ANN401 (column values)
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+        return value
+
+    @staticmethod
+    def _validate[T](model: type[T], cursor: sqlite3.Cursor) -> list[T]:
+        # a single validation pass over a JSON array of all the rows
+        content = f"[{','.join(data for (data,) in cursor)}]"
+        # 'list[model]' is not a valid type form for the type checkers
+        response_model = cast("type[list[T]]", GenericAlias(list, (model,)))
+        return get_type_adapter(response_model).validate_json(content)
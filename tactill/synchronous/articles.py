@@ -1,10 +1,19 @@
 import typing
+from collections.abc import Iterator, Sequence
 
-from tactill.entities.article import Article, ArticleCreate, ArticleUpdate
+from tactill.bulk import BulkResult, run_bulk
+from tactill.entities.article import (
+    Article,
+    ArticleCreate,
+    ArticleRecord,
+    ArticleUpdate,
+)
 from tactill.entities.base import TactillUUID
 from tactill.entities.response import TactillResponse
 from tactill.filters import FilterEntity, FilterOperator
+from tactill.lookup import LookupResult, build_id_filters, chunk_ids, collect
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, paginate
 
 if typing.TYPE_CHECKING:
     from tactill.synchronous.base import TactillClient
@@ -23,16 +32,79 @@ class ArticlesResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Article]:
-        params = self._build_params(
+        response = self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"node_id": self.client.account.node_id},
         )
-        response = self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Article])
+        return self.client.validate(response, response_model=list[Article])
+
+    def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[ArticleRecord]:
+        response = self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate_records(response, record_type=ArticleRecord)
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[Article]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def iter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[ArticleRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
 
     def get_by_category(
         self,
@@ -61,13 +133,29 @@ class ArticlesResource(ClientMixin):
 
     def get(self, article_id: TactillUUID) -> Article:
         response = self.client.request("GET", f"{self.base_url}/{article_id}")
-        return self._handle_validation(response, response_model=Article)
+        return self.client.validate(response, response_model=Article)
+
+    def get_many(
+        self,
+        ids: Sequence[TactillUUID],
+        deprecated: bool = False,
+    ) -> LookupResult[Article]:
+        articles = [
+            article
+            for chunk in chunk_ids(ids)
+            for article in self.get_all(
+                limit=len(chunk),
+                filters=build_id_filters(chunk),
+                deprecated=deprecated,
+            )
+        ]
+        return collect(ids, articles)
 
     def create(self, data: ArticleCreate) -> Article:
         json = data.model_dump(exclude_none=True)
         json["node_id"] = self.client.account.node_id
         response = self.client.request("POST", self.base_url, json=json)
-        return self._handle_validation(response, response_model=Article)
+        return self.client.validate(response, response_model=Article)
 
     def update(
         self,
@@ -80,4 +168,40 @@ class ArticlesResource(ClientMixin):
             f"{self.base_url}/{article_id}",
             json=json,
         )
-        return self._handle_validation(response, response_model=TactillResponse)
+        return self.client.validate(response, response_model=TactillResponse)
+
+    def bulk_create(
+        self,
+        data: Sequence[ArticleCreate],
+        max_workers: int = 10,
+    ) -> BulkResult[Article]:
+        return run_bulk(self.create, data, max_workers=max_workers)
+
+    def bulk_update(
+        self,
+        data: Sequence[tuple[TactillUUID, ArticleUpdate]],
+        max_workers: int = 10,
+    ) -> BulkResult[TactillResponse]:
+        return run_bulk(
+            lambda item: self.update(*item),
+            data,
+            max_workers=max_workers,
+        )
+
+    def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        return self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"node_id": self.client.account.node_id},
+        )
@@ -1,8 +1,24 @@
-from typing import cast
+import time
+from collections.abc import MutableMapping, Sequence
 
 import httpx
 
+from tactill.cache import ResponseCache
+from tactill.entities.account import Account
+from tactill.exceptions import TactillError
+from tactill.filters import FilterEntity
+from tactill.instrumentation import Observer, RequestTimings
 from tactill.mixin import ClientMixin
+from tactill.query import (
+    MAX_PAGE_SIZE,
+    SPLIT_QUERY_SKIP,
+    Document,
+    SplitQuery,
+    merge_pages,
+    split_query,
+)
+from tactill.ratelimit import RateLimits
+from tactill.retry import NO_RETRY, RetryPolicy
 from tactill.synchronous.articles import ArticlesResource
 from tactill.synchronous.categories import CategoriesResource
 from tactill.synchronous.movements import MovementsResource
@@ -11,16 +27,51 @@ from tactill.types import JsonValue, QueryParams
 
 
 class TactillClient(ClientMixin):
-    def __init__(self, api_key: str, http_client: httpx.Client) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        http_client: httpx.Client,
+        account_cache: MutableMapping[str, Account] | None = None,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limits: RateLimits | None = None,
+        observers: Sequence[Observer] = (),
+    ) -> None:
         self._http_client = http_client
+        self.cache = cache
+        self.retry = retry or NO_RETRY
+        self.observers = list(observers)
+        self._account_cache = account_cache
+        self._account_key = self._get_account_key(api_key)
+        self._account: Account | None = None
         self.headers = {"x-api-key": api_key}
-        self.account = self._get_account(headers=self.headers)
+        self.rate_limiter = (
+            rate_limits.get(self._account_key) if rate_limits is not None else None
+        )
 
         self.articles = ArticlesResource(self)
         self.categories = CategoriesResource(self)
         self.taxes = TaxesResource(self)
         self.movements = MovementsResource(self)
 
+    @property
+    def account(self) -> Account:
+        if self._account is None:
+            self._account = self._resolve_account()
+        return self._account
+
+    def _resolve_account(self) -> Account:
+        if self._account_cache is not None:
+            account = self._account_cache.get(self._account_key)
+            if account is not None:
+                return account
+
+        response = self.request("GET", f"{self.BASE_URL}/account/account")
+        account = self.validate(response, response_model=Account)
+        if self._account_cache is not None:
+            self._account_cache[self._account_key] = account
+        return account
+
     def request(
         self,
         method: str,
@@ -28,14 +79,148 @@ class TactillClient(ClientMixin):
         *,
         params: QueryParams | None = None,
         json: JsonValue | None = None,
-    ) -> JsonValue:
-        with self._handle_response():
-            response = self._http_client.request(
-                method,
+    ) -> bytes:
+        timings = RequestTimings()
+        # the keys are only built when there is a cache to look them up in
+        resource = cache_key = ""
+        if self.cache is not None:
+            resource = self._get_resource_name(url)
+            if method == "GET":
+                cache_key = self._get_cache_key(url, params)
+                cached_response = self.cache.get(resource, cache_key)
+                if cached_response is not None:
+                    self._notify_request(
+                        method,
+                        url,
+                        RequestTimings(
+                            status_code=cached_response.status_code,
+                            size=len(cached_response.content),
+                        ),
+                        cached=True,
+                    )
+                    return self._handle_cached_response(cached_response)
+                timings.cache_miss = self.cache.is_cacheable(resource)
+
+        self._notify_request_start(method, url)
+        try:
+            with self._handle_response():
+                response = self._send(
+                    method, url, params=params, json=json, timings=timings
+                )
+                timings.status_code = response.status_code
+                timings.size = len(response.content)
+                if self.cache is not None:
+                    self.cache.update(method, resource, cache_key, response)
+                response.raise_for_status()
+                return response.content
+        finally:
+            self._notify_request(method, url, timings)
+
+    def get_page(
+        self,
+        url: str,
+        *,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+        extra_params: QueryParams,
+    ) -> bytes:
+        split = split_query(filters)
+        if split is None:
+            params = self._build_params(
+                limit=limit,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+                extra_params=extra_params,
+            )
+            return self.request("GET", url, params=params)
+
+        if skip:
+            raise TactillError(SPLIT_QUERY_SKIP)
+        pages = [
+            self._get_documents(
                 url,
-                params=params,
-                json=json,
-                headers=self.headers,
+                split=split,
+                filters=query_filters,
+                size=limit,
+                order=order,
+                deprecated=deprecated,
+                extra_params=extra_params,
             )
-            response.raise_for_status()
-            return cast(JsonValue, response.json())
+            for query_filters in split.filters
+        ]
+        return merge_pages(list(pages), limit=limit, skip=0, order=order)
+
+    def _get_documents(
+        self,
+        url: str,
+        *,
+        split: SplitQuery,
+        filters: list[FilterEntity],
+        size: int,
+        order: str | None,
+        deprecated: bool,
+        extra_params: QueryParams,
+    ) -> list[Document]:
+        page_size = min(size, MAX_PAGE_SIZE)
+        documents: list[Document] = []
+        skip = 0
+        while True:
+            params = self._build_params(
+                limit=page_size,
+                skip=skip,
+                filters=filters,
+                order=order,
+                deprecated=deprecated,
+                extra_params=extra_params,
+            )
+            page = self._handle_documents(self.request("GET", url, params=params))
+            documents.extend(split.keep(page))
+            if len(page) < page_size or len(documents) >= size:
+                return documents
+            skip += page_size
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: QueryParams | None,
+        json: JsonValue | None,
+        timings: RequestTimings,
+    ) -> httpx.Response:
+        attempt = 0
+        waited = 0.0
+        while True:
+            queued_at = time.perf_counter()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            sent_at = time.perf_counter()
+            timings.queue_time += sent_at - queued_at
+            try:
+                response = self._http_client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=self.headers,
+                )
+            except httpx.TransportError:
+                timings.network_time += time.perf_counter() - sent_at
+                delay = self.retry.get_delay(method, attempt, waited)
+                if delay is None:
+                    raise
+            else:
+                timings.network_time += time.perf_counter() - sent_at
+                delay = self.retry.get_delay(method, attempt, waited, response)
+                if delay is None:
+                    return response
+
+            time.sleep(delay)
+            attempt += 1
+            timings.retries = attempt
+            waited += delay
@@ -1,10 +1,19 @@
 import typing
+from collections.abc import Iterator, Sequence
 
+from tactill.bulk import BulkResult, run_bulk
 from tactill.entities.base import TactillUUID
-from tactill.entities.category import Category, CategoryCreate, CategoryUpdate
+from tactill.entities.category import (
+    Category,
+    CategoryCreate,
+    CategoryRecord,
+    CategoryUpdate,
+)
 from tactill.entities.response import TactillResponse
 from tactill.filters import FilterEntity
+from tactill.lookup import LookupResult, build_id_filters, chunk_ids, collect
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, paginate
 
 if typing.TYPE_CHECKING:
     from tactill.synchronous.base import TactillClient
@@ -23,26 +32,105 @@ class CategoriesResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Category]:
-        params = self._build_params(
+        response = self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"company_id": self.client.account.company_id},
         )
-        response = self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Category])
+        return self.client.validate(response, response_model=list[Category])
+
+    def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[CategoryRecord]:
+        response = self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate_records(response, record_type=CategoryRecord)
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[Category]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def iter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[CategoryRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
 
     def get(self, category_id: TactillUUID) -> Category:
         response = self.client.request("GET", f"{self.base_url}/{category_id}")
-        return self._handle_validation(response, response_model=Category)
+        return self.client.validate(response, response_model=Category)
+
+    def get_many(
+        self,
+        ids: Sequence[TactillUUID],
+        deprecated: bool = False,
+    ) -> LookupResult[Category]:
+        categories = [
+            category
+            for chunk in chunk_ids(ids)
+            for category in self.get_all(
+                limit=len(chunk),
+                filters=build_id_filters(chunk),
+                deprecated=deprecated,
+            )
+        ]
+        return collect(ids, categories)
 
     def create(self, data: CategoryCreate) -> Category:
         json = data.model_dump(exclude_none=True)
         json["company_id"] = self.client.account.company_id
         response = self.client.request("POST", self.base_url, json=json)
-        return self._handle_validation(response, response_model=Category)
+        return self.client.validate(response, response_model=Category)
 
     def update(
         self,
@@ -55,4 +143,40 @@ class CategoriesResource(ClientMixin):
             f"{self.base_url}/{category_id}",
             json=json,
         )
-        return self._handle_validation(response, response_model=TactillResponse)
+        return self.client.validate(response, response_model=TactillResponse)
+
+    def bulk_create(
+        self,
+        data: Sequence[CategoryCreate],
+        max_workers: int = 10,
+    ) -> BulkResult[Category]:
+        return run_bulk(self.create, data, max_workers=max_workers)
+
+    def bulk_update(
+        self,
+        data: Sequence[tuple[TactillUUID, CategoryUpdate]],
+        max_workers: int = 10,
+    ) -> BulkResult[TactillResponse]:
+        return run_bulk(
+            lambda item: self.update(*item),
+            data,
+            max_workers=max_workers,
+        )
+
+    def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        return self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"company_id": self.client.account.company_id},
+        )
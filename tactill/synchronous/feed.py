@@ -0,0 +1,54 @@
+import typing
+
+from tactill.feed import MovementConsumer, MovementFeedMixin
+from tactill.pagination import Keyset, get_scan_watermark
+
+if typing.TYPE_CHECKING:
+    from tactill.synchronous.base import TactillClient
+
+
+class MovementFeed(MovementFeedMixin):
+    def __init__(
+        self,
+        client: TactillClient,
+        consumer: MovementConsumer,
+        page_size: int = 100,
+    ) -> None:
+        super().__init__(consumer=consumer, page_size=page_size)
+        self.client = client
+
+    def refresh(self) -> int:
+        movements = self.client.movements
+        filters = self._get_filters()
+        if filters is None:
+            # the updates made during the full load are fetched again next time
+            latest = next(
+                movements.iter_records(page_size=1, order="-updated_at"), None
+            )
+            changes = list(
+                movements.iter_records(
+                    page_size=self.page_size,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            )
+            watermark = latest.updated_at if latest is not None else None
+        else:
+            changes = list(
+                movements.iter_records(
+                    page_size=self.page_size,
+                    filters=filters,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            )
+            # deprecated movements only matter once there is something to revert
+            deprecated = list(
+                movements.iter_records(
+                    page_size=self.page_size,
+                    filters=filters,
+                    deprecated=True,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            )
+            watermark = get_scan_watermark(self.consumer.watermark, changes, deprecated)
+            changes.extend(deprecated)
+        return self.consumer.ingest(changes, watermark=watermark)
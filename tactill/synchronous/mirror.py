@@ -0,0 +1,73 @@
+import typing
+from collections.abc import Callable, Iterator, MutableMapping
+
+from tactill.entities.article import Article
+from tactill.entities.base import BaseEntity
+from tactill.entities.category import Category
+from tactill.entities.tax import Tax
+from tactill.mirror import MirrorMixin
+from tactill.pagination import Keyset, get_scan_watermark
+from tactill.store import CatalogStore
+
+if typing.TYPE_CHECKING:
+    from tactill.synchronous.base import TactillClient
+
+
+class CatalogMirror(MirrorMixin):
+    def __init__(
+        self,
+        client: TactillClient,
+        page_size: int = 100,
+        store: CatalogStore | None = None,
+    ) -> None:
+        super().__init__(page_size=page_size, store=store)
+        self.client = client
+
+    def refresh(self) -> int:
+        return (
+            self._refresh(
+                "articles", Article, self.articles, self.client.articles.iter_all
+            )
+            + self._refresh(
+                "categories",
+                Category,
+                self.categories,
+                self.client.categories.iter_all,
+            )
+            + self._refresh("taxes", Tax, self.taxes, self.client.taxes.iter_all)
+        )
+
+    def _refresh[T: BaseEntity](
+        self,
+        resource: str,
+        model: type[T],
+        entities: MutableMapping[str, T],
+        iter_all: Callable[..., Iterator[T]],
+    ) -> int:
+        filters = self._get_filters(resource)
+        if filters is None:
+            # the updates made during the full load are fetched again next time
+            latest = next(iter_all(page_size=1, order="-updated_at"), None)
+            changes = list(iter_all(page_size=self.page_size, keyset=Keyset.UPDATED_AT))
+            watermark = latest.updated_at if latest is not None else None
+        else:
+            changes = list(
+                iter_all(
+                    page_size=self.page_size,
+                    filters=filters,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            )
+            deprecated = list(
+                iter_all(
+                    page_size=self.page_size,
+                    filters=filters,
+                    deprecated=True,
+                    keyset=Keyset.UPDATED_AT,
+                )
+            )
+            watermark = get_scan_watermark(
+                self.watermarks.get(resource), changes, deprecated
+            )
+            changes.extend(deprecated)
+        return self._apply(resource, model, entities, changes, watermark)
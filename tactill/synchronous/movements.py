@@ -1,8 +1,10 @@
 import typing
+from collections.abc import Iterator
 
-from tactill.entities.movement import Movement, MovementCreate
+from tactill.entities.movement import Movement, MovementCreate, MovementRecord
 from tactill.filters import FilterEntity
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, paginate
 
 if typing.TYPE_CHECKING:
     from tactill.synchronous.base import TactillClient
@@ -21,19 +23,100 @@ class MovementsResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Movement]:
-        params = self._build_params(
+        response = self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate(response, response_model=list[Movement])
+
+    def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[MovementRecord]:
+        response = self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"shop_id": self.client.account.shop_id},
         )
-        response = self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Movement])
+        return self.client.validate_records(response, record_type=MovementRecord)
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[Movement]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def iter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[MovementRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
 
     def create(self, data: MovementCreate) -> Movement:
         json = data.model_dump(mode="json", exclude_none=True)
         json["shop_id"] = self.client.account.shop_id
         response = self.client.request("POST", self.base_url, json=json)
-        return self._handle_validation(response, response_model=Movement)
+        return self.client.validate(response, response_model=Movement)
+
+    def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        return self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"shop_id": self.client.account.shop_id},
+        )
@@ -1,9 +1,12 @@
 import typing
+from collections.abc import Iterator, Sequence
 
 from tactill.entities.base import TactillUUID
-from tactill.entities.tax import Tax
+from tactill.entities.tax import Tax, TaxRecord
 from tactill.filters import FilterEntity
+from tactill.lookup import LookupResult, build_id_filters, chunk_ids, collect
 from tactill.mixin import ClientMixin
+from tactill.pagination import Keyset, paginate
 
 if typing.TYPE_CHECKING:
     from tactill.synchronous.base import TactillClient
@@ -22,17 +25,114 @@ class TaxesResource(ClientMixin):
         order: str | None = None,
         deprecated: bool = False,
     ) -> list[Tax]:
-        params = self._build_params(
+        response = self._get_page(
             limit=limit,
             skip=skip,
             filters=filters,
             order=order,
             deprecated=deprecated,
-            extra_params={"company_id": self.client.account.company_id},
         )
-        response = self.client.request("GET", self.base_url, params=params)
-        return self._handle_validation(response, response_model=list[Tax])
+        return self.client.validate(response, response_model=list[Tax])
+
+    def get_records(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+    ) -> list[TaxRecord]:
+        response = self._get_page(
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+        )
+        return self.client.validate_records(response, record_type=TaxRecord)
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[Tax]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_all(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
+
+    def iter_records(
+        self,
+        page_size: int = 100,
+        filters: list[FilterEntity] | None = None,
+        order: str | None = None,
+        deprecated: bool = False,
+        keyset: Keyset | None = None,
+    ) -> Iterator[TaxRecord]:
+        if keyset is not None:
+            order = keyset.order(order)
+
+        return paginate(
+            lambda skip, keyset_filters: self.get_records(
+                limit=page_size,
+                skip=skip,
+                filters=[*(filters or []), *keyset_filters],
+                order=order,
+                deprecated=deprecated,
+            ),
+            page_size=page_size,
+            keyset=keyset,
+            filters=filters,
+        )
 
     def get(self, tax_id: TactillUUID) -> Tax:
         response = self.client.request("GET", f"{self.base_url}/{tax_id}")
-        return self._handle_validation(response, response_model=Tax)
+        return self.client.validate(response, response_model=Tax)
+
+    def get_many(
+        self,
+        ids: Sequence[TactillUUID],
+        deprecated: bool = False,
+    ) -> LookupResult[Tax]:
+        taxes = [
+            tax
+            for chunk in chunk_ids(ids)
+            for tax in self.get_all(
+                limit=len(chunk),
+                filters=build_id_filters(chunk),
+                deprecated=deprecated,
+            )
+        ]
+        return collect(ids, taxes)
+
+    def _get_page(
+        self,
+        limit: int,
+        skip: int,
+        filters: list[FilterEntity] | None,
+        order: str | None,
+        deprecated: bool,
+    ) -> bytes:
+        return self.client.get_page(
+            self.base_url,
+            limit=limit,
+            skip=skip,
+            filters=filters,
+            order=order,
+            deprecated=deprecated,
+            extra_params={"company_id": self.client.account.company_id},
+        )
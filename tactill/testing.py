@@ -0,0 +1,295 @@
+import asyncio
+import bisect
+import datetime
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from operator import ge, gt, itemgetter, le, lt
+from typing import Any
+from urllib.parse import parse_qsl
+
+import httpx
+from pydantic_core import to_json
+
+from tactill.filters import format_datetime
+from tactill.query import Document, get_sort_value, get_values
+from tactill.ratelimit import RateLimits
+
+ACCOUNT: Document = {
+    "nodes": ["6a202c6cbcfe5255c24e1890"],
+    "companies": ["6a202c6cbcfe5255c24e1891"],
+    "shops": ["6a202c6cbcfe5255c24e1892"],
+}
+RESOURCES = {
+    "catalog/articles": "articles",
+    "catalog/categories": "categories",
+    "catalog/taxes": "taxes",
+    "stock/movements": "movements",
+}
+UPDATED = {"statusCode": 200, "error": "", "message": "successfully updated"}
+DEFAULT_LIMIT = 100
+
+COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "gt": gt,
+    "gte": ge,
+    "lt": lt,
+    "lte": le,
+}
+OPERATORS = {"", "ne", "in", "nin", *COMPARISONS}
+
+type Conditions = dict[tuple[str, str], list[str]]
+
+
+class FakeTactillServer:
+    # an in-process stand-in for the Tactill API, served through httpx.MockTransport
+    def __init__(
+        self,
+        collections: dict[str, list[Document]] | None = None,
+        *,
+        account: Document = ACCOUNT,
+        latency: float = 0,
+        error_rate: float = 0,
+        rate_limits: RateLimits | None = None,
+        seed: int | None = None,
+    ) -> None:
+        # the collections are kept in '_id' order, as ObjectIds are increasing
+        self.collections: dict[str, list[Document]] = {
+            name: [] for name in RESOURCES.values()
+        } | (collections or {})
+        self.account = account
+        self.latency = latency
+        self.error_rate = error_rate
+        # 429 responses once an API key exceeds its rate
+        self.rate_limits = rate_limits
+        self.requests: list[httpx.Request] = []
+        self.status_codes: Counter[int] = Counter()
+        self.failures: list[httpx.Response] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def fail_next(self, *responses: httpx.Response) -> None:
+        # returned, in order, by the next requests
+        with self._lock:
+            self.failures.extend(responses)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        response = self._reject(request)
+        if response is None:
+            self._start()
+            try:
+                if self.latency:
+                    time.sleep(self.latency)
+                response = self._respond(request)
+            finally:
+                self._stop()
+        return self._record(response)
+
+    async def ahandler(self, request: httpx.Request) -> httpx.Response:
+        response = self._reject(request)
+        if response is None:
+            self._start()
+            try:
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                response = self._respond(request)
+            finally:
+                self._stop()
+        return self._record(response)
+
+    def route(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.removeprefix("/v1/").strip("/").split("/")
+        if parts == ["account", "account"]:
+            return httpx.Response(200, json=self.account)
+
+        name = RESOURCES.get("/".join(parts[:2]))
+        if name is None or len(parts) > 3:  # noqa: PLR2004 (/{group}/{resource}/{id})
+            return httpx.Response(404, text="not found")
+
+        documents = self.collections[name]
+        if len(parts) == 3:  # noqa: PLR2004
+            return self.handle_document(request, documents, parts[2])
+        if request.method == "POST":
+            return self.create(documents, json.loads(request.content))
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                content=to_json(self.query(documents, request.url.params)),
+                headers={"content-type": "application/json"},
+            )
+        return httpx.Response(405, text="method not allowed")
+
+    @staticmethod
+    def handle_document(
+        request: httpx.Request,
+        documents: list[Document],
+        document_id: str,
+    ) -> httpx.Response:
+        index = bisect.bisect_left(documents, document_id, key=itemgetter("_id"))
+        if index == len(documents) or documents[index]["_id"] != document_id:
+            return httpx.Response(404, text="not found")
+
+        document = documents[index]
+        if request.method == "PUT":
+            document.update(json.loads(request.content), updated_at=get_now())
+            return httpx.Response(200, json=UPDATED)
+        if request.method == "GET":
+            return httpx.Response(200, json=document)
+        return httpx.Response(405, text="method not allowed")
+
+    @staticmethod
+    def create(documents: list[Document], data: Document) -> httpx.Response:
+        index = int(documents[-1]["_id"], 16) + 1 if documents else 0
+        document = build_document(index, get_now(), **data)
+        documents.append(document)
+        return httpx.Response(200, json=document)
+
+    @staticmethod
+    def query(documents: list[Document], params: httpx.QueryParams) -> list[Document]:
+        conditions = parse_filter(params.get("filter", ""))
+        order = params.get("order", "_id")
+        start = 0
+        if order == "_id" and ("_id", "gt") in conditions:
+            # keyset pagination is a binary search on the sorted ids
+            start = bisect.bisect_right(
+                documents,
+                max(conditions["_id", "gt"]),
+                key=itemgetter("_id"),
+            )
+
+        matches = [
+            document
+            for document in itertools.islice(documents, start, None)
+            if all(
+                match(document, field, operator, values)
+                for (field, operator), values in conditions.items()
+            )
+        ]
+        if order != "_id":
+            field = order.removeprefix("-")
+            matches.sort(
+                key=lambda document: get_sort_key(document, field),
+                reverse=order.startswith("-"),
+            )
+
+        skip = int(params.get("skip", 0))
+        return matches[skip : skip + int(params.get("limit", DEFAULT_LIMIT))]
+
+    def build_client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self.handler))
+
+    def build_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.ahandler))
+
+    def _reject(self, request: httpx.Request) -> httpx.Response | None:
+        with self._lock:
+            self.requests.append(request)
+            if self.failures:
+                return self.failures.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                return httpx.Response(503, text="service unavailable")
+
+        if self.rate_limits is not None:
+            bucket = self.rate_limits.get(request.headers.get("x-api-key", ""))
+            delay = bucket.try_acquire()
+            if delay > 0:
+                # fractional seconds, to keep the retries of the tests short
+                return httpx.Response(
+                    429,
+                    headers={"retry-after": f"{delay:.3f}"},
+                    text="too many requests",
+                )
+        return None
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            try:
+                return self.route(request)
+            except ValueError as error:
+                return httpx.Response(400, text=str(error))
+
+    def _record(self, response: httpx.Response) -> httpx.Response:
+        with self._lock:
+            self.status_codes[response.status_code] += 1
+        return response
+
+    def _start(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _stop(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+def parse_filter(value: str) -> Conditions:
+    # e.g. 'deprecated=false&_id[in]=a&_id[in]=b', repeated keys are grouped
+    conditions: Conditions = {}
+    for key, raw_value in parse_qsl(value):
+        field, _, operator = key.partition("[")
+        operator = operator.removesuffix("]")
+        if operator not in OPERATORS:
+            raise ValueError(f"Invalid filter operator '{operator}'")
+        conditions.setdefault((field, operator), []).append(raw_value)
+    return conditions
+
+
+def match(document: Document, field: str, operator: str, raw_values: list[str]) -> bool:
+    # a list field matches when any of its values does
+    values = get_values(document, field)
+    if operator in {"", "in"}:
+        return any(is_equal(value, raw) for value in values for raw in raw_values)
+    if operator in {"ne", "nin"}:
+        return not any(is_equal(value, raw) for value in values for raw in raw_values)
+
+    compare = COMPARISONS[operator]
+    try:
+        return any(
+            all(compare(value, parse_value(raw, value)) for raw in raw_values)
+            for value in values
+        )
+    except TypeError:
+        return False
+
+
+def is_equal(value: Any, raw: str) -> bool:  # noqa: ANN401
+    return bool(value == parse_value(raw, value))
+
+
+def parse_value(raw: str, like: Any) -> Any:  # noqa: ANN401
+    # the query values are strings, they are parsed like the document value
+    if isinstance(like, bool):
+        return raw == "true"
+    if isinstance(like, int | float):
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+    if like is None and raw == "null":
+        return None
+    return raw
+
+
+def get_sort_key(document: Document, field: str) -> tuple[bool, Any]:
+    value = get_sort_value(document, field)
+    return value is None, value
+
+
+def get_now() -> str:
+    return format_datetime(datetime.datetime.now(datetime.UTC))
+
+
+def build_document(index: int, updated_at: str, **fields: Any) -> Document:  # noqa: ANN401
+    return {
+        "_id": f"{index:024x}",
+        "deprecated": False,
+        "created_at": updated_at,
+        "updated_at": updated_at,
+        **fields,
+    }
@@ -0,0 +1,61 @@
+import json
+from typing import Any
+
+import httpx
+
+from tactill.query import Document
+from tactill.testing import FakeTactillServer, build_document
+from tests.data import ACCOUNT
+
+
+class FakeAPI(FakeTactillServer):
+    def __init__(self) -> None:
+        super().__init__(account=ACCOUNT)
+
+    def route(self, request: httpx.Request) -> httpx.Response:
+        data = json.loads(request.content) if request.content else {}
+        if data.get("name") == "FAIL":
+            return httpx.Response(400, text="invalid name")
+        return super().route(request)
+
+
+def build_article(index: int, updated_at: str, **fields: Any) -> Document:  # noqa: ANN401
+    article = {
+        "category_id": f"{index % 3:024x}",
+        "taxes": [f"{index % 2:024x}"],
+        "name": f"ARTICLE {index}",
+        "icon_text": "ART",
+        "color": "#57DB47",
+        "in_stock": True,
+    }
+    return build_document(index, updated_at, **(article | fields))
+
+
+def build_category(index: int, updated_at: str, **fields: Any) -> Document:  # noqa: ANN401
+    category = {"name": f"CATEGORY {index}", "icon_text": "CAT", "color": "#57DB47"}
+    return build_document(index, updated_at, **(category | fields))
+
+
+def build_tax(index: int, updated_at: str, **fields: Any) -> Document:  # noqa: ANN401
+    tax = {"name": f"TAX {index}", "rate": 20}
+    return build_document(index, updated_at, **(tax | fields))
+
+
+def build_movement(index: int, updated_at: str, **fields: Any) -> Document:  # noqa: ANN401
+    movement = {
+        "number": index,
+        "type": "in",
+        "state": "done",
+        "motive": "",
+        "movements": [
+            {
+                "article_id": f"{index % 3:024x}",
+                "article_name": f"ARTICLE {index % 3}",
+                "category_name": f"CATEGORY {index % 3}",
+                "state": "done",
+                "units": 1,
+                "done_on": updated_at,
+            }
+        ],
+    }
+    return build_document(index, updated_at, **(movement | fields))
@@ -14,6 +14,27 @@ async def test_get_articles(aclient: AsyncTactillClient) -> None:
         assert result.deprecated is False
 
 
+@pytest.mark.skip_on_ci
+@pytest.mark.asyncio
+async def test_iter_articles(aclient: AsyncTactillClient) -> None:
+    results = [result async for result in aclient.articles.aiter_all(page_size=100)]
+    ids = {result.id for result in results}
+
+    assert len(ids) == len(results)
+    for result in results:
+        assert isinstance(result, Article)
+        assert result.deprecated is False
+
+
+@pytest.mark.skip_on_ci
+@pytest.mark.asyncio
+async def test_fetch_articles(aclient: AsyncTactillClient) -> None:
+    results = await aclient.articles.fetch_all(concurrency=5, page_size=100)
+    expected = [result async for result in aclient.articles.aiter_all(page_size=100)]
+
+    assert [result.id for result in results] == [result.id for result in expected]
+
+
 @pytest.mark.skip_on_ci
 @pytest.mark.asyncio
 async def test_get_article(aclient: AsyncTactillClient) -> None:
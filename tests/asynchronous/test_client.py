@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tactill import AsyncTactillClient
+from tactill.entities.account import Account
+from tactill.exceptions import TactillError
+from tests.data import ACCOUNT
+
+
+def build_http_client(requests: list[httpx.Request]) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0)
+        return httpx.Response(200, json=ACCOUNT)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_create_resolves_account() -> None:
+    requests: list[httpx.Request] = []
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=build_http_client(requests),
+    )
+
+    assert client.account.shop_id == ACCOUNT["shops"][0]
+    assert len(requests) == 1
+    assert requests[0].headers["x-api-key"] == "key"
+
+
+@pytest.mark.asyncio
+async def test_account_is_resolved_once() -> None:
+    requests: list[httpx.Request] = []
+    client = AsyncTactillClient(api_key="key", http_client=build_http_client(requests))
+
+    with pytest.raises(TactillError):
+        _ = client.account
+
+    accounts = await asyncio.gather(*(client.get_account() for _ in range(10)))
+
+    assert {account.node_id for account in accounts} == {ACCOUNT["nodes"][0]}
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_account_cache() -> None:
+    requests: list[httpx.Request] = []
+    account_cache: dict[str, Account] = {}
+
+    for _ in range(3):
+        client = await AsyncTactillClient.create(
+            api_key="key",
+            http_client=build_http_client(requests),
+            account_cache=account_cache,
+        )
+        assert client.account.company_id == ACCOUNT["companies"][0]
+
+    assert len(requests) == 1
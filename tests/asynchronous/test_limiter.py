@@ -0,0 +1,181 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tactill import AdaptiveLimiter, AsyncTactillClient, Priority, request_priority
+from tests.api import FakeAPI, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_validation() -> None:
+    with pytest.raises(ValueError, match="min_limit"):
+        AdaptiveLimiter(min_limit=10, max_limit=5)
+
+
+@pytest.mark.asyncio
+async def test_limiter_additive_increase() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=4, clock=clock)
+
+    for _ in range(50):
+        started_at = [await limiter.acquire() for _ in range(limiter.limit)]
+        clock.now += 0.1
+        for value in started_at:
+            limiter.release(value, dropped=False)
+
+    assert limiter.limit == 4  # noqa: PLR2004
+    assert limiter.baselines == {"": pytest.approx(0.1)}
+
+
+@pytest.mark.asyncio
+async def test_limiter_multiplicative_decrease() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=10, backoff_ratio=0.5, clock=clock)
+    started_at = [await limiter.acquire() for _ in range(10)]
+    clock.now += 0.1
+
+    # a single decrease for all the requests in flight at that time
+    for value in started_at:
+        limiter.release(value, dropped=True)
+    assert limiter.limit == 5  # noqa: PLR2004
+
+    clock.now += 0.1
+    started_at = await limiter.acquire()
+    clock.now += 0.1
+    limiter.release(started_at, dropped=True)
+    assert limiter.limit == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_limiter_latency_decrease() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=10, backoff_ratio=0.5, clock=clock)
+    started_at = await limiter.acquire()
+    clock.now += 0.1
+    limiter.release(started_at, dropped=False)
+
+    started_at = await limiter.acquire()
+    clock.now += 1
+    limiter.release(started_at, dropped=False)
+
+    assert limiter.limit == 5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_limiter_endpoint_baselines() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=10, backoff_ratio=0.5, clock=clock)
+
+    # a slow endpoint is not an overload of a fast one
+    for _ in range(20):
+        for endpoint, latency in [("catalog/taxes", 0.01), ("stock/movements", 1)]:
+            started_at = await limiter.acquire()
+            clock.now += latency
+            limiter.release(started_at, dropped=False, endpoint=endpoint)
+
+    assert limiter.limit == 10  # noqa: PLR2004
+    assert limiter.baselines == {
+        "catalog/taxes": pytest.approx(0.01),
+        "stock/movements": pytest.approx(1),
+    }
+
+    started_at = await limiter.acquire()
+    clock.now += 0.1
+    limiter.release(started_at, dropped=False, endpoint="catalog/taxes")
+    assert limiter.limit == 5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_limiter_waiters() -> None:
+    limiter = AdaptiveLimiter(initial_limit=1)
+    started_at = await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    first.cancel()
+    limiter.release(started_at, dropped=None)
+    await second
+
+    assert first.cancelled()
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_priorities() -> None:
+    limiter = AdaptiveLimiter(initial_limit=1)
+    started_at = await limiter.acquire()
+    order: list[Priority] = []
+
+    async def acquire(priority: Priority) -> None:
+        with request_priority(priority):
+            await limiter.acquire()
+        order.append(priority)
+        limiter.release(started_at, dropped=None)
+
+    priorities = [Priority.BULK, Priority.DEFAULT, Priority.BULK, Priority.INTERACTIVE]
+    tasks = [asyncio.create_task(acquire(priority)) for priority in priorities]
+    await asyncio.sleep(0)
+    limiter.release(started_at, dropped=None)
+    await asyncio.gather(*tasks)
+
+    assert order == sorted(priorities)
+
+
+@pytest.mark.asyncio
+async def test_client_limiter() -> None:
+    api = FakeAPI()
+    api.collections["taxes"] = [build_tax(0, T0)]
+    unavailable = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal unavailable
+        if request.url.path.startswith("/v1/catalog") and unavailable:
+            unavailable = False
+            return httpx.Response(503)
+        return api.handler(request)
+
+    limiter = AdaptiveLimiter(initial_limit=10)
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        limiter=limiter,
+    )
+    await asyncio.gather(
+        *(client.taxes.get_all() for _ in range(5)), return_exceptions=True
+    )
+
+    assert client.limiter is limiter
+    assert limiter.limit < 10  # noqa: PLR2004
+    assert set(limiter.baselines) == {"account/account", "catalog/taxes"}
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_write_limiter() -> None:
+    api = FakeAPI()
+    api.collections["taxes"] = [build_tax(0, T0)]
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+        max_write_concurrency=1,
+    )
+    started_at = await client.write_limiter.acquire()
+
+    # reads are not blocked by a saturated write pool
+    await client.taxes.get_all()
+
+    assert client.write_limiter.limit == 1
+    assert client.write_limiter.in_flight == 1
+    assert client.limiter.in_flight == 0
+    client.write_limiter.release(started_at, dropped=None)
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from tactill import AsyncTactillClient
+from tactill.asynchronous.loader import BatchLoader
+from tactill.entities.article import Article
+from tactill.exceptions import TactillAPIError
+from tactill.lookup import LookupResult
+from tests.api import FakeAPI, build_article, build_category
+
+T0 = "2026-01-01T00:00:00.000Z"
+ARTICLES_COUNT = 150
+DEPRECATED_INDEX = 10
+MISSING_ID = f"{999:024x}"
+
+
+async def build_client(api: FakeAPI) -> AsyncTactillClient:
+    api.collections["articles"] = [
+        build_article(index, T0, deprecated=index == DEPRECATED_INDEX)
+        for index in range(ARTICLES_COUNT)
+    ]
+    api.collections["categories"] = [build_category(index, T0) for index in range(3)]
+    return await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+        batch_window=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_is_batched() -> None:
+    api = FakeAPI()
+    client = await build_client(api)
+    ids = [f"{index % 20:024x}" for index in range(200)]
+
+    articles, category = await asyncio.gather(
+        asyncio.gather(*(client.articles.get(article_id) for article_id in ids)),
+        client.categories.get(f"{1:024x}"),
+    )
+
+    assert [article.id for article in articles] == ids
+    assert category.name == "CATEGORY 1"
+    # account + one batch per resource + the deprecated article
+    paths = [request.url.path for request in api.requests[1:]]
+    assert sorted(paths) == [
+        "/v1/catalog/articles",
+        f"/v1/catalog/articles/{DEPRECATED_INDEX:024x}",
+        "/v1/catalog/categories",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_is_split_by_batch_size() -> None:
+    api = FakeAPI()
+    client = await build_client(api)
+    ids = [f"{index:024x}" for index in range(ARTICLES_COUNT)]
+    ids.remove(f"{DEPRECATED_INDEX:024x}")
+
+    articles = await asyncio.gather(*(client.articles.get(id_) for id_ in ids))
+
+    assert [article.id for article in articles] == ids
+    assert len(api.requests) == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_get_missing() -> None:
+    api = FakeAPI()
+    client = await build_client(api)
+
+    results = await asyncio.gather(
+        client.articles.get(f"{1:024x}"),
+        client.articles.get(MISSING_ID),
+        return_exceptions=True,
+    )
+
+    assert not isinstance(results[0], BaseException)
+    assert results[0].name == "ARTICLE 1"
+    assert isinstance(results[1], TactillAPIError)
+
+
+async def get_one(article_id: str) -> Article:
+    return Article.model_validate(build_article(int(article_id, 16), T0))
+
+
+@pytest.mark.asyncio
+async def test_get_many_error() -> None:
+    async def get_many(ids: list[str]) -> LookupResult[Article]:
+        raise RuntimeError("unexpected")
+
+    loader = BatchLoader(get_many, get_one, window=0.01)
+    results = await asyncio.gather(
+        loader.load(f"{1:024x}"),
+        loader.load(f"{2:024x}"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not loader._futures
+
+
+@pytest.mark.asyncio
+async def test_fetch_cancelled() -> None:
+    started = asyncio.Event()
+
+    async def get_many(ids: list[str]) -> LookupResult[Article]:
+        started.set()
+        await asyncio.Event().wait()
+        raise AssertionError
+
+    loader = BatchLoader(get_many, get_one, window=0.01)
+    load = asyncio.create_task(loader.load(f"{1:024x}"))
+    await started.wait()
+    for task in loader._tasks:
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await load
+    assert not loader._futures
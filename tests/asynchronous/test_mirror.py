@@ -0,0 +1,29 @@
+import pytest
+
+from tactill import AsyncCatalogMirror, AsyncTactillClient
+from tests.api import FakeAPI, build_article, build_category, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+T1 = "2026-01-02T00:00:00.000Z"
+ARTICLES = 25
+CATEGORIES = 3
+TAXES = 2
+
+
+@pytest.mark.asyncio
+async def test_delta_sync() -> None:
+    api = FakeAPI()
+    api.collections["articles"] = [build_article(i, T0) for i in range(ARTICLES)]
+    api.collections["categories"] = [build_category(i, T0) for i in range(CATEGORIES)]
+    api.collections["taxes"] = [build_tax(i, T0) for i in range(TAXES)]
+    client = AsyncTactillClient(api_key="key", http_client=api.build_async_client())
+    mirror = AsyncCatalogMirror(client, page_size=10)
+
+    assert await mirror.refresh() == ARTICLES + CATEGORIES + TAXES
+
+    api.collections["categories"][0] = build_category(0, T1, deprecated=True)
+    api.collections["taxes"][1] = build_tax(1, T1, name="RENAMED")
+
+    assert await mirror.refresh() == 1 + 1
+    assert len(mirror.categories) == CATEGORIES - 1
+    assert mirror.taxes[f"{1:024x}"].name == "RENAMED"
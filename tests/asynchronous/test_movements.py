@@ -2,7 +2,13 @@ import datetime
 
 import pytest
 
-from tactill import AsyncTactillClient, FilterEntity, FilterOperator, TactillUUID
+from tactill import (
+    AsyncTactillClient,
+    FilterEntity,
+    FilterOperator,
+    Keyset,
+    TactillUUID,
+)
 from tactill.entities.movement import (
     ArticleMovement,
     Movement,
@@ -11,6 +17,21 @@ from tactill.entities.movement import (
     MovementState,
     MovementType,
 )
+from tactill.filters import format_datetime
+from tests.api import FakeAPI, build_movement
+
+T0 = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def get_timestamp(minutes: float) -> str:
+    return format_datetime(T0 + datetime.timedelta(minutes=minutes))
+
+
+async def build_client(api: FakeAPI) -> AsyncTactillClient:
+    return await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+    )
 
 
 @pytest.mark.skip_on_ci
@@ -31,6 +52,22 @@ async def test_get_movements(aclient: AsyncTactillClient) -> None:
         assert result.deprecated is False
 
 
+@pytest.mark.skip_on_ci
+@pytest.mark.asyncio
+async def test_iter_movements_keyset(aclient: AsyncTactillClient) -> None:
+    results = [
+        result
+        async for result in aclient.movements.aiter_all(
+            page_size=50,
+            keyset=Keyset.ID,
+        )
+    ]
+
+    ids = [result.id for result in results]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
 @pytest.mark.skip_on_ci
 @pytest.mark.asyncio
 async def test_create_movement(
@@ -59,3 +96,48 @@ async def test_create_movement(
     )
     result = await aclient.movements.create(movement_create)
     assert result
+
+
+@pytest.mark.asyncio
+async def test_scan_range() -> None:
+    api = FakeAPI()
+    # a quiet day, then a dense hour
+    minutes = [*range(0, 24 * 60, 60), *(24 * 60 + index / 10 for index in range(500))]
+    api.collections["movements"] = [
+        build_movement(index, get_timestamp(minute))
+        for index, minute in enumerate(minutes)
+    ]
+    client = await build_client(api)
+
+    movements = [
+        movement
+        async for movement in client.movements.scan_range(
+            start=T0.replace(tzinfo=None),
+            end=T0 + datetime.timedelta(days=3),
+            window=datetime.timedelta(hours=12),
+            concurrency=4,
+            page_size=50,
+        )
+    ]
+
+    assert [movement.number for movement in movements] == list(range(len(minutes)))
+
+
+@pytest.mark.asyncio
+async def test_scan_range_same_timestamp() -> None:
+    api = FakeAPI()
+    api.collections["movements"] = [
+        build_movement(index, get_timestamp(index // 30)) for index in range(90)
+    ]
+    client = await build_client(api)
+
+    movements = [
+        movement
+        async for movement in client.movements.scan_range(
+            start=T0 + datetime.timedelta(minutes=1),
+            end=T0 + datetime.timedelta(minutes=2),
+            page_size=10,
+        )
+    ]
+
+    assert sorted(movement.number for movement in movements) == list(range(30, 60))
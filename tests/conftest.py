@@ -56,5 +56,8 @@ async def ahttp_client() -> AsyncIterator[httpx.AsyncClient]:
 
 @pytest_asyncio.fixture(scope="session")
 async def aclient(ahttp_client: httpx.AsyncClient) -> AsyncTactillClient:
-    client = AsyncTactillClient(api_key=settings.api_key, http_client=ahttp_client)
+    client = await AsyncTactillClient.create(
+        api_key=settings.api_key,
+        http_client=ahttp_client,
+    )
     return client
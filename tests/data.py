@@ -30,3 +30,8 @@ CATEGORIES = [
     "WHISKY",
     "XÉRÈS",
 ]
+ACCOUNT = {
+    "nodes": ["6a202c6cbcfe5255c24e1890"],
+    "companies": ["6a202c6cbcfe5255c24e1891"],
+    "shops": ["6a202c6cbcfe5255c24e1892"],
+}
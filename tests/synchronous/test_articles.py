@@ -13,6 +13,25 @@ def test_get_articles(client: TactillClient) -> None:
         assert result.deprecated is False
 
 
+@pytest.mark.skip_on_ci
+def test_iter_articles(client: TactillClient) -> None:
+    results = [result for result in client.articles.iter_all(page_size=100)]
+    ids = {result.id for result in results}
+
+    assert len(ids) == len(results)
+    for result in results:
+        assert isinstance(result, Article)
+        assert result.deprecated is False
+
+
+@pytest.mark.skip_on_ci
+def test_iter_article_records(client: TactillClient) -> None:
+    records = list(client.articles.iter_records(page_size=100))
+    articles = list(client.articles.iter_all(page_size=100))
+
+    assert [record.id for record in records] == [article.id for article in articles]
+
+
 @pytest.mark.skip_on_ci
 def test_get_article(client: TactillClient) -> None:
     results = client.articles.get_all(limit=1)
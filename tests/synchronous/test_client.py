@@ -0,0 +1,41 @@
+import httpx
+
+from tactill import TactillClient
+from tactill.entities.account import Account
+from tests.data import ACCOUNT
+
+
+def build_http_client(requests: list[httpx.Request]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=ACCOUNT)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_account_is_resolved_lazily() -> None:
+    requests: list[httpx.Request] = []
+    client = TactillClient(api_key="key", http_client=build_http_client(requests))
+
+    assert requests == []
+    assert client.account.shop_id == ACCOUNT["shops"][0]
+    assert client.account.node_id == ACCOUNT["nodes"][0]
+    assert len(requests) == 1
+    assert requests[0].url.path == "/v1/account/account"
+    assert requests[0].headers["x-api-key"] == "key"
+
+
+def test_account_cache() -> None:
+    requests: list[httpx.Request] = []
+    account_cache: dict[str, Account] = {}
+
+    for _ in range(3):
+        client = TactillClient(
+            api_key="key",
+            http_client=build_http_client(requests),
+            account_cache=account_cache,
+        )
+        assert client.account.company_id == ACCOUNT["companies"][0]
+
+    assert len(requests) == 1
+    assert "key" not in account_cache
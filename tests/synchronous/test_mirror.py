@@ -0,0 +1,111 @@
+import datetime
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from tactill import CatalogMirror, TactillClient
+from tests.api import FakeAPI, build_article, build_category, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+T1 = "2026-01-02T00:00:00.000Z"
+ARTICLES = 25
+CATEGORIES = 3
+TAXES = 2
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    api = FakeAPI()
+    api.collections["articles"] = [build_article(i, T0) for i in range(ARTICLES)]
+    api.collections["categories"] = [build_category(i, T0) for i in range(CATEGORIES)]
+    api.collections["taxes"] = [build_tax(i, T0) for i in range(TAXES)]
+    return api
+
+
+@pytest.fixture
+def mirror(api: FakeAPI) -> CatalogMirror:
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    return CatalogMirror(client, page_size=10)
+
+
+def test_full_sync(mirror: CatalogMirror) -> None:
+    assert mirror.refresh() == ARTICLES + CATEGORIES + TAXES
+    assert len(mirror.articles) == ARTICLES
+    assert len(mirror.categories) == CATEGORIES
+    assert len(mirror.taxes) == TAXES
+    assert mirror.watermarks["articles"] == datetime.datetime.fromisoformat(T0)
+
+
+def test_delta_sync(api: FakeAPI, mirror: CatalogMirror) -> None:
+    mirror.refresh()
+    assert mirror.refresh() == 0
+
+    articles = api.collections["articles"]
+    changes = [
+        build_article(0, T1, name="RENAMED"),
+        build_article(1, T1, deprecated=True),
+        build_article(100, T1),
+    ]
+    articles[0], articles[1] = changes[:2]
+    articles.append(changes[2])
+
+    assert mirror.refresh() == len(changes)
+    assert mirror.articles[f"{0:024x}"].name == "RENAMED"
+    assert f"{1:024x}" not in mirror.articles
+    assert f"{100:024x}" in mirror.articles
+    assert len(mirror.articles) == ARTICLES
+    assert mirror.watermarks["articles"] == datetime.datetime.fromisoformat(T1)
+
+
+def test_delta_sync_during_updates() -> None:
+    api = FakeAPI()
+    articles = api.collections["articles"]
+    articles.extend(build_article(index, T0) for index in range(6))
+    actions: dict[str, Callable[[], None]] = {}
+    pages = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal pages
+        if request.url.path == "/v1/catalog/articles" and actions:
+            pages += 1
+            deprecated = "deprecated=true" in request.url.params["filter"]
+            action = actions.pop("deprecated" if deprecated else f"page {pages}", None)
+            if action is not None:
+                action()
+        return api.handler(request)
+
+    client = TactillClient(
+        api_key="key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    mirror = CatalogMirror(client, page_size=2)
+    mirror.refresh()
+
+    for index in range(6):
+        articles[index] = build_article(
+            index, f"2026-01-02T00:00:0{index}.000Z", name=f"A{index}"
+        )
+
+    def deprecate_first() -> None:
+        articles[0] = build_article(0, "2026-01-03T00:00:00.000Z", deprecated=True)
+
+    def update_after_scan() -> None:
+        # after the first scan, before a later deprecation
+        articles[3] = build_article(3, "2026-01-04T00:00:00.000Z", name="B3")
+        articles[4] = build_article(4, "2026-01-05T00:00:00.000Z", deprecated=True)
+
+    actions["page 2"] = deprecate_first
+    actions["deprecated"] = update_after_scan
+    mirror.refresh()
+    assert not actions
+
+    # a refresh never moves the watermark past an update it did not see
+    mirror.refresh()
+    assert {article.id: article.name for article in mirror.articles.values()} == {
+        f"{1:024x}": "A1",
+        f"{2:024x}": "A2",
+        f"{3:024x}": "B3",
+        f"{5:024x}": "A5",
+    }
+    assert mirror.refresh() == 0
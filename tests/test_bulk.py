@@ -0,0 +1,55 @@
+import pytest
+
+from tactill import (
+    AsyncTactillClient,
+    CategoryCreate,
+    CategoryUpdate,
+    TactillClient,
+    TactillColor,
+)
+from tactill.exceptions import TactillAPIError
+from tests.api import FakeAPI, build_category
+
+T0 = "2026-01-01T00:00:00.000Z"
+NAMES = ["A", "B", "FAIL", "C"]
+
+
+def build_creates() -> list[CategoryCreate]:
+    return [
+        CategoryCreate(name=name, icon_text=name, color=TactillColor.GREEN)
+        for name in NAMES
+    ]
+
+
+def test_bulk_create() -> None:
+    api = FakeAPI()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+
+    result = client.categories.bulk_create(build_creates(), max_workers=2)
+
+    assert not result.ok
+    assert [success.index for success in result.successes] == [0, 1, 3]
+    assert [success.value.name for success in result.successes] == ["A", "B", "C"]
+    assert [failure.index for failure in result.failures] == [NAMES.index("FAIL")]
+    assert isinstance(result.failures[0].error, TactillAPIError)
+    assert all(item.elapsed >= 0 for item in result.successes)
+    assert len(api.collections["categories"]) == len(NAMES) - 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_update() -> None:
+    api = FakeAPI()
+    api.collections["categories"] = [build_category(i, T0) for i in range(len(NAMES))]
+    client = AsyncTactillClient(api_key="key", http_client=api.build_async_client())
+
+    result = await client.categories.bulk_update(
+        [
+            (f"{index:024x}", CategoryUpdate(name=name, color=TactillColor.PURPLE))
+            for index, name in enumerate(NAMES)
+        ]
+    )
+
+    assert [success.index for success in result.successes] == [0, 1, 3]
+    assert [failure.index for failure in result.failures] == [NAMES.index("FAIL")]
+    assert api.collections["categories"][3]["name"] == "C"
+    assert api.collections["categories"][2]["name"] == "CATEGORY 2"
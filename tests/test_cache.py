@@ -0,0 +1,163 @@
+import httpx
+import pytest
+
+from tactill import CategoryUpdate, ResponseCache, TactillClient, TactillColor
+from tactill.cache import CachedResponse
+from tactill.exceptions import TactillAPIError
+from tests.data import ACCOUNT
+
+CATEGORY_ID = "6a202c6cbcfe5255c24e1895"
+CATEGORY = {
+    "_id": CATEGORY_ID,
+    "created_at": "2026-01-01T00:00:00Z",
+    "updated_at": "2026-01-01T00:00:00Z",
+    "name": "CATEGORY",
+    "icon_text": "CAT",
+    "color": "#57DB47",
+}
+UPDATED = {"statusCode": 200, "error": "", "message": "category successfully updated"}
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def client(requests: list[httpx.Request], clock: Clock) -> TactillClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/v1/account/account":
+            return httpx.Response(200, json=ACCOUNT)
+        if request.method == "PUT":
+            return httpx.Response(200, json=UPDATED)
+        if request.url.path.endswith(CATEGORY_ID):
+            return httpx.Response(200, json=CATEGORY)
+        return httpx.Response(404, text="not found")
+
+    return TactillClient(
+        api_key="key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        cache=ResponseCache(ttl={"categories": 60}, clock=clock),
+    )
+
+
+def test_cache_ttl(clock: Clock) -> None:
+    cache = ResponseCache(ttl={"taxes": 10}, clock=clock)
+    cache.set("taxes", "key", CachedResponse(200, b"[]"))
+    cache.set("articles", "other", CachedResponse(200, b"[]"))
+
+    assert cache.get("taxes", "key") == CachedResponse(200, b"[]")
+    assert cache.get("articles", "other") is None
+
+    clock.now = 10
+    assert cache.get("taxes", "key") is None
+    assert len(cache) == 0
+
+
+def test_cache_lru_eviction() -> None:
+    cache = ResponseCache(default_ttl=10, maxsize=2)
+    for key in ("a", "b"):
+        cache.set("taxes", key, CachedResponse(200, key.encode()))
+
+    cache.get("taxes", "a")
+    cache.set("taxes", "c", CachedResponse(200, b"c"))
+
+    assert cache.get("taxes", "b") is None
+    assert cache.get("taxes", "a") is not None
+    assert cache.get("taxes", "c") is not None
+
+
+def test_cache_negative_ttl(clock: Clock) -> None:
+    cache = ResponseCache(default_ttl=60, negative_ttl=5, clock=clock)
+    cache.set("taxes", "key", CachedResponse(404, b"not found"))
+
+    clock.now = 5
+    assert cache.get("taxes", "key") is None
+
+
+def test_cache_invalidates_related_resources() -> None:
+    cache = ResponseCache(default_ttl=60)
+    cache.set("articles", "articles", CachedResponse(200, b"[]"))
+    cache.set("taxes", "taxes", CachedResponse(200, b"[]"))
+
+    cache.update("POST", "movements", "movements", httpx.Response(200))
+
+    assert cache.get("articles", "articles") is None
+    assert cache.get("taxes", "taxes") is not None
+
+
+def test_client_read_through(
+    client: TactillClient, requests: list[httpx.Request]
+) -> None:
+    calls = 3
+    for _ in range(calls):
+        category = client.categories.get(category_id=CATEGORY_ID)
+        assert category.id == CATEGORY_ID
+
+    assert len(requests) == 1
+    assert client.cache is not None
+    assert client.cache.hits == calls - 1
+
+
+def test_client_shared_cache(clock: Clock, requests: list[httpx.Request]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/v1/account/account":
+            return httpx.Response(200, json=ACCOUNT)
+        name = request.headers["x-api-key"].upper()
+        return httpx.Response(200, json={**CATEGORY, "name": name})
+
+    cache = ResponseCache(ttl={"categories": 60}, clock=clock)
+    clients = [
+        TactillClient(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            cache=cache,
+        )
+        for api_key in ["first", "second", "first"]
+    ]
+
+    names = [client.categories.get(category_id=CATEGORY_ID).name for client in clients]
+
+    assert names == ["FIRST", "SECOND", "FIRST"]
+    assert len(requests) == 2  # noqa: PLR2004
+    assert cache.hits == 1
+
+
+def test_client_negative_caching(
+    client: TactillClient,
+    requests: list[httpx.Request],
+) -> None:
+    for _ in range(2):
+        with pytest.raises(TactillAPIError):
+            client.categories.get(category_id="6a202c6cbcfe5255c24e1800")
+
+    assert len(requests) == 1
+
+
+def test_client_invalidation_on_update(
+    client: TactillClient,
+    requests: list[httpx.Request],
+) -> None:
+    client.categories.get(category_id=CATEGORY_ID)
+    client.categories.update(
+        category_id=CATEGORY_ID,
+        data=CategoryUpdate(color=TactillColor.GREEN),
+    )
+    client.categories.get(category_id=CATEGORY_ID)
+
+    assert [request.method for request in requests] == ["GET", "PUT", "GET"]
@@ -1,7 +1,9 @@
+import datetime
+
 import pytest
 
 from tactill import FilterEntity, FilterOperator
-from tactill.filters import build_filters
+from tactill.filters import build_filters, format_datetime
 
 
 @pytest.mark.parametrize("operator", [FilterOperator.IN, FilterOperator.NIN])
@@ -70,3 +72,24 @@ def test_filters_params_eq() -> None:
 def test_filters_params_gt_gte_lt_lte_ne(operator: FilterOperator) -> None:
     filters = [FilterEntity(field="field", value=1, operator=operator)]
     assert build_filters(filters) == f"field{operator}=1"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(2026, 1, 1, 10, 30, 0, 123456),
+        datetime.datetime(2026, 1, 1, 10, 30, 0, 123456, tzinfo=datetime.UTC),
+        datetime.datetime(
+            2026,
+            1,
+            1,
+            11,
+            30,
+            0,
+            123456,
+            tzinfo=datetime.timezone(datetime.timedelta(hours=1)),
+        ),
+    ],
+)
+def test_format_datetime(value: datetime.datetime) -> None:
+    assert format_datetime(value) == "2026-01-01T10:30:00.123Z"
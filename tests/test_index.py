@@ -0,0 +1,66 @@
+import pytest
+
+from tactill import Article, CatalogIndex
+from tests.api import build_article
+
+T0 = "2026-01-01T00:00:00.000Z"
+ARTICLES = 9
+
+
+def article(index: int, **fields: object) -> Article:
+    return Article.model_validate(
+        build_article(
+            index,
+            T0,
+            **({"barcode": f"{index:013d}", "reference": f"REF-{index}"} | fields),
+        )
+    )
+
+
+@pytest.fixture
+def index() -> CatalogIndex:
+    return CatalogIndex(article(i) for i in range(ARTICLES))
+
+
+def test_lookups(index: CatalogIndex) -> None:
+    assert len(index) == ARTICLES
+    assert index[f"{4:024x}"].name == "ARTICLE 4"
+    assert index.get_by_barcode(f"{4:013d}") == index[f"{4:024x}"]
+    assert index.get_by_reference("REF-4") == index[f"{4:024x}"]
+    assert index.get_by_name("article 4") == [index[f"{4:024x}"]]
+    assert index.get_by_barcode("unknown") is None
+
+
+def test_groups(index: CatalogIndex) -> None:
+    by_category = index.get_by_category(f"{0:024x}")
+    by_tax = index.get_by_tax(f"{1:024x}")
+
+    assert {item.id for item in by_category} == {f"{i:024x}" for i in (0, 3, 6)}
+    assert {item.id for item in by_tax} == {f"{i:024x}" for i in (1, 3, 5, 7)}
+
+
+def test_in_stock(index: CatalogIndex) -> None:
+    index.upsert(article(0, stock_quantity=2))
+
+    assert index.get_by_category(f"{0:024x}", in_stock=True) == [index[f"{0:024x}"]]
+
+
+def test_upsert_moves_keys(index: CatalogIndex) -> None:
+    index.upsert(article(4, category_id=f"{2:024x}", barcode="new", name="RENAMED"))
+
+    assert len(index) == ARTICLES
+    assert index.get_by_barcode(f"{4:013d}") is None
+    assert index.get_by_barcode("new") == index[f"{4:024x}"]
+    assert index.get_by_name("ARTICLE 4") == []
+    assert f"{4:024x}" not in {item.id for item in index.get_by_category(f"{1:024x}")}
+    assert f"{4:024x}" in {item.id for item in index.get_by_category(f"{2:024x}")}
+
+
+def test_remove(index: CatalogIndex) -> None:
+    del index[f"{4:024x}"]
+
+    assert f"{4:024x}" not in index
+    assert index.get_by_reference("REF-4") is None
+    assert index.remove(f"{4:024x}") is None
+    with pytest.raises(KeyError):
+        del index[f"{4:024x}"]
@@ -0,0 +1,119 @@
+import logging
+
+import httpx
+import pytest
+
+from tactill import (
+    AsyncTactillClient,
+    DecodeEvent,
+    Observer,
+    RequestEvent,
+    ResponseCache,
+    RetryPolicy,
+    SlowCallLogger,
+    TactillClient,
+)
+from tactill.instrumentation import get_endpoint
+from tests.api import FakeAPI, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+TAX_ID = f"{0:024x}"
+
+
+class RecordingObserver(Observer):
+    def __init__(self) -> None:
+        self.requests: list[RequestEvent] = []
+        self.decodes: list[DecodeEvent] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.requests.append(event)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        self.decodes.append(event)
+
+
+def build_api() -> FakeAPI:
+    api = FakeAPI()
+    api.collections["taxes"] = [build_tax(index, T0) for index in range(2)]
+    return api
+
+
+def test_get_endpoint() -> None:
+    assert get_endpoint(f"catalog/taxes/{TAX_ID}") == "catalog/taxes/{id}"
+    assert get_endpoint("catalog/taxes") == "catalog/taxes"
+
+
+def test_events() -> None:
+    api = build_api()
+    observer = RecordingObserver()
+    client = TactillClient(
+        api_key="key",
+        http_client=api.build_client(),
+        cache=ResponseCache(default_ttl=60),
+        observers=[observer],
+    )
+
+    client.taxes.get(TAX_ID)
+    client.taxes.get(TAX_ID)
+    client.taxes.get_records()
+
+    endpoints = [(event.endpoint, event.cached) for event in observer.requests]
+    assert endpoints == [
+        ("catalog/taxes/{id}", False),
+        ("catalog/taxes/{id}", True),
+        ("account/account", False),
+        ("catalog/taxes", False),
+    ]
+    assert all(event.status_code == httpx.codes.OK for event in observer.requests)
+    assert observer.requests[0].size > 0
+    assert observer.requests[0].network_time > 0
+    models = [(event.model, event.validated) for event in observer.decodes]
+    assert models == [
+        ("Tax", True),
+        ("Tax", True),
+        ("Account", True),
+        ("list[TaxRecord]", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_events() -> None:
+    api = build_api()
+    failures = [httpx.Response(503)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v1/catalog") and failures:
+            return failures.pop()
+        return api.handler(request)
+
+    observer = RecordingObserver()
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(backoff=0.001),
+        observers=[observer],
+    )
+
+    await client.taxes.get_all()
+
+    event = observer.requests[-1]
+    assert event.endpoint == "catalog/taxes"
+    assert event.retries == 1
+    assert event.queue_time >= 0
+    assert observer.decodes[-1].model == "list[Tax]"
+
+
+def test_slow_call_logger(caplog: pytest.LogCaptureFixture) -> None:
+    api = build_api()
+    client = TactillClient(
+        api_key="key",
+        http_client=api.build_client(),
+        observers=[SlowCallLogger(threshold=0)],
+    )
+
+    with caplog.at_level(logging.WARNING, logger="tactill"):
+        client.taxes.get(TAX_ID)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0].startswith("Slow request GET catalog/taxes/{id}")
+    assert messages[1].startswith("Slow decoding of Tax")
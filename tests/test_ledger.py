@@ -0,0 +1,179 @@
+import datetime
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from tactill import (
+    AsyncMovementFeed,
+    AsyncTactillClient,
+    MovementFeed,
+    StockLedger,
+    TactillClient,
+)
+from tactill.entities.movement import Movement
+from tactill.ledger import DeltaLog
+from tests.api import FakeAPI, build_movement
+
+T0 = "2026-01-01T10:00:00.000Z"
+T1 = "2026-01-02T10:00:00.000Z"
+T2 = "2026-01-03T10:00:00.000Z"
+ARTICLE_ID = f"{0:024x}"
+OTHER_ARTICLE_ID = f"{1:024x}"
+
+
+def build_line(article_id: str, units: int, done_on: str) -> dict[str, object]:
+    return {
+        "article_id": article_id,
+        "article_name": "ARTICLE",
+        "category_name": "CATEGORY",
+        "state": "done",
+        "units": units,
+        "done_on": done_on,
+    }
+
+
+def build_api() -> FakeAPI:
+    api = FakeAPI()
+    api.collections["movements"] = [
+        build_movement(
+            0,
+            T0,
+            movements=[
+                build_line(ARTICLE_ID, 10, T0),
+                build_line(OTHER_ARTICLE_ID, 3, T0),
+            ],
+        ),
+        build_movement(1, T1, type="out", movements=[build_line(ARTICLE_ID, 4, T1)]),
+        build_movement(
+            2,
+            T2,
+            state="planned",
+            movements=[{**build_line(ARTICLE_ID, 20, T2), "state": "planned"}],
+        ),
+    ]
+    return api
+
+
+def test_delta_log() -> None:
+    log = DeltaLog()
+    log.set("a", [(0, 1, 10), (1, 1, 3)])
+    log.set("b", [(0, 2, -4)])
+
+    # shorter deltas are written in place, longer ones at the end
+    log.set("a", [(0, 1, 5)])
+    log.set("b", [(0, 2, -4), (1, 2, -1)])
+    log.remove("a")
+
+    assert log.get("a") is None
+    assert log.get("b") == [(0, 2, -4), (1, 2, -1)]
+    assert len(log.articles) == 5  # noqa: PLR2004
+    assert len(log) == 1
+
+
+def test_stock() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    ledger = StockLedger()
+
+    assert MovementFeed(client, ledger).refresh() == 3  # noqa: PLR2004
+
+    assert ledger.get_stock(ARTICLE_ID) == 6  # noqa: PLR2004
+    assert ledger.get_stock(ARTICLE_ID, day=datetime.date(2025, 12, 31)) == 0
+    assert ledger.get_stock(ARTICLE_ID, day=datetime.date(2026, 1, 1)) == 10  # noqa: PLR2004
+    assert ledger.get_stock(OTHER_ARTICLE_ID) == 3  # noqa: PLR2004
+    assert ledger.get_stock("unknown") == 0
+    # a datetime would hide the movements of the rest of its day
+    with pytest.raises(TypeError):
+        ledger.get_stock(ARTICLE_ID, day=datetime.datetime(2026, 1, 1))
+    assert ledger.get_below(5) == {OTHER_ARTICLE_ID: 3}
+    assert (
+        ledger.watermark
+        == Movement.model_validate(api.collections["movements"][2]).updated_at
+    )
+
+
+def test_incremental_refresh() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    ledger = StockLedger()
+    feed = MovementFeed(client, ledger)
+    feed.refresh()
+
+    # the planned movement is done, the first one is cancelled
+    movements = api.collections["movements"]
+    movements[2]["movements"][0]["state"] = "done"
+    movements[2]["updated_at"] = "2026-01-04T00:00:00.000Z"
+    movements[0]["deprecated"] = True
+    movements[0]["updated_at"] = "2026-01-04T00:00:00.000Z"
+
+    assert feed.refresh() == 2  # noqa: PLR2004
+    assert ledger.get_stock(ARTICLE_ID) == 16  # noqa: PLR2004
+    assert ledger.get_stock(ARTICLE_ID, day=datetime.date(2026, 1, 2)) == -4  # noqa: PLR2004
+    assert ledger.get_stock(OTHER_ARTICLE_ID) == 0
+    assert len(ledger.deltas) == 2  # noqa: PLR2004
+    assert feed.refresh() == 0
+
+
+def test_refresh_during_updates() -> None:
+    api = FakeAPI()
+    movements = api.collections["movements"]
+    movements.extend(build_movement(index, T0) for index in range(6))
+    actions: dict[str, Callable[[], None]] = {}
+    pages = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal pages
+        if request.url.path == "/v1/stock/movements" and actions:
+            pages += 1
+            deprecated = "deprecated=true" in request.url.params["filter"]
+            action = actions.pop("deprecated" if deprecated else f"page {pages}", None)
+            if action is not None:
+                action()
+        return api.handler(request)
+
+    client = TactillClient(
+        api_key="key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    ledger = StockLedger()
+    feed = MovementFeed(client, ledger, page_size=2)
+    feed.refresh()
+
+    def update(index: int, updated_at: str, units: int, **fields: object) -> None:
+        line = build_line(f"{index % 3:024x}", units, updated_at)
+        movements[index] = build_movement(index, updated_at, movements=[line], **fields)
+
+    for index in range(6):
+        update(index, f"2026-01-02T00:00:0{index}.000Z", units=2)
+
+    def cancel_first() -> None:
+        update(0, "2026-01-03T00:00:00.000Z", units=2, deprecated=True)
+
+    def update_after_scan() -> None:
+        # after the first scan, before a later cancellation
+        update(3, "2026-01-04T00:00:00.000Z", units=5)
+        update(4, "2026-01-05T00:00:00.000Z", units=2, deprecated=True)
+
+    actions["page 2"] = cancel_first
+    actions["deprecated"] = update_after_scan
+    feed.refresh()
+    assert not actions
+
+    # a refresh never moves the watermark past a change it did not see
+    feed.refresh()
+    assert [ledger.get_stock(f"{index:024x}") for index in range(3)] == [5, 2, 4]
+    assert feed.refresh() == 0
+
+
+@pytest.mark.asyncio
+async def test_async_refresh() -> None:
+    api = build_api()
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+    )
+    ledger = StockLedger()
+
+    assert await AsyncMovementFeed(client, ledger).refresh() == 3  # noqa: PLR2004
+    assert ledger.get_stock(ARTICLE_ID) == 6  # noqa: PLR2004
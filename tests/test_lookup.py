@@ -0,0 +1,70 @@
+import pytest
+
+from tactill import AsyncTactillClient, TactillClient
+from tactill.lookup import MAX_CHUNK_SIZE, chunk_ids
+from tests.api import FakeAPI, build_article, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+ARTICLES_COUNT = 250
+MISSING_ID = f"{999:024x}"
+
+
+def build_api() -> FakeAPI:
+    api = FakeAPI()
+    api.collections["articles"] = [
+        build_article(index, T0) for index in range(ARTICLES_COUNT)
+    ]
+    api.collections["taxes"] = [build_tax(index, T0) for index in range(2)]
+    return api
+
+
+def test_chunk_ids() -> None:
+    ids = [f"{index:024x}" for index in range(ARTICLES_COUNT)]
+
+    chunks = chunk_ids([*ids, ids[0]])
+
+    assert [len(chunk) for chunk in chunks] == [MAX_CHUNK_SIZE, MAX_CHUNK_SIZE, 50]
+    assert [value for chunk in chunks for value in chunk] == ids
+
+
+def test_get_many() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    ids = [f"{index:024x}" for index in (42, 7, 999, 7)]
+
+    result = client.articles.get_many(ids)
+
+    assert [article.id for article in result.found] == [ids[0], ids[1], ids[1]]
+    assert result.missing == [MISSING_ID]
+    # account + a single chunk
+    assert len(api.requests) == 2  # noqa: PLR2004
+
+
+def test_get_many_chunks() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    ids = [f"{index:024x}" for index in reversed(range(ARTICLES_COUNT))]
+
+    result = client.articles.get_many(ids)
+
+    assert [article.id for article in result.found] == ids
+    assert result.missing == []
+    assert len(api.requests) == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_async_get_many() -> None:
+    api = build_api()
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+    )
+    ids = [f"{index:024x}" for index in reversed(range(ARTICLES_COUNT))]
+
+    articles = await client.articles.get_many([*ids, MISSING_ID])
+    taxes = await client.taxes.get_many([f"{1:024x}", MISSING_ID])
+
+    assert [article.id for article in articles.found] == ids
+    assert articles.missing == [MISSING_ID]
+    assert [tax.name for tax in taxes.found] == ["TAX 1"]
+    assert taxes.missing == [MISSING_ID]
@@ -0,0 +1,133 @@
+import httpx
+import pytest
+
+from tactill import (
+    AsyncTactillClient,
+    CategoryCreate,
+    MetricsRegistry,
+    ResponseCache,
+    RetryPolicy,
+    TactillClient,
+    TactillColor,
+)
+from tactill.exceptions import TactillAPIError
+from tactill.instrumentation import RequestEvent
+from tactill.metrics import get_operation
+from tests.api import FakeAPI, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+TAX_ID = f"{0:024x}"
+MISSING_ID = f"{999:024x}"
+
+
+def test_get_operation() -> None:
+    assert get_operation("GET", "catalog/articles") == ("articles", "get_all")
+    assert get_operation("GET", "catalog/articles/{id}") == ("articles", "get")
+    assert get_operation("POST", "stock/movements") == ("movements", "create")
+    assert get_operation("PUT", "catalog/articles/{id}") == ("articles", "update")
+
+
+def test_histogram_buckets() -> None:
+    metrics = MetricsRegistry(buckets=(0.1, 1))
+    for duration in (0.05, 0.1, 0.5, 5):
+        metrics.on_request_start("GET", "catalog/taxes")
+        metrics.on_request(
+            RequestEvent("GET", "catalog/taxes", 200, 10, network_time=duration)
+        )
+
+    lines = metrics.render().splitlines()
+
+    labels = 'resource="taxes",operation="get_all"'
+    assert f'tactill_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in lines
+    assert f'tactill_request_duration_seconds_bucket{{{labels},le="1"}} 3' in lines
+    assert f'tactill_request_duration_seconds_bucket{{{labels},le="+Inf"}} 4' in lines
+    assert f"tactill_request_duration_seconds_sum{{{labels}}} 5.65" in lines
+    assert f"tactill_in_flight_requests{{{labels}}} 0" in lines
+
+
+def test_client_metrics() -> None:
+    api = FakeAPI()
+    api.collections["taxes"] = [build_tax(0, T0)]
+    metrics = MetricsRegistry()
+    client = TactillClient(
+        api_key="key",
+        http_client=api.build_client(),
+        cache=ResponseCache(default_ttl=60),
+        observers=[metrics],
+    )
+
+    client.taxes.get(TAX_ID)
+    client.taxes.get(TAX_ID)
+    with pytest.raises(TactillAPIError):
+        client.taxes.get(MISSING_ID)
+    client.categories.create(
+        CategoryCreate(name="A", icon_text="A", color=TactillColor.GREEN)
+    )
+
+    lines = metrics.render().splitlines()
+
+    tax_labels = 'resource="taxes",operation="get"'
+    assert f'tactill_requests_total{{{tax_labels},status="200"}} 2' in lines
+    assert f'tactill_requests_total{{{tax_labels},status="404"}} 1' in lines
+    assert f"tactill_errors_total{{{tax_labels}}} 1" in lines
+    category_labels = 'resource="categories",operation="create"'
+    assert f'tactill_requests_total{{{category_labels},status="200"}} 1' in lines
+    assert "tactill_cache_hits_total 1" in lines
+    # the tax twice and the account
+    assert "tactill_cache_misses_total 3" in lines
+    assert "tactill_cache_hit_ratio 0.25" in lines
+    assert "# TYPE tactill_request_duration_seconds histogram" in lines
+
+
+@pytest.mark.parametrize(
+    ("cache", "misses", "ratio"),
+    [(None, 0, 0), (ResponseCache(ttl={"taxes": 60}), 1, 0.9)],
+)
+def test_client_cache_metrics(
+    cache: ResponseCache | None,
+    misses: int,
+    ratio: float,
+) -> None:
+    api = FakeAPI()
+    api.collections["taxes"] = [build_tax(0, T0)]
+    metrics = MetricsRegistry()
+    client = TactillClient(
+        api_key="key",
+        http_client=api.build_client(),
+        cache=cache,
+        observers=[metrics],
+    )
+
+    # only the lookups of the cacheable resources are misses
+    for _ in range(10):
+        client.taxes.get(TAX_ID)
+        client.articles.get_all()
+
+    assert metrics.cache_misses == misses
+    assert metrics.cache_hit_ratio == ratio
+    if cache is not None:
+        assert (cache.hits, cache.misses) == (metrics.cache_hits, misses)
+
+
+@pytest.mark.asyncio
+async def test_async_client_metrics() -> None:
+    api = FakeAPI()
+    failures = [httpx.Response(502)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v1/catalog") and failures:
+            return failures.pop()
+        return api.handler(request)
+
+    metrics = MetricsRegistry()
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(backoff=0.001),
+        observers=[metrics],
+    )
+
+    await client.taxes.get_all()
+
+    assert metrics.retries[("taxes", "get_all")] == 1
+    assert metrics.in_flight[("taxes", "get_all")] == 0
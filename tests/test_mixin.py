@@ -0,0 +1,26 @@
+import pytest
+
+from tactill import Tax
+from tactill.exceptions import TactillAPIError
+from tactill.mixin import ClientMixin, get_type_adapter
+
+TAX = (
+    b'{"_id": "6a202c6cbcfe5255c24e1895", "created_at": "2026-01-01T00:00:00Z",'
+    b' "updated_at": "2026-01-01T00:00:00Z", "name": "TVA", "rate": 20}'
+)
+
+
+def test_type_adapter_is_cached() -> None:
+    assert get_type_adapter(list[Tax]) is get_type_adapter(list[Tax])
+
+
+def test_handle_validation_from_bytes() -> None:
+    tax = ClientMixin._handle_validation(TAX, response_model=Tax)
+
+    assert tax.id == "6a202c6cbcfe5255c24e1895"
+    assert tax.name == "TVA"
+
+
+def test_handle_validation_error() -> None:
+    with pytest.raises(TactillAPIError):
+        ClientMixin._handle_validation(b'{"name": "TVA"}', response_model=Tax)
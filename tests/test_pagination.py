@@ -0,0 +1,178 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from tactill import FilterEntity, FilterOperator, TactillClient
+from tactill.exceptions import TactillError
+from tactill.filters import build_filters
+from tactill.pagination import Keyset, KeysetCursor, afetch_all, apaginate, paginate
+from tests.api import FakeAPI, build_tax
+
+ITEMS = list(range(25))
+ENTITIES = [SimpleNamespace(id=f"{index:024x}") for index in range(25)]
+calls: list[int] = []
+
+
+def fetch_page(skip: int, filters: list[FilterEntity] | None = None) -> list[int]:
+    calls.append(skip)
+    return ITEMS[skip : skip + 10]
+
+
+async def afetch_page(
+    skip: int, filters: list[FilterEntity] | None = None
+) -> list[int]:
+    return fetch_page(skip, filters)
+
+
+@pytest.fixture(autouse=True)
+def reset_calls() -> None:
+    calls.clear()
+
+
+def test_paginate() -> None:
+    assert list(paginate(fetch_page, page_size=10)) == ITEMS
+    assert calls == [0, 10, 20]
+
+
+def test_paginate_is_lazy() -> None:
+    iterator = paginate(fetch_page, page_size=10)
+    assert next(iterator) == 0
+    assert calls == [0]
+
+
+def test_paginate_stops_on_empty_page() -> None:
+    assert list(paginate(lambda skip, _: ITEMS[skip : skip + 5], page_size=5)) == ITEMS
+
+
+@pytest.mark.asyncio
+async def test_apaginate() -> None:
+    assert [item async for item in apaginate(afetch_page, page_size=10)] == ITEMS
+    assert calls == [0, 10, 20]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [1, 3, 10])
+async def test_afetch_all(concurrency: int) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch(skip: int) -> list[int]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # later pages answer first to check that server order is restored
+        await asyncio.sleep(0.01 / (skip + 1))
+        in_flight -= 1
+        return fetch_page(skip)
+
+    results = await afetch_all(fetch, page_size=10, concurrency=concurrency)
+
+    assert results == ITEMS
+    assert max_in_flight <= concurrency
+    assert len(calls) <= 3 + concurrency
+
+
+@pytest.mark.asyncio
+async def test_afetch_all_stops_launching_after_short_page() -> None:
+    results = await afetch_all(afetch_page, page_size=10, concurrency=1)
+
+    assert results == ITEMS
+    assert calls == [0, 10, 20]
+
+
+def fetch_keyset_page(skip: int, filters: list[FilterEntity]) -> list[SimpleNamespace]:
+    assert skip == 0
+    entities = ENTITIES
+    for filter_ in filters:
+        assert filter_.field == "_id"
+        assert filter_.operator == FilterOperator.GT
+        entities = [entity for entity in entities if entity.id > filter_.value]
+    return entities[:10]
+
+
+def test_paginate_keyset() -> None:
+    results = list(paginate(fetch_keyset_page, page_size=10, keyset=Keyset.ID))
+    assert results == ENTITIES
+
+
+@pytest.mark.asyncio
+async def test_apaginate_keyset() -> None:
+    async def fetch(skip: int, filters: list[FilterEntity]) -> list[SimpleNamespace]:
+        return fetch_keyset_page(skip, filters)
+
+    results = [item async for item in apaginate(fetch, page_size=10, keyset=Keyset.ID)]
+    assert results == ENTITIES
+
+
+def test_keyset_cursor_datetime() -> None:
+    updated_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    cursor = KeysetCursor(Keyset.UPDATED_AT)
+    cursor.advance([SimpleNamespace(id="a", updated_at=updated_at)])
+
+    assert build_filters(cursor.filters) == (
+        "updated_at[gte]=2026-01-01T00:00:00.000Z&_id[ne]=a"
+    )
+
+
+def test_paginate_keyset_updated_at_ties() -> None:
+    # 7 entities per timestamp, more than a page
+    entities = [
+        SimpleNamespace(
+            id=f"{index:024x}",
+            updated_at=datetime.datetime(2026, 1, 1 + index // 7, tzinfo=datetime.UTC),
+        )
+        for index in range(50)
+    ]
+
+    def fetch(skip: int, filters: list[FilterEntity]) -> list[SimpleNamespace]:
+        results = entities
+        for filter_ in filters:
+            if filter_.operator == FilterOperator.GTE:
+                value = datetime.datetime.fromisoformat(filter_.value)
+                results = [entity for entity in results if entity.updated_at >= value]
+            else:
+                results = [
+                    entity for entity in results if entity.id not in filter_.value
+                ]
+        # ties come back in any order
+        return sorted(
+            results, key=lambda entity: (entity.updated_at, -int(entity.id, 16))
+        )[:5]
+
+    results = list(paginate(fetch, page_size=5, keyset=Keyset.UPDATED_AT))
+
+    assert sorted(entity.id for entity in results) == [entity.id for entity in entities]
+
+
+def test_iter_all_keyset_updated_at_ties() -> None:
+    api = FakeAPI()
+    api.collections["taxes"] = [
+        build_tax(index, f"2026-01-{1 + index // 7:02d}T00:00:00.000Z")
+        for index in range(50)
+    ]
+    client = TactillClient(api_key="key", http_client=api.build_client())
+
+    taxes = client.taxes.iter_all(page_size=5, keyset=Keyset.UPDATED_AT)
+
+    assert len({tax.id for tax in taxes}) == 50  # noqa: PLR2004
+
+
+def test_keyset_cursor_too_many_ties() -> None:
+    updated_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    cursor = KeysetCursor(Keyset.UPDATED_AT)
+
+    with pytest.raises(TactillError):
+        cursor.advance(
+            [
+                SimpleNamespace(id=f"{index:024x}", updated_at=updated_at)
+                for index in range(200)
+            ]
+        )
+
+
+def test_keyset_order() -> None:
+    assert Keyset.ID.order(None) == "_id"
+    with pytest.raises(TactillError):
+        Keyset.ID.order("name")
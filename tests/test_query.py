@@ -0,0 +1,188 @@
+import pytest
+
+from tactill import (
+    AsyncTactillClient,
+    FilterEntity,
+    FilterOperator,
+    Keyset,
+    TactillClient,
+)
+from tactill.exceptions import TactillError
+from tactill.query import chunk_values, get_values, merge_pages, split_query
+from tests.api import FakeAPI, build_article
+
+T0 = "2026-01-01T00:00:00.000Z"
+ARTICLES_COUNT = 300
+IDS = [f"{index:024x}" for index in range(ARTICLES_COUNT)]
+NAME_FILTER = FilterEntity(field="name", value="ARTICLE")
+
+
+def build_api() -> FakeAPI:
+    api = FakeAPI()
+    api.collections["articles"] = [
+        build_article(index, T0) for index in range(ARTICLES_COUNT)
+    ]
+    return api
+
+
+def test_chunk_values_max_length() -> None:
+    chunks = chunk_values(IDS[:10], max_size=10, max_length=100)
+
+    assert all(len(chunk) == 2 for chunk in chunks)  # noqa: PLR2004
+    assert [value for chunk in chunks for value in chunk] == IDS[:10]
+
+
+def test_split_query_small_filters() -> None:
+    assert split_query(None) is None
+    assert split_query([NAME_FILTER]) is None
+
+
+def test_split_query_in() -> None:
+    split = split_query(
+        [NAME_FILTER, FilterEntity(field="_id", value=IDS, operator=FilterOperator.IN)],
+        max_length=1000,
+    )
+
+    assert split is not None
+    assert split.excluded == {}
+    assert all(query[0] == NAME_FILTER for query in split.filters)
+    assert [value for query in split.filters for value in query[1].value] == IDS
+
+
+def test_split_query_nin() -> None:
+    split = split_query(
+        [FilterEntity(field="_id", value=IDS, operator=FilterOperator.NIN)],
+        max_length=1000,
+    )
+
+    assert split is not None
+    assert len(split.filters) == 1
+    (server_filter,) = split.filters[0]
+    assert server_filter.operator == FilterOperator.NIN
+    assert set(server_filter.value) | split.excluded["_id"] == set(IDS)
+
+
+def test_split_query_scalar_filters() -> None:
+    with pytest.raises(TactillError):
+        split_query([NAME_FILTER], max_length=10)
+
+
+def test_get_values() -> None:
+    document = {"_id": "1", "movements": [{"article_id": "a"}, {"article_id": "b"}]}
+
+    assert get_values(document, "_id") == ["1"]
+    assert get_values(document, "movements.article_id") == ["a", "b"]
+    assert get_values(document, "missing") == []
+
+
+def test_merge_pages() -> None:
+    pages = [
+        [{"_id": "1", "name": "B"}, {"_id": "3", "name": "D"}],
+        [{"_id": "2", "name": "A"}, {"_id": "1", "name": "B"}],
+    ]
+
+    assert merge_pages(pages, limit=2, skip=1, order="name") == (
+        b'[{"_id":"1","name":"B"},{"_id":"3","name":"D"}]'
+    )
+    assert merge_pages(pages, limit=2, skip=0, order="-name") == (
+        b'[{"_id":"3","name":"D"},{"_id":"1","name":"B"}]'
+    )
+    pages.append([{"_id": "4", "name": None}])
+    assert merge_pages(pages, limit=4, skip=0, order="name") == (
+        b'[{"_id":"2","name":"A"},{"_id":"1","name":"B"},'
+        b'{"_id":"3","name":"D"},{"_id":"4","name":null}]'
+    )
+
+
+def test_get_all_in() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    ids = IDS[::-1]
+
+    articles = client.articles.get_all(
+        limit=50,
+        filters=[FilterEntity(field="_id", value=ids, operator=FilterOperator.IN)],
+    )
+
+    assert [article.id for article in articles] == IDS[:50]
+    # account + one request per sub-query
+    assert len(api.requests) == 4  # noqa: PLR2004
+
+
+def test_get_all_in_descending_order() -> None:
+    api = FakeAPI()
+    api.collections["articles"] = [
+        build_article(index, f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}.000Z")
+        for index in range(ARTICLES_COUNT)
+    ]
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    filters = [FilterEntity(field="_id", value=IDS, operator=FilterOperator.IN)]
+
+    articles = client.articles.get_all(limit=5, filters=filters, order="-updated_at")
+
+    assert [article.id for article in articles] == IDS[:-6:-1]
+
+
+def test_get_all_in_nullable_order() -> None:
+    api = FakeAPI()
+    api.collections["articles"] = [
+        build_article(index, T0, barcode=f"{index:08d}" if index % 2 else None)
+        for index in range(ARTICLES_COUNT)
+    ]
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    filters = [FilterEntity(field="_id", value=IDS, operator=FilterOperator.IN)]
+
+    articles = client.articles.get_all(
+        limit=ARTICLES_COUNT, filters=filters, order="-barcode"
+    )
+
+    # the null values come last
+    assert [article.id for article in articles] == IDS[-1::-2] + IDS[::2]
+
+
+def test_split_query_pagination() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    filters = [FilterEntity(field="_id", value=IDS, operator=FilterOperator.IN)]
+
+    with pytest.raises(TactillError):
+        client.articles.get_all(limit=50, skip=100, filters=filters)
+    with pytest.raises(TactillError):
+        next(client.articles.iter_all(filters=filters))
+
+    articles = client.articles.iter_all(
+        page_size=100,
+        filters=filters,
+        keyset=Keyset.ID,
+    )
+    assert [article.id for article in articles] == IDS
+
+
+def test_get_all_nin() -> None:
+    api = build_api()
+    client = TactillClient(api_key="key", http_client=api.build_client())
+
+    articles = client.articles.get_all(
+        limit=10,
+        filters=[
+            FilterEntity(field="_id", value=IDS[:-20], operator=FilterOperator.NIN)
+        ],
+    )
+
+    assert [article.id for article in articles] == IDS[-20:-10]
+
+
+@pytest.mark.asyncio
+async def test_async_get_all_in() -> None:
+    api = build_api()
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+    )
+
+    records = await client.articles.get_records(
+        limit=ARTICLES_COUNT,
+        filters=[FilterEntity(field="_id", value=IDS, operator=FilterOperator.IN)],
+    )
+
+    assert [record.id for record in records] == IDS
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from tactill import AsyncTactillClient, RateLimits, TactillClient
+from tactill.ratelimit import TokenBucket
+from tests.api import FakeAPI
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_burst() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=3, clock=clock)
+
+    delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays == pytest.approx([0, 0, 0, 0.1, 0.2])
+
+
+def test_token_bucket_refill() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+    for _ in range(2):
+        bucket.reserve()
+
+    clock.now = 10
+
+    # refilled up to the burst only
+    assert [bucket.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+
+def test_token_bucket_threads() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, burst=1, clock=clock)
+    delays: list[float] = []
+
+    def reserve() -> None:
+        for _ in range(50):
+            delays.append(bucket.reserve())
+
+    threads = [threading.Thread(target=reserve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # every token is handed out exactly once
+    assert sorted(delays) == pytest.approx([index / 100 for index in range(200)])
+
+
+def test_token_bucket_validation() -> None:
+    with pytest.raises(ValueError, match="Rate"):
+        TokenBucket(rate=0)
+
+
+def test_rate_limits_are_shared_per_api_key() -> None:
+    api = FakeAPI()
+    rate_limits = RateLimits(rate=1000, burst=10)
+
+    client = TactillClient(
+        api_key="key", http_client=api.build_client(), rate_limits=rate_limits
+    )
+    other = TactillClient(
+        api_key="key", http_client=api.build_client(), rate_limits=rate_limits
+    )
+    another = TactillClient(
+        api_key="other", http_client=api.build_client(), rate_limits=rate_limits
+    )
+
+    assert client.rate_limiter is not None
+    assert client.rate_limiter is other.rate_limiter
+    assert client.rate_limiter is not another.rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_async_client_rate_limit() -> None:
+    api = FakeAPI()
+    rate_limits = RateLimits(rate=20, burst=1)
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+        rate_limits=rate_limits,
+    )
+
+    await client.taxes.get_all()
+
+    assert client.rate_limiter is not None
+    # account and taxes used the only token and the next one
+    assert client.rate_limiter.reserve() > 0
@@ -0,0 +1,80 @@
+import datetime
+import json
+
+import pytest
+
+from tactill import Article, ArticleRecord, MovementRecord, TactillColor
+from tactill.entities.movement import Movement, MovementType
+from tactill.exceptions import TactillAPIError
+from tactill.mixin import ClientMixin
+
+ARTICLE = {
+    "_id": "6a2110884d74f3bde34643fc",
+    "created_at": "2026-01-01T10:00:00.000Z",
+    "updated_at": "2026-01-02T10:00:00.000Z",
+    "node_id": "6a202c6cbcfe5255c24e1897",
+    "category_id": "6a202c6cbcfe5255c24e1895",
+    "taxes": ["6a202c6cbcfe5255c24e1896"],
+    "name": "ARTICLE",
+    "icon_text": "ART",
+    "color": "#57DB47",
+    "in_stock": True,
+}
+MOVEMENT = {
+    "_id": "6a2110884d74f3bde34643fd",
+    "created_at": "2026-01-01T10:00:00.000Z",
+    "updated_at": "2026-01-02T10:00:00.000Z",
+    "number": 1,
+    "type": "in",
+    "state": "done",
+    "motive": "transfer",
+    "movements": [
+        {
+            "article_id": "6a2110884d74f3bde34643fc",
+            "article_name": "ARTICLE",
+            "category_name": "CATEGORY",
+            "state": "done",
+            "units": 3,
+            "done_on": "2026-01-01T10:00:00.000Z",
+        }
+    ],
+}
+
+
+def test_article_record_matches_entity() -> None:
+    content = json.dumps([ARTICLE]).encode()
+
+    (article,) = ClientMixin._handle_validation(content, response_model=list[Article])
+    (record,) = ClientMixin._handle_records(content, record_type=ArticleRecord)
+
+    for name in Article.model_fields:
+        assert getattr(record, name) == getattr(article, name)
+    assert record.color is TactillColor.GREEN
+    assert record.created_at == datetime.datetime(2026, 1, 1, 10, tzinfo=datetime.UTC)
+
+
+def test_movement_record_matches_entity() -> None:
+    content = json.dumps([MOVEMENT]).encode()
+
+    (movement,) = ClientMixin._handle_validation(content, response_model=list[Movement])
+    (record,) = ClientMixin._handle_records(content, record_type=MovementRecord)
+
+    assert record.id == movement.id
+    assert record.type is MovementType.IN
+    assert record.movements[0].units == movement.movements[0].units
+    assert record.movements[0].done_on == movement.movements[0].done_on
+
+
+def test_records_skip_validation() -> None:
+    content = json.dumps([ARTICLE | {"_id": "not-a-uuid"}]).encode()
+
+    with pytest.raises(TactillAPIError):
+        ClientMixin._handle_validation(content, response_model=list[Article])
+
+    (record,) = ClientMixin._handle_records(content, record_type=ArticleRecord)
+    assert record.id == "not-a-uuid"
+
+
+def test_records_invalid_json() -> None:
+    with pytest.raises(TactillAPIError):
+        ClientMixin._handle_records(b"[", record_type=ArticleRecord)
@@ -0,0 +1,112 @@
+import httpx
+import pytest
+
+from tactill import AsyncTactillClient, RetryPolicy, TactillClient
+from tactill.exceptions import TactillAPIError, TactillError
+from tests.api import FakeAPI, build_tax
+
+T0 = "2026-01-01T00:00:00.000Z"
+TAX_ID = f"{0:024x}"
+POLICY = RetryPolicy(backoff=0.001, jitter=lambda: 1.0)
+
+
+def build_handler(api: FakeAPI, failures: list[httpx.Response | Exception]):  # noqa: ANN201
+    api.collections["taxes"] = [build_tax(0, T0)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v1/catalog") and failures:
+            api.requests.append(request)
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return api.handler(request)
+
+    return handler
+
+
+def test_get_delay() -> None:
+    policy = RetryPolicy(backoff=1, max_backoff=4, budget=10, jitter=lambda: 1.0)
+    unavailable = httpx.Response(503)
+
+    delays = [policy.get_delay("GET", attempt, 0, unavailable) for attempt in range(4)]
+
+    assert delays == [1, 2, 4, None]
+    assert policy.get_delay("GET", 0, 0) == 1
+    assert policy.get_delay("GET", 0, 9.5, unavailable) is None
+    assert policy.get_delay("GET", 0, 0, httpx.Response(404)) is None
+    assert policy.get_delay("POST", 0, 0, unavailable) is None
+
+
+def test_get_delay_retry_after() -> None:
+    policy = RetryPolicy(budget=10)
+    response = httpx.Response(429, headers={"Retry-After": "3"})
+    date_response = httpx.Response(
+        429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+
+    assert policy.get_delay("GET", 0, 0, response) == 3  # noqa: PLR2004
+    assert policy.get_delay("GET", 0, 8, response) is None
+    assert policy.get_delay("GET", 0, 0, date_response) == 0
+
+
+def test_retry() -> None:
+    api = FakeAPI()
+    failures: list[httpx.Response | Exception] = [
+        httpx.Response(503),
+        httpx.ConnectTimeout("timeout"),
+    ]
+    client = TactillClient(
+        api_key="key",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(build_handler(api, failures))
+        ),
+        retry=POLICY,
+    )
+
+    tax = client.taxes.get(TAX_ID)
+
+    assert tax.name == "TAX 0"
+    assert len(api.requests) == 3  # noqa: PLR2004
+
+
+def test_no_retry() -> None:
+    api = FakeAPI()
+    client = TactillClient(
+        api_key="key",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(
+                build_handler(api, [httpx.Response(503), httpx.Response(503)])
+            )
+        ),
+    )
+
+    with pytest.raises(TactillAPIError):
+        client.taxes.get(TAX_ID)
+    assert len(api.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retry() -> None:
+    api = FakeAPI()
+    failures: list[httpx.Response | Exception] = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.ReadError("reset"),
+        httpx.ReadError("reset"),
+        httpx.ReadError("reset"),
+    ]
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(build_handler(api, failures))
+        ),
+        retry=POLICY,
+    )
+
+    with pytest.raises(TactillError):
+        await client.taxes.get(TAX_ID)
+    # account + the first attempt and 3 retries
+    assert len(api.requests) == 5  # noqa: PLR2004
+
+    tax = await client.taxes.get(TAX_ID)
+    assert tax.name == "TAX 0"
@@ -0,0 +1,135 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from tactill import (
+    AsyncMovementFeed,
+    AsyncTactillClient,
+    Granularity,
+    MovementFeed,
+    MovementRollups,
+    RollupKey,
+    TactillClient,
+)
+from tactill.entities.movement import MovementType
+from tests.api import FakeAPI, build_movement
+
+# a Thursday, a Friday and the next Monday
+T0 = "2026-01-01T10:00:00.000Z"
+T1 = "2026-01-02T10:00:00.000Z"
+T2 = "2026-01-05T10:00:00.000Z"
+ARTICLE_ID = f"{0:024x}"
+OTHER_ARTICLE_ID = f"{1:024x}"
+WEEK = datetime.date(2025, 12, 29)
+NEXT_WEEK = datetime.date(2026, 1, 5)
+
+
+def build_line(
+    article_id: str,
+    category_name: str,
+    units: int,
+    done_on: str,
+) -> dict[str, object]:
+    return {
+        "article_id": article_id,
+        "article_name": "ARTICLE",
+        "category_name": category_name,
+        "state": "done",
+        "units": units,
+        "done_on": done_on,
+    }
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    api = FakeAPI()
+    api.collections["movements"] = [
+        build_movement(0, T0, movements=[build_line(ARTICLE_ID, "WINE", 10, T0)]),
+        build_movement(
+            1,
+            T0,
+            type="out",
+            movements=[
+                build_line(ARTICLE_ID, "WINE", 2, T0),
+                build_line(OTHER_ARTICLE_ID, "WINE", 1, T0),
+            ],
+        ),
+        build_movement(
+            2, T1, type="out", movements=[build_line(ARTICLE_ID, "WINE", 3, T1)]
+        ),
+        build_movement(
+            3, T2, type="out", movements=[build_line(ARTICLE_ID, "WINE", 4, T2)]
+        ),
+    ]
+    return api
+
+
+@pytest.fixture
+def rollups(tmp_path: Path) -> MovementRollups:
+    return MovementRollups(tmp_path / "rollups.sqlite3")
+
+
+def test_rollups(api: FakeAPI, rollups: MovementRollups) -> None:
+    client = TactillClient(api_key="key", http_client=api.build_client())
+
+    assert MovementFeed(client, rollups).refresh() == 4  # noqa: PLR2004
+
+    start = datetime.date(2026, 1, 1)
+    end = datetime.date(2026, 1, 6)
+    assert rollups.get_series(
+        RollupKey.ARTICLE, ARTICLE_ID, Granularity.DAY, start, end
+    ) == {start: 2, datetime.date(2026, 1, 2): 3, NEXT_WEEK: 4}
+    assert rollups.get_series(
+        RollupKey.CATEGORY, "WINE", Granularity.WEEK, start, end
+    ) == {WEEK: 6, NEXT_WEEK: 4}
+    assert rollups.get_series(
+        RollupKey.ARTICLE,
+        ARTICLE_ID,
+        Granularity.WEEK,
+        start,
+        end,
+        movement_type=MovementType.IN,
+    ) == {WEEK: 10}
+    assert rollups.get_bucket(RollupKey.ARTICLE, Granularity.WEEK, start) == {
+        ARTICLE_ID: 5,
+        OTHER_ARTICLE_ID: 1,
+    }
+
+
+def test_incremental_refresh(
+    api: FakeAPI,
+    rollups: MovementRollups,
+    tmp_path: Path,
+) -> None:
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    MovementFeed(client, rollups).refresh()
+    rollups.close()
+
+    movements = api.collections["movements"]
+    movements[1]["deprecated"] = True
+    movements[1]["updated_at"] = "2026-01-06T00:00:00.000Z"
+    movements[2]["movements"][0]["units"] = 5
+    movements[2]["updated_at"] = "2026-01-06T00:00:00.000Z"
+
+    # the lines and the watermark are persisted with the buckets
+    with MovementRollups(tmp_path / "rollups.sqlite3") as reopened:
+        feed = MovementFeed(client, reopened)
+        assert feed.refresh() == 2  # noqa: PLR2004
+        assert reopened.get_bucket(RollupKey.CATEGORY, Granularity.WEEK, WEEK) == {
+            "WINE": 5
+        }
+        assert feed.refresh() == 0
+
+
+@pytest.mark.asyncio
+async def test_async_refresh(api: FakeAPI, rollups: MovementRollups) -> None:
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=api.build_async_client(),
+    )
+
+    assert await AsyncMovementFeed(client, rollups).refresh() == 4  # noqa: PLR2004
+    assert rollups.get_bucket(RollupKey.CATEGORY, Granularity.DAY, NEXT_WEEK) == {
+        "WINE": 4
+    }
@@ -0,0 +1,112 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from tactill import Article, CatalogMirror, CatalogStore, TactillClient, Tax
+from tactill.entities.movement import Movement, MovementState
+from tactill.exceptions import TactillError
+from tests.api import (
+    FakeAPI,
+    build_article,
+    build_category,
+    build_document,
+    build_tax,
+)
+
+T0 = "2026-01-01T00:00:00.000Z"
+T1 = "2026-01-02T00:00:00.000Z"
+ARTICLES = 5
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CatalogStore:
+    return CatalogStore(tmp_path / "catalog.sqlite3")
+
+
+@pytest.fixture
+def articles() -> list[Article]:
+    return [Article.model_validate(build_article(i, T0)) for i in range(ARTICLES)]
+
+
+def test_save_and_load(store: CatalogStore, articles: list[Article]) -> None:
+    store.save(Article, articles)
+
+    assert store.load(Article) == articles
+    assert store.load(Tax) == []
+
+
+def test_find(store: CatalogStore, articles: list[Article]) -> None:
+    store.save(Article, articles)
+
+    assert store.find(Article, name="ARTICLE 2") == [articles[2]]
+    assert store.find(Article, category_id=f"{1:024x}") == [articles[1], articles[4]]
+    with pytest.raises(TactillError):
+        store.find(Article, taxes="unknown")
+
+
+def test_save_replaces_and_delete(
+    store: CatalogStore,
+    articles: list[Article],
+) -> None:
+    store.save(Article, articles)
+    renamed = articles[0].model_copy(update={"name": "RENAMED"})
+    store.save(Article, [renamed])
+    store.delete(Article, [articles[1].id])
+
+    assert store.load(Article) == [renamed, *articles[2:]]
+
+
+def test_movements(store: CatalogStore) -> None:
+    movement = Movement.model_validate(
+        build_document(
+            1,
+            T0,
+            number=1,
+            type="in",
+            state="done",
+            movements=[
+                {
+                    "article_id": f"{1:024x}",
+                    "article_name": "ARTICLE 1",
+                    "category_name": "CATEGORY 1",
+                    "state": "done",
+                    "units": 2,
+                    "done_on": T0,
+                }
+            ],
+        )
+    )
+    store.save(Movement, [movement])
+
+    assert store.find(Movement, state=MovementState.DONE) == [movement]
+
+
+def test_watermarks(store: CatalogStore) -> None:
+    watermark = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    store.set_watermark("articles", watermark)
+
+    assert store.get_watermarks() == {"articles": watermark}
+
+
+def test_mirror_cold_start(tmp_path: Path) -> None:
+    api = FakeAPI()
+    api.collections["articles"] = [build_article(i, T0) for i in range(ARTICLES)]
+    api.collections["categories"] = [build_category(0, T0)]
+    api.collections["taxes"] = [build_tax(0, T0)]
+    client = TactillClient(api_key="key", http_client=api.build_client())
+    with CatalogStore(tmp_path / "catalog.sqlite3") as store:
+        CatalogMirror(client, store=store).refresh()
+
+    api.collections["articles"][0] = build_article(0, T1, deprecated=True)
+    api.requests.clear()
+    with CatalogStore(tmp_path / "catalog.sqlite3") as store:
+        mirror = CatalogMirror(client, store=store)
+
+        assert mirror.load() == ARTICLES + 1 + 1
+        assert mirror.articles.get_by_name("ARTICLE 1")
+        assert mirror.refresh() == 1
+        assert len(store.load(Article)) == ARTICLES - 1
+
+    filters = [request.url.params["filter"] for request in api.requests]
+    assert all("updated_at[gte]" in filter_ for filter_ in filters)
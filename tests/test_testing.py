@@ -0,0 +1,138 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tactill import (
+    AsyncTactillClient,
+    FilterEntity,
+    FilterOperator,
+    RateLimits,
+    RetryPolicy,
+    TactillClient,
+)
+from tactill.exceptions import TactillAPIError
+from tactill.testing import FakeTactillServer, build_document
+
+
+def build_movement(index: int, created_at: str, units: int) -> dict[str, object]:
+    return build_document(
+        index,
+        created_at,
+        number=index,
+        type="in",
+        state="done",
+        movements=[
+            {
+                "article_id": f"{index % 2:024x}",
+                "article_name": f"ARTICLE {index % 2}",
+                "category_name": "CATEGORY",
+                "state": "done",
+                "units": units,
+                "done_on": created_at,
+            }
+        ],
+    )
+
+
+def build_server(latency: float = 0) -> FakeTactillServer:
+    movements = [
+        build_movement(index, f"2026-01-{index + 1:02d}T00:00:00.000Z", units=index)
+        for index in range(6)
+    ]
+    return FakeTactillServer({"movements": movements}, latency=latency)
+
+
+def test_filters_order_and_pagination() -> None:
+    server = build_server()
+    client = TactillClient(api_key="key", http_client=server.build_client())
+
+    movements = client.movements.get_all(
+        filters=[
+            FilterEntity(
+                field="created_at",
+                value="2026-01-02T00:00:00.000Z",
+                operator=FilterOperator.GTE,
+            ),
+            FilterEntity(
+                field="created_at",
+                value="2026-01-06T00:00:00.000Z",
+                operator=FilterOperator.LT,
+            ),
+            FilterEntity(
+                field="movements.article_id",
+                value=[f"{1:024x}"],
+                operator=FilterOperator.IN,
+            ),
+        ],
+        order="-number",
+    )
+    assert [movement.number for movement in movements] == [3, 1]
+
+    movements = client.movements.get_all(
+        filters=[FilterEntity(field="number", value=2, operator=FilterOperator.GT)],
+        limit=2,
+        skip=1,
+    )
+    assert [movement.number for movement in movements] == [4, 5]
+
+
+def test_invalid_requests() -> None:
+    server = build_server()
+    client = server.build_client()
+
+    response = client.get("https://api/v1/stock/movements?filter=number[like]=1")
+    assert response.status_code == httpx.codes.BAD_REQUEST
+    response = client.get(f"https://api/v1/stock/movements/{99:024x}")
+    assert response.status_code == httpx.codes.NOT_FOUND
+    response = client.get("https://api/v1/stock/unknown")
+    assert response.status_code == httpx.codes.NOT_FOUND
+
+
+def test_injected_errors() -> None:
+    server = build_server()
+    server.fail_next(httpx.Response(503), httpx.Response(500))
+    client = TactillClient(
+        api_key="key",
+        http_client=server.build_client(),
+        retry=RetryPolicy(backoff=0.001),
+    )
+
+    assert len(client.movements.get_all()) == 6  # noqa: PLR2004
+    assert server.status_codes == {503: 1, 500: 1, 200: 2}
+
+    server.error_rate = 1
+    with pytest.raises(TactillAPIError):
+        client.movements.get_all()
+
+
+def test_rate_limits() -> None:
+    server = build_server()
+    server.rate_limits = RateLimits(rate=100)
+    client = TactillClient(
+        api_key="key",
+        http_client=server.build_client(),
+        retry=RetryPolicy(max_retries=10),
+    )
+
+    for _ in range(3):
+        client.movements.get_all()
+
+    # the retries wait for the 'retry-after' delay
+    assert server.status_codes[429] > 0
+    assert server.status_codes[200] == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_latency_and_concurrency() -> None:
+    server = build_server(latency=0.01)
+    client = await AsyncTactillClient.create(
+        api_key="key",
+        http_client=server.build_async_client(),
+        max_concurrency=3,
+    )
+
+    await asyncio.gather(*(client.movements.get_all() for _ in range(10)))
+
+    assert server.max_in_flight == 3  # noqa: PLR2004
+    assert server.in_flight == 0